@@ -5,6 +5,7 @@ from .api import (
     get_ancestors,
     get_children,
     get_definition,
+    get_definitions,
     get_descendants,
     get_edges,
     get_edges_df,
@@ -16,6 +17,7 @@ from .api import (
     get_graph,
     get_graph_embeddings_df,
     get_hierarchy,
+    get_hierarchy_index,
     get_id_definition_mapping,
     get_id_multirelations_mapping,
     get_id_name_mapping,
@@ -33,12 +35,14 @@ from .api import (
     get_name,
     get_name_by_curie,
     get_name_id_mapping,
+    get_names,
     get_object_properties,
     get_object_properties_df,
     get_obsolete,
     get_primary_curie,
     get_primary_identifier,
     get_primary_reference,
+    get_primary_references,
     get_properties,
     get_properties_df,
     get_property,
@@ -47,28 +51,34 @@ from .api import (
     get_relation_mapping,
     get_relations_df,
     get_semantic_mappings,
+    get_similar_entities,
     get_species,
+    get_species_batch,
     get_sssom_df,
     get_subhierarchy,
     get_synonyms,
     get_text_embedding,
     get_text_embedding_similarity,
     get_text_embeddings_df,
+    get_text_embeddings_store,
     get_typedef_df,
     get_xref,
     get_xrefs,
     get_xrefs_df,
     has_ancestor,
     is_descendent,
+    search_text,
 )
 from .constants import get_semantic_mapping_metadata
 from .getters import get_ontology
 from .ner import (
+    clear_grounder_cache,
     get_grounder,
     get_scispacy_entities,
     get_scispacy_entity_linker,
     get_scispacy_knowledgebase,
     ground,
+    ground_many,
 )
 from .plugins import (
     has_nomenclature_plugin,
@@ -101,6 +111,7 @@ __all__ = [
     "Term",
     "TypeDef",
     "build_ontology",
+    "clear_grounder_cache",
     "default_reference",
     "ensure_path",
     "from_obo_path",
@@ -109,6 +120,7 @@ __all__ = [
     "get_ancestors",
     "get_children",
     "get_definition",
+    "get_definitions",
     "get_descendants",
     "get_edges",
     "get_edges_df",
@@ -121,6 +133,7 @@ __all__ = [
     "get_graph_embeddings_df",
     "get_grounder",
     "get_hierarchy",
+    "get_hierarchy_index",
     "get_id_definition_mapping",
     "get_id_multirelations_mapping",
     "get_id_name_mapping",
@@ -138,6 +151,7 @@ __all__ = [
     "get_name",
     "get_name_by_curie",
     "get_name_id_mapping",
+    "get_names",
     "get_object_properties",
     "get_object_properties_df",
     "get_obsolete",
@@ -145,6 +159,7 @@ __all__ = [
     "get_primary_curie",
     "get_primary_identifier",
     "get_primary_reference",
+    "get_primary_references",
     "get_properties",
     "get_properties_df",
     "get_property",
@@ -157,22 +172,27 @@ __all__ = [
     "get_scispacy_knowledgebase",
     "get_semantic_mapping_metadata",
     "get_semantic_mappings",
+    "get_similar_entities",
     "get_species",
+    "get_species_batch",
     "get_sssom_df",
     "get_subhierarchy",
     "get_synonyms",
     "get_text_embedding",
     "get_text_embedding_similarity",
     "get_text_embeddings_df",
+    "get_text_embeddings_store",
     "get_typedef_df",
     "get_version",
     "get_xref",
     "get_xrefs",
     "get_xrefs_df",
     "ground",
+    "ground_many",
     "has_ancestor",
     "has_nomenclature_plugin",
     "is_descendent",
     "iter_nomenclature_plugins",
     "run_nomenclature_plugin",
+    "search_text",
 ]
@@ -6,20 +6,25 @@ from .alts import (
     get_primary_curie,
     get_primary_identifier,
     get_primary_reference,
+    get_primary_references,
 )
 from .combine import get_literal_mappings_subset
 from .edges import get_edges, get_edges_df, get_graph
 from .embedding import (
     get_graph_embeddings_df,
+    get_similar_entities,
     get_text_embedding,
     get_text_embedding_similarity,
     get_text_embeddings_df,
+    get_text_embeddings_store,
+    search_text,
 )
 from .hierarchy import (
     get_ancestors,
     get_children,
     get_descendants,
     get_hierarchy,
+    get_hierarchy_index,
     get_subhierarchy,
     has_ancestor,
     is_descendent,
@@ -27,6 +32,7 @@ from .hierarchy import (
 from .metadata import get_metadata
 from .names import (
     get_definition,
+    get_definitions,
     get_id_definition_mapping,
     get_id_name_mapping,
     get_id_synonyms_mapping,
@@ -36,6 +42,7 @@ from .names import (
     get_name,
     get_name_by_curie,
     get_name_id_mapping,
+    get_names,
     get_obsolete,
     get_obsolete_references,
     get_references,
@@ -60,7 +67,7 @@ from .relations import (
     get_relation_mapping,
     get_relations_df,
 )
-from .species import get_id_species_mapping, get_species
+from .species import get_id_species_mapping, get_species, get_species_batch
 from .typedefs import get_typedef_df
 from .xrefs import (
     get_filtered_xrefs,
@@ -77,6 +84,7 @@ __all__ = [
     "get_ancestors",
     "get_children",
     "get_definition",
+    "get_definitions",
     "get_descendants",
     "get_edges",
     "get_edges_df",
@@ -89,6 +97,7 @@ __all__ = [
     "get_graph",
     "get_graph_embeddings_df",
     "get_hierarchy",
+    "get_hierarchy_index",
     "get_id_definition_mapping",
     "get_id_multirelations_mapping",
     "get_id_name_mapping",
@@ -106,6 +115,7 @@ __all__ = [
     "get_name",
     "get_name_by_curie",
     "get_name_id_mapping",
+    "get_names",
     "get_object_properties",
     "get_object_properties_df",
     "get_obsolete",
@@ -114,6 +124,7 @@ __all__ = [
     "get_primary_curie",
     "get_primary_identifier",
     "get_primary_reference",
+    "get_primary_references",
     "get_priority_curie",
     "get_properties",
     "get_properties_df",
@@ -123,13 +134,16 @@ __all__ = [
     "get_relation_mapping",
     "get_relations_df",
     "get_semantic_mappings",
+    "get_similar_entities",
     "get_species",
+    "get_species_batch",
     "get_sssom_df",
     "get_subhierarchy",
     "get_synonyms",
     "get_text_embedding",
     "get_text_embedding_similarity",
     "get_text_embeddings_df",
+    "get_text_embeddings_store",
     "get_typedef_df",
     "get_version",
     "get_xref",
@@ -137,4 +151,5 @@ __all__ = [
     "get_xrefs_df",
     "has_ancestor",
     "is_descendent",
+    "search_text",
 ]
@@ -4,10 +4,19 @@ import logging
 from collections.abc import Mapping
 from functools import lru_cache
 
+import pandas as pd
 from pydantic import ValidationError
 from typing_extensions import Unpack
 
-from .utils import SimpleReferenceHint, _get_pi, get_version_from_kwargs
+from .utils import (
+    ReferencesHint,
+    SimpleReferenceHint,
+    _align,
+    _get_pi,
+    _group_references,
+    _map_series,
+    get_version_from_kwargs,
+)
 from ..constants import GetOntologyKwargs, check_should_cache, check_should_force
 from ..getters import get_ontology
 from ..identifier_utils import Reference, wrap_norm_prefix
@@ -20,6 +29,7 @@ __all__ = [
     "get_primary_curie",
     "get_primary_identifier",
     "get_primary_reference",
+    "get_primary_references",
 ]
 
 logger = logging.getLogger(__name__)
@@ -76,6 +86,37 @@ def get_primary_reference(
     return Reference(prefix=primary_reference.prefix, identifier=primary_identifier)
 
 
+def get_primary_references(
+    references: ReferencesHint, /, **kwargs: Unpack[GetOntologyKwargs]
+) -> list[Reference | None] | pd.Series:
+    """Get the primary references for many entities.
+
+    :param references: An iterable or :class:`pandas.Series` of CURIEs or references
+    :returns: A list of primary references aligned with the input, or a series with the
+        same index if a series was given. Entries are None for strings that aren't
+        CURIEs or have unregistered prefixes.
+
+    This groups the references by prefix, so the alternative identifier mapping for each
+    prefix is only loaded once.
+    """
+    n, groups = _group_references(references)
+    rv: list[Reference | None] = [None] * n
+    for prefix, (positions, identifiers) in groups.items():
+        primary_identifiers = _get_primary_identifiers(prefix, pd.Series(identifiers), **kwargs)
+        # construct each reference once, since the same entities are often repeated
+        cache: dict[str, Reference | None] = {}
+        for position, identifier in zip(positions, primary_identifiers.tolist(), strict=True):
+            if identifier not in cache:
+                try:
+                    cache[identifier] = Reference(prefix=prefix, identifier=identifier)
+                except (ValueError, ValidationError):
+                    if kwargs.get("strict"):
+                        raise
+                    cache[identifier] = None
+            rv[position] = cache[identifier]
+    return _align(references, rv)
+
+
 def get_primary_curie(
     reference: SimpleReferenceHint, /, **kwargs: Unpack[GetOntologyKwargs]
 ) -> str | None:
@@ -103,3 +144,15 @@ def get_primary_identifier(
         return reference.identifier
     alts_to_id = get_alts_to_id(reference.prefix, **kwargs)
     return alts_to_id.get(reference.identifier, reference.identifier)
+
+
+def _get_primary_identifiers(
+    prefix: str, identifiers: pd.Series, **kwargs: Unpack[GetOntologyKwargs]
+) -> pd.Series:
+    """Get the primary identifiers for a series of identifiers with a normalized prefix."""
+    if prefix in NO_ALTS:
+        return identifiers
+    alts_to_id = get_alts_to_id(prefix, **kwargs)
+    if not alts_to_id:
+        return identifiers
+    return _map_series(identifiers, alts_to_id).fillna(identifiers)
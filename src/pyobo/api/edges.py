@@ -15,6 +15,7 @@ from pyobo.constants import (
 )
 from pyobo.getters import get_ontology
 
+from ..identifier_utils import get_reference_pool
 from ..struct import Reference
 from ..utils.cache import cached_df
 from ..utils.path import CacheArtifact, get_cache_path
@@ -56,8 +57,10 @@ def get_edges(
 ) -> list[tuple[Reference, Reference, Reference]]:
     """Get a list of edge triples."""
     df = get_edges_df(prefix, **kwargs)
+    # predicates and many objects repeat, so share them through the pool
+    pool = get_reference_pool()
     return [
-        (Reference.from_curie(s), Reference.from_curie(p), Reference.from_curie(o))
+        (pool.from_curie(s), pool.from_curie(p), pool.from_curie(o))
         for s, p, o in tqdm(
             df.values,
             desc=f"[{prefix}] parsing edges",
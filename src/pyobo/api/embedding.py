@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import logging
 import tempfile
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -15,10 +18,24 @@ from tqdm import tqdm
 from typing_extensions import Unpack
 
 from pyobo.api.edges import get_edges_df
-from pyobo.api.names import get_definition, get_id_name_mapping, get_name
-from pyobo.api.utils import get_version_from_kwargs
+from pyobo.api.names import (
+    get_definition,
+    get_id_definition_mapping,
+    get_id_name_mapping,
+    get_name,
+)
+from pyobo.api.utils import _get_pi, get_version_from_kwargs
 from pyobo.constants import GetOntologyKwargs, check_should_force
 from pyobo.identifier_utils import wrap_norm_prefix
+from pyobo.struct import Reference
+from pyobo.utils.embedding_store import (
+    EMBEDDING_DTYPE,
+    EmbeddingStore,
+    hash_texts,
+    read_text_hashes,
+    search_stores,
+    write_text_hashes,
+)
 from pyobo.utils.path import CacheArtifact, get_cache_path
 
 if TYPE_CHECKING:
@@ -26,11 +43,16 @@ if TYPE_CHECKING:
 
 __all__ = [
     "get_graph_embeddings_df",
+    "get_similar_entities",
     "get_text_embedding",
     "get_text_embedding_similarity",
     "get_text_embeddings_df",
+    "get_text_embeddings_store",
+    "search_text",
 ]
 
+logger = logging.getLogger(__name__)
+
 
 def _get_text(
     reference: str | curies.Reference | curies.ReferenceTuple,
@@ -85,7 +107,7 @@ def get_graph_embeddings_df(
         edges_df = get_edges_df(prefix, **kwargs)
         with tempfile.TemporaryDirectory() as d:
             path = Path(d).joinpath("test.tsv")
-            edges_df[[":START_ID", ":END_ID"]].to_csv(path, header=None, sep="\t", index=False)
+            edges_df[[":START_ID", ":END_ID"]].to_csv(path, header=False, sep="\t", index=False)
             graph = Graph.from_csv(
                 edge_path=str(path),
                 edge_list_separator="\t",
@@ -116,6 +138,9 @@ def get_graph_embeddings_df(
 
 EMBEDDING_INDEX_NAME = "luid"
 EMBEDDING_DIMENSIONALITY = 384
+#: The default number of texts encoded at once, which is the same as
+#: :meth:`sentence_transformers.SentenceTransformer.encode`
+EMBEDDING_BATCH_SIZE = 32
 
 
 @wrap_norm_prefix
@@ -123,6 +148,9 @@ def get_text_embeddings_df(
     prefix: str,
     *,
     model: sentence_transformers.SentenceTransformer | None = None,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    device: str | None = None,
+    chunk_size: int | None = None,
     **kwargs: Unpack[GetOntologyKwargs],
 ) -> pd.DataFrame:
     """Get embeddings for all entities in the resource.
@@ -130,58 +158,280 @@ def get_text_embeddings_df(
     :param prefix: A reference, either as a string or Reference object
     :param model: A sentence transformer model. Defaults to ``all-MiniLM-L6-v2`` if not
         given.
+    :param batch_size: The number of texts to encode at once
+    :param device: The device on which the model is run, e.g., ``cuda``. Defaults to
+        the model's device.
+    :param chunk_size: If given, texts are encoded in chunks of this size and
+        written directly to the cache, so all embeddings never have to be in memory
+        at the same time while they're being computed
     :param kwargs: The keyword arguments to forward to ontology getter functions for
         names, definitions, and version
 
     :returns: A pandas dataframe with an index representing local unique identifiers and
         columns for the values of the model returned vectors
     """
-    path = get_cache_path(
-        prefix, CacheArtifact.embeddings, version=get_version_from_kwargs(prefix, kwargs)
+    store = get_text_embeddings_store(
+        prefix, model=model, batch_size=batch_size, device=device, chunk_size=chunk_size, **kwargs
     )
-    if path.is_file() and not check_should_force(kwargs):
-        # make an explicit dictionary so we make sure that the index column
-        # doesn't also get interpreted as a float. This would silently be an
-        # issue for any identifier space that has number-looking identifier patterns
-        dtype: dict[str, Any] = {str(i): float for i in range(EMBEDDING_DIMENSIONALITY)}
-        dtype[EMBEDDING_INDEX_NAME] = str
-        df = pd.read_csv(path, sep="\t", dtype=dtype, index_col=0)
-        if df.index.name != EMBEDDING_INDEX_NAME:
-            df.index.name = EMBEDDING_INDEX_NAME
-        df.index = df.index.astype(str)
-        return df
-
-    id_to_name = get_id_name_mapping(prefix, **kwargs)
-
-    luids, texts = [], []
-    for identifier, name in tqdm(id_to_name.items(), desc=f"[{prefix}] constructing text"):
-        text = _get_text(curies.ReferenceTuple(prefix, identifier), name=name, **kwargs)
-        if text is None:
-            continue
-        luids.append(identifier)
-        texts.append(text)
+    return store.to_df(EMBEDDING_INDEX_NAME)
+
+
+@wrap_norm_prefix
+def get_text_embeddings_store(
+    prefix: str,
+    *,
+    model: sentence_transformers.SentenceTransformer | None = None,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    device: str | None = None,
+    chunk_size: int | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> EmbeddingStore:
+    """Get a store of embeddings for all entities in the resource.
+
+    :param prefix: A reference, either as a string or Reference object
+    :param model: A sentence transformer model. Defaults to ``all-MiniLM-L6-v2`` if not
+        given.
+    :param batch_size: The number of texts to encode at once
+    :param device: The device on which the model is run, e.g., ``cuda``. Defaults to
+        the model's device.
+    :param chunk_size: If given, texts are encoded in chunks of this size and
+        written directly to the cache, so all embeddings never have to be in memory
+        at the same time while they're being computed
+    :param kwargs: The keyword arguments to forward to ontology getter functions for
+        names, definitions, and version
+
+    :returns: An embedding store, which is cached as a binary matrix and a list of local
+        unique identifiers. When loaded from the cache, the matrix is memory-mapped.
+        Caches from older versions of PyOBO that are stored as TSV are migrated
+        automatically, and the TSV files are left in place.
+
+    When embeddings are computed, a hash of the model and the text for each entity is
+    cached alongside them. If another version of the resource has already been
+    embedded, the embeddings for entities whose text hasn't changed are copied from
+    it, so only new and changed texts are encoded.
+    """
+    version = get_version_from_kwargs(prefix, kwargs)
+    matrix_path, identifiers_path = _get_embedding_store_paths(prefix, version)
+    if not check_should_force(kwargs):
+        if matrix_path.is_file() and identifiers_path.is_file():
+            return EmbeddingStore.load(matrix_path, identifiers_path)
+        legacy_path = get_cache_path(prefix, CacheArtifact.embeddings, version=version)
+        if legacy_path.is_file():
+            logger.info("[%s] migrating embeddings cache from %s", prefix, legacy_path)
+            store = EmbeddingStore.from_df(_read_legacy_embeddings_df(legacy_path))
+            store.save(matrix_path, identifiers_path)
+            # the legacy cache is kept, since older versions of PyOBO might still use it
+            return EmbeddingStore.load(matrix_path, identifiers_path)
+
+    luids, texts = _get_texts(prefix, **kwargs)
     if model is None:
         model = get_sentence_transformer()
-    res = model.encode(texts, show_progress_bar=True)
-    df = pd.DataFrame(res, index=luids)
-    df.index.name = EMBEDDING_INDEX_NAME
-    df.to_csv(path, sep="\t")  # index is important here!
+    dimension = model.get_sentence_embedding_dimension() or EMBEDDING_DIMENSIONALITY
+
+    model_key = _get_model_key(model, dimension)
+    hashes_path = get_cache_path(prefix, CacheArtifact.embedding_hashes, version=version)
+    if model_key is None:
+        hashes = None
+        previous = None
+        hashes_path.unlink(missing_ok=True)
+    else:
+        hashes = hash_texts(model_key, texts)
+        previous = _get_previous_embeddings(prefix, version)
+
+    if chunk_size is None:
+        res = _encode(texts, hashes, previous, model, dimension, batch_size, device, True)
+        store = EmbeddingStore.from_rows(luids, res, dimension=dimension)
+        store.save(matrix_path, identifiers_path)
+    else:
+        chunks = (
+            _encode(
+                texts[start : start + chunk_size],
+                hashes and hashes[start : start + chunk_size],
+                previous,
+                model,
+                dimension,
+                batch_size,
+                device,
+                False,
+            )
+            for start in tqdm(
+                range(0, len(texts), chunk_size), unit="chunk", desc=f"[{prefix}] encoding text"
+            )
+        )
+        store = EmbeddingStore.write_chunks(
+            matrix_path, identifiers_path, luids, chunks, dimension=dimension
+        )
+    if hashes is not None:
+        write_text_hashes(hashes_path, hashes)
+    return store
+
+
+def _get_model_key(model: sentence_transformers.SentenceTransformer, dimension: int) -> str | None:
+    """Get a string identifying the model, or none if it can't be identified."""
+    model_card_data = getattr(model, "model_card_data", None)
+    name = getattr(model_card_data, "base_model", None) or getattr(
+        model_card_data, "model_id", None
+    )
+    if not name:
+        return None
+    return f"{name}:{dimension}"
+
+
+#: Previously cached embeddings and a dictionary from text hashes to rows
+PreviousEmbeddings = tuple[EmbeddingStore, dict[str, int]]
+
+
+def _get_previous_embeddings(prefix: str, version: str | None) -> PreviousEmbeddings | None:
+    """Get the most recently cached embeddings with text hashes from another version."""
+    if version is None:
+        return None
+    hashes_path = get_cache_path(prefix, CacheArtifact.embedding_hashes, version=version)
+    parts = hashes_path.parts
+    if version not in parts:
+        return None
+    # the version is a directory somewhere in the path, so other
+    # versions' caches can be found by replacing it with a wildcard
+    index = len(parts) - 1 - parts[::-1].index(version)
+    root, rest = Path(*parts[:index]), Path(*parts[index + 1 :])
+    candidates = sorted(
+        (path for path in root.glob(f"*/{rest.as_posix()}") if path != hashes_path),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for candidate in candidates:
+        matrix_path = candidate.with_name(CacheArtifact.embeddings_matrix.value)
+        identifiers_path = candidate.with_name(CacheArtifact.embedding_identifiers.value)
+        if not matrix_path.is_file() or not identifiers_path.is_file():
+            continue
+        store = EmbeddingStore.load(matrix_path, identifiers_path)
+        hashes = read_text_hashes(candidate)
+        if len(hashes) != len(store):
+            logger.warning("[%s] skipping embeddings with misaligned hashes: %s", prefix, candidate)
+            continue
+        logger.info("[%s] reusing unchanged embeddings from %s", prefix, candidate.parent)
+        return store, {text_hash: i for i, text_hash in enumerate(hashes)}
+    return None
+
+
+def _encode(
+    texts: list[str],
+    hashes: list[str] | None,
+    previous: PreviousEmbeddings | None,
+    model: sentence_transformers.SentenceTransformer,
+    dimension: int,
+    batch_size: int,
+    device: str | None,
+    show_progress_bar: bool,
+) -> np.ndarray:
+    """Encode texts, copying embeddings for texts whose hashes appear in a previous cache."""
+    rv = np.empty((len(texts), dimension), dtype=EMBEDDING_DTYPE)
+    missing: list[int] = []
+    targets: list[int] = []
+    sources: list[int] = []
+    if hashes is None or previous is None:
+        missing.extend(range(len(texts)))
+    else:
+        previous_store, previous_positions = previous
+        for i, text_hash in enumerate(hashes):
+            source = previous_positions.get(text_hash)
+            if source is None:
+                missing.append(i)
+            else:
+                targets.append(i)
+                sources.append(source)
+        if sources:
+            rv[targets] = previous_store.matrix[sources]
+            logger.debug("reused %d/%d embeddings", len(sources), len(texts))
+    if missing:
+        rv[missing] = model.encode(
+            [texts[i] for i in missing],
+            batch_size=batch_size,
+            device=device,
+            show_progress_bar=show_progress_bar,
+        )
+    return rv
+
+
+def _get_texts(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> tuple[list[str], list[str]]:
+    """Get the local unique identifiers and texts for all named entities in the resource.
+
+    The text for each entity is its name, followed by its definition, if available.
+    """
+    names = pd.Series(get_id_name_mapping(prefix, **kwargs), dtype=str)
+    if names.empty:
+        return [], []
+    definitions = pd.Series(get_id_definition_mapping(prefix, **kwargs), dtype=str).reindex(
+        names.index
+    )
+    has_definition = definitions.notna() & (definitions != "")
+    texts = names.where(~has_definition, names + " " + definitions)
+    return names.index.tolist(), texts.tolist()
+
+
+def _get_embedding_store_paths(prefix: str, version: str | None) -> tuple[Path, Path]:
+    return (
+        get_cache_path(prefix, CacheArtifact.embeddings_matrix, version=version),
+        get_cache_path(prefix, CacheArtifact.embedding_identifiers, version=version),
+    )
+
+
+def _read_legacy_embeddings_df(path: Path) -> pd.DataFrame:
+    # make an explicit dictionary so we make sure that the index column
+    # doesn't also get interpreted as a float. This would silently be an
+    # issue for any identifier space that has number-looking identifier patterns
+    dtype: dict[str, Any] = {str(i): float for i in range(EMBEDDING_DIMENSIONALITY)}
+    dtype[EMBEDDING_INDEX_NAME] = str
+    df = pd.read_csv(path, sep="\t", dtype=dtype, index_col=0)
+    df.index = df.index.astype(str)
     return df
 
 
+def _get_cached_embedding_store(
+    prefix: str, version: str | None, *, normalized: bool = False
+) -> EmbeddingStore | None:
+    """Get the embedding store for the resource, if it has already been cached."""
+    matrix_path, identifiers_path = _get_embedding_store_paths(prefix, version)
+    try:
+        mtime_ns = matrix_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if not identifiers_path.is_file():
+        return None
+    return _load_embedding_store(matrix_path, identifiers_path, mtime_ns, normalized)
+
+
+@lru_cache(maxsize=8)
+def _load_embedding_store(
+    matrix_path: Path, identifiers_path: Path, mtime_ns: int, normalized: bool = False
+) -> EmbeddingStore:
+    # the modification time is part of the cache key, so a
+    # rebuilt store doesn't get shadowed by an outdated one
+    store = EmbeddingStore.load(matrix_path, identifiers_path)
+    if normalized:
+        store = store.normalize()
+    return store
+
+
 def get_text_embedding(
     reference: str | curies.Reference | curies.ReferenceTuple,
     *,
     model: sentence_transformers.SentenceTransformer | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
 ) -> np.ndarray[tuple[int], np.dtype[np.float64]] | None:
     """Get a text embedding for an entity, or return none if no text is available.
 
     :param reference: A reference, either as a string or Reference object
     :param model: A sentence transformer model. Defaults to ``all-MiniLM-L6-v2`` if not
         given.
+    :param kwargs: The keyword arguments to forward to ontology getter functions for
+        names, definitions, and version
 
     :returns: A 1D numpy float array of embeddings from :class:`sentence_transformers`
 
+    If no model is given and the embeddings for the entity's resource have already
+    been cached by :func:`get_text_embeddings_df`, the embedding is read from the cache
+    without loading the whole matrix into memory.
+
     .. code-block:: python
 
         import pyobo
@@ -200,7 +450,14 @@ def get_text_embedding(
         embedding = pyobo.get_text_embedding("GO:0000001", model=model)
         # [-5.68335280e-02  7.96175096e-03 -3.36112119e-02  2.34440481e-03 ... ]
     """
-    text = _get_text(reference)
+    if model is None and not check_should_force(kwargs):
+        reference = _get_pi(reference)
+        version = get_version_from_kwargs(reference.prefix, kwargs)
+        store = _get_cached_embedding_store(reference.prefix, version)
+        if store is not None and (vector := store.get(reference.identifier)) is not None:
+            return cast(np.ndarray[tuple[int], np.dtype[np.float64]], vector)
+
+    text = _get_text(reference, **kwargs)
     if text is None:
         return None
     if model is None:
@@ -250,3 +507,114 @@ def get_text_embedding_similarity(
     if e1 is None or e2 is None:
         return None
     return cast(float, model.similarity(e1, e2)[0][0].item())
+
+
+def get_similar_entities(
+    reference: str | curies.Reference | curies.ReferenceTuple,
+    k: int = 10,
+    *,
+    prefixes: str | Iterable[str] | None = None,
+    model: sentence_transformers.SentenceTransformer | None = None,
+    normalized: bool = False,
+    chunk_size: int | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> list[tuple[Reference, float]]:
+    """Get the entities whose text embeddings are most similar to the given entity's.
+
+    :param reference: A reference, either as a string or Reference object
+    :param k: The number of similar entities to return
+    :param prefixes: The prefixes of the resources to search. Defaults to the prefix
+        of the reference.
+    :param model: A sentence transformer model. Defaults to ``all-MiniLM-L6-v2`` if not
+        given.
+    :param normalized: Should a copy of each resource's embedding matrix be normalized
+        and kept in memory? This makes repeated searches faster at the cost of memory.
+    :param chunk_size: The number of rows to score at once
+    :param kwargs: The keyword arguments to forward to ontology getter functions for
+        names, definitions, and version
+
+    :returns: Pairs of references and cosine similarities, sorted in descending order by
+        similarity. The query entity is not included.
+
+    .. code-block:: python
+
+        import pyobo
+
+        for reference, similarity in pyobo.get_similar_entities("GO:0000001", k=5):
+            print(reference.curie, similarity)
+    """
+    reference = _get_pi(reference)
+    vector = get_text_embedding(reference, model=model, **kwargs)
+    if vector is None:
+        return []
+    if prefixes is None:
+        prefixes = [reference.prefix]
+    # get one more than requested, in case the reference itself is included
+    rv = _search(vector, prefixes, k + 1, model, normalized, chunk_size, kwargs)
+    return [pair for pair in rv if pair[0] != reference][:k]
+
+
+def search_text(
+    query: str,
+    prefixes: str | Iterable[str],
+    k: int = 10,
+    *,
+    model: sentence_transformers.SentenceTransformer | None = None,
+    normalized: bool = False,
+    chunk_size: int | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> list[tuple[Reference, float]]:
+    """Get the entities whose text embeddings are most similar to the given text.
+
+    :param query: The text to search
+    :param prefixes: The prefixes of the resources to search
+    :param k: The number of similar entities to return
+    :param model: A sentence transformer model. Defaults to ``all-MiniLM-L6-v2`` if not
+        given. This should be the same model that was used to cache the embeddings.
+    :param normalized: Should a copy of each resource's embedding matrix be normalized
+        and kept in memory? This makes repeated searches faster at the cost of memory.
+    :param chunk_size: The number of rows to score at once
+    :param kwargs: The keyword arguments to forward to ontology getter functions for
+        names, definitions, and version
+
+    :returns: Pairs of references and cosine similarities, sorted in descending order by
+        similarity
+
+    .. code-block:: python
+
+        import pyobo
+
+        for reference, similarity in pyobo.search_text("apoptosis", ["go", "mesh"], k=5):
+            print(reference.curie, similarity)
+    """
+    if model is None:
+        model = get_sentence_transformer()
+    vector = model.encode([query])[0]
+    return _search(vector, prefixes, k, model, normalized, chunk_size, kwargs)
+
+
+def _search(
+    vector: np.ndarray,
+    prefixes: str | Iterable[str],
+    k: int,
+    model: sentence_transformers.SentenceTransformer | None,
+    normalized: bool,
+    chunk_size: int | None,
+    kwargs: GetOntologyKwargs,
+) -> list[tuple[Reference, float]]:
+    if isinstance(prefixes, str):
+        prefixes = [prefixes]
+    stores = {}
+    for prefix in prefixes:
+        prefix = bioregistry.normalize_prefix(prefix, strict=True)
+        version = get_version_from_kwargs(prefix, kwargs)
+        store = _get_cached_embedding_store(prefix, version, normalized=normalized)
+        if store is None or check_should_force(kwargs):
+            store = get_text_embeddings_store(prefix, model=model, **kwargs)
+            if normalized:
+                store = store.normalize()
+        stores[prefix] = store
+    return [
+        (Reference(prefix=prefix, identifier=identifier), score)
+        for prefix, identifier, score in search_stores(stores, vector, k, chunk_size=chunk_size)
+    ]
@@ -6,25 +6,29 @@ import logging
 import warnings
 from collections.abc import Iterable
 from functools import lru_cache
-from typing import Literal, NotRequired, cast
+from typing import Literal, NotRequired
 
 import networkx as nx
+from pystow.cache import Cached
 from typing_extensions import Unpack
 
-from .edges import get_edges
+from .edges import get_edges_df
 from .names import get_name, get_references
 from .properties import get_literal_properties
-from .utils import SimpleReferenceHint, _get_pi
-from ..constants import GetOntologyKwargs
+from .utils import SimpleReferenceHint, _get_pi, get_version_from_kwargs
+from ..constants import GetOntologyKwargs, check_should_cache, check_should_force
 from ..identifier_utils import Reference
 from ..struct import has_member, has_part, is_a, member_of, part_of
 from ..struct.struct_utils import ReferenceHint, _ensure_ref
+from ..utils.hierarchy_index import HierarchyArrays, HierarchyIndex
+from ..utils.path import CacheArtifact, get_cache_path
 
 __all__ = [
     "get_ancestors",
     "get_children",
     "get_descendants",
     "get_hierarchy",
+    "get_hierarchy_index",
     "get_subhierarchy",
     "has_ancestor",
     "is_descendent",
@@ -74,6 +78,90 @@ def get_hierarchy(
     )
 
 
+def get_hierarchy_index(
+    prefix: str,
+    *,
+    extra_relations: Iterable[ReferenceHint] | None = None,
+    **kwargs: Unpack[HierarchyKwargs],
+) -> HierarchyIndex:
+    """Get a compact index over the hierarchy for fast reachability queries.
+
+    :param prefix: The name of the namespace.
+    :param extra_relations: Other relations that you want to include in the hierarchy.
+    :param kwargs: Keyword arguments for :func:`get_hierarchy`
+
+    :returns: An index over the same nodes and edges as :func:`get_hierarchy`
+
+    The index can be used to make many queries in batch, e.g., to check which pairs
+    of references have an ancestor relationship:
+
+    .. code-block:: python
+
+        import pyobo
+
+        index = pyobo.get_hierarchy_index("go")
+        mask = index.has_ancestor_ids(index.encode(descendants), index.encode(ancestors))
+    """
+    return _get_hierarchy_index_helper(
+        prefix=prefix,
+        extra_relations=_tp(prefix, extra_relations),
+        **kwargs,
+    )
+
+
+@lru_cache
+def _get_hierarchy_index_helper(
+    prefix: str,
+    *,
+    extra_relations: tuple[Reference, ...],
+    include_part_of: bool = False,
+    include_has_member: bool = False,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> HierarchyIndex:
+    predicates, reverse_predicates = _get_predicate_sets(
+        extra_relations, include_part_of=include_part_of, include_has_member=include_has_member
+    )
+    arrays = _get_hierarchy_arrays(prefix, **kwargs)
+    return arrays.get_index({p.curie for p in predicates}, {p.curie for p in reverse_predicates})
+
+
+class CachedHierarchyArrays(Cached[HierarchyArrays]):
+    """Make a function lazily cache its hierarchy arrays as a NumPy archive."""
+
+    def load(self) -> HierarchyArrays:
+        """Load the hierarchy arrays from the cache."""
+        return HierarchyArrays.load(self.path)
+
+    def dump(self, rv: HierarchyArrays) -> None:
+        """Dump the hierarchy arrays to the cache."""
+        rv.save(self.path)
+
+
+def _get_hierarchy_arrays(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> HierarchyArrays:
+    """Get the references and edges of an ontology as compact arrays.
+
+    :param prefix: The name of the namespace.
+    :returns: The hierarchy arrays, which are cached as :data:`CacheArtifact.hierarchy`
+        the first time they are built for a given version of the ontology
+    """
+    version = get_version_from_kwargs(prefix, kwargs)
+    path = get_cache_path(prefix, CacheArtifact.hierarchy, version=version)
+
+    @CachedHierarchyArrays(
+        path=path,
+        force=check_should_force(kwargs),
+        cache=check_should_cache(kwargs),
+    )
+    def _get_arrays() -> HierarchyArrays:
+        references = sorted(get_references(prefix, **kwargs))
+        return HierarchyArrays.from_edges(
+            (reference.curie for reference in references),
+            get_edges_df(prefix, **kwargs).values,
+        )
+
+    return _get_arrays()
+
+
 def _tp(prefix: str, references: Iterable[ReferenceHint] | None) -> tuple[Reference, ...]:
     return tuple(
         sorted(_ensure_ref(reference, ontology_prefix=prefix) for reference in references or [])
@@ -94,19 +182,25 @@ def _get_hierarchy_helper(
         extra_relations, include_part_of=include_part_of, include_has_member=include_has_member
     )
 
+    arrays = _get_hierarchy_arrays(prefix, **kwargs)
+    nodes = arrays.get_references()
+    relations = [Reference.from_curie(curie) for curie in arrays.predicates]
+
     rv = nx.DiGraph()
-    rv.add_nodes_from(get_references(prefix, **kwargs))
+    rv.add_nodes_from(nodes[: arrays.n_references])
 
-    for s, p, o in get_edges(prefix, **kwargs):
-        if p in predicates:
-            rv.add_edge(s, o, relation=p)
-        elif p in reverse_predicates:
-            rv.add_edge(o, s, relation=p)
+    sources, targets, predicate_ids = arrays.select(
+        {p.curie for p in predicates}, {p.curie for p in reverse_predicates}
+    )
+    for s, o, p in zip(sources.tolist(), targets.tolist(), predicate_ids.tolist(), strict=True):
+        rv.add_edge(nodes[s], nodes[o], relation=relations[p])
 
-    properties_ = set(properties)
-    for s, p, op in get_literal_properties(prefix, **kwargs):
-        if s in rv and p in properties_:
-            rv.nodes[s][p] = op.value
+    # only load properties when they're requested, since parsing them is slow
+    if properties:
+        properties_ = set(properties)
+        for s, p, op in get_literal_properties(prefix, **kwargs):
+            if s in rv and p in properties_:
+                rv.nodes[s][p] = op.value
 
     return rv
 
@@ -136,28 +230,20 @@ def is_descendent(
     return has_ancestor(reference, ancestor, direction="down", **kwargs)
 
 
-@lru_cache
 def get_descendants(
     reference: SimpleReferenceHint, /, **kwargs: Unpack[HierarchyKwargs]
 ) -> set[Reference] | None:
     """Get all the descendants (children) of the term as CURIEs."""
     reference = _get_pi(reference)
-    hierarchy = get_hierarchy(prefix=reference.prefix, **kwargs)
-    if reference not in hierarchy:
-        return None
-    return cast(set[Reference], nx.ancestors(hierarchy, reference))  # note this is backwards
+    return get_hierarchy_index(prefix=reference.prefix, **kwargs).get_descendants(reference)
 
 
-@lru_cache
 def get_children(
     reference: SimpleReferenceHint, /, **kwargs: Unpack[HierarchyKwargs]
 ) -> set[Reference] | None:
     """Get all the descendants (children) of the term as CURIEs."""
     reference = _get_pi(reference)
-    hierarchy = get_hierarchy(prefix=reference.prefix, **kwargs)
-    if reference not in hierarchy:
-        return None
-    return set(hierarchy.predecessors(reference))
+    return get_hierarchy_index(prefix=reference.prefix, **kwargs).get_children(reference)
 
 
 def has_ancestor(
@@ -193,24 +279,18 @@ def has_ancestor(
     """
     reference = _get_pi(reference)
     ancestor = _get_pi(ancestor)
-    if direction == "up":
-        ancestors = get_ancestors(reference, **kwargs)
-        return ancestors is not None and ancestor in ancestors
-    else:
-        descendants = get_descendants(ancestor, **kwargs)
-        return descendants is not None and reference in descendants
+    # the reachability index answers both directions in the same way
+    # but the prefix of the hierarchy depends on the direction
+    prefix = reference.prefix if direction == "up" else ancestor.prefix
+    return get_hierarchy_index(prefix=prefix, **kwargs).has_ancestor(reference, ancestor)
 
 
-@lru_cache
 def get_ancestors(
     reference: SimpleReferenceHint, /, **kwargs: Unpack[HierarchyKwargs]
 ) -> set[Reference] | None:
     """Get all the ancestors (parents) of the term as CURIEs."""
     reference = _get_pi(reference)
-    hierarchy = get_hierarchy(prefix=reference.prefix, **kwargs)
-    if reference not in hierarchy:
-        return None
-    return cast(set[Reference], nx.descendants(hierarchy, reference))  # note this is backwards
+    return get_hierarchy_index(prefix=reference.prefix, **kwargs).get_ancestors(reference)
 
 
 def get_subhierarchy(
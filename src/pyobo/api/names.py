@@ -15,8 +15,16 @@ from pystow.cache import Cached
 from ssslm import LiteralMapping
 from typing_extensions import Unpack
 
-from .alts import get_primary_identifier
-from .utils import SimpleReferenceHint, _get_pi, get_version_from_kwargs
+from .alts import _get_primary_identifiers, get_primary_identifier
+from .utils import (
+    ReferencesHint,
+    SimpleReferenceHint,
+    _align,
+    _get_pi,
+    _group_references,
+    _map_series,
+    get_version_from_kwargs,
+)
 from ..constants import (
     GetOntologyKwargs,
     check_should_cache,
@@ -31,6 +39,7 @@ from ..utils.path import CacheArtifact, get_cache_path
 
 __all__ = [
     "get_definition",
+    "get_definitions",
     "get_id_definition_mapping",
     "get_id_name_mapping",
     "get_id_synonyms_mapping",
@@ -40,6 +49,7 @@ __all__ = [
     "get_name",
     "get_name_by_curie",
     "get_name_id_mapping",
+    "get_names",
     "get_obsolete",
     "get_obsolete_references",
     "get_references",
@@ -75,25 +85,8 @@ def _help_get(
     """Get the result for an entity based on a mapping maker function ``f``."""
     reference = _get_pi(reference)
 
-    try:
-        mapping = f(reference.prefix, **kwargs)
-    except NoBuildError:
-        if reference.prefix not in NO_BUILD_PREFIXES:
-            logger.warning("[%s] unable to look up results with %s", reference.prefix, f)
-            NO_BUILD_PREFIXES.add(reference.prefix)
-        return None
-    except ValueError as e:
-        if reference.prefix not in NO_BUILD_PREFIXES:
-            logger.warning(
-                "[%s] value error while looking up results with %s: %s", reference.prefix, f, e
-            )
-            NO_BUILD_PREFIXES.add(reference.prefix)
-        return None
-
-    if not mapping:
-        if reference.prefix not in NO_BUILD_PREFIXES:
-            logger.warning("[%s] no results produced with %s", reference.prefix, f)
-            NO_BUILD_PREFIXES.add(reference.prefix)
+    mapping = _get_mapping_or_none(f, reference.prefix, **kwargs)
+    if mapping is None:
         return None
 
     if upgrade_identifier is None:
@@ -109,6 +102,73 @@ def _help_get(
         return mapping.get(reference.identifier)
 
 
+def _get_mapping_or_none(
+    f: Callable[[str, Unpack[GetOntologyKwargs]], Mapping[str, X]],
+    prefix: str,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> Mapping[str, X] | None:
+    """Get the mapping from ``f``, or None if it can't be built or is empty."""
+    try:
+        mapping = f(prefix, **kwargs)
+    except NoBuildError:
+        if prefix not in NO_BUILD_PREFIXES:
+            logger.warning("[%s] unable to look up results with %s", prefix, f)
+            NO_BUILD_PREFIXES.add(prefix)
+        return None
+    except ValueError as e:
+        if prefix not in NO_BUILD_PREFIXES:
+            logger.warning("[%s] value error while looking up results with %s: %s", prefix, f, e)
+            NO_BUILD_PREFIXES.add(prefix)
+        return None
+
+    if not mapping:
+        if prefix not in NO_BUILD_PREFIXES:
+            logger.warning("[%s] no results produced with %s", prefix, f)
+            NO_BUILD_PREFIXES.add(prefix)
+        return None
+
+    return mapping
+
+
+def _help_get_batch(
+    f: Callable[[str, Unpack[GetOntologyKwargs]], Mapping[str, X]],
+    references: ReferencesHint,
+    *,
+    upgrade_identifier: bool | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> list[X | None] | pd.Series:
+    """Get the results for many entities based on a mapping maker function ``f``.
+
+    This is like :func:`_help_get`, but groups the references by prefix so ``f`` and
+    the alternative identifier mapping are only called once per prefix.
+    """
+    n, groups = _group_references(references)
+    rv: list[X | None] = [None] * n
+    for prefix, (positions, identifiers) in groups.items():
+        mapping = _get_mapping_or_none(f, prefix, **kwargs)
+        if mapping is None:
+            continue
+        identifiers_series = pd.Series(identifiers)
+        if upgrade_identifier is None:
+            values = _map_series(identifiers_series, mapping)
+            missing = values.isna()
+            if missing.any():
+                primary_identifiers = _get_primary_identifiers(
+                    prefix, identifiers_series[missing], **kwargs
+                )
+                values[missing] = _map_series(primary_identifiers, mapping)
+        elif upgrade_identifier is True:
+            primary_identifiers = _get_primary_identifiers(prefix, identifiers_series, **kwargs)
+            values = _map_series(primary_identifiers, mapping)
+        else:
+            values = _map_series(identifiers_series, mapping)
+        for position, value in zip(
+            positions, values.astype(object).where(values.notna(), None).tolist(), strict=True
+        ):
+            rv[position] = value
+    return _align(references, rv)
+
+
 def get_name(
     reference: str | curies.Reference | curies.ReferenceTuple,
     /,
@@ -122,6 +182,32 @@ def get_name(
     )
 
 
+def get_names(
+    references: ReferencesHint,
+    /,
+    *,
+    upgrade_identifier: bool | None = None,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> list[str | None] | pd.Series:
+    """Get the names for many entities.
+
+    :param references: An iterable or :class:`pandas.Series` of CURIEs or references
+    :param upgrade_identifier: Should alternative identifiers be upgraded to their
+        primary identifiers? See :func:`get_name`.
+    :returns: A list of names aligned with the input, or a series with the same index if
+        a series was given. Entries are None if the name can't be found.
+
+    This groups the references by prefix, so each prefix's names are only loaded once.
+
+    >>> import pyobo
+    >>> pyobo.get_names(["GO:0006915", "CHEBI:15377"])
+    ['apoptotic process', 'water']
+    """
+    return _help_get_batch(
+        get_id_name_mapping, references, upgrade_identifier=upgrade_identifier, **kwargs
+    )
+
+
 @lru_cache
 @wrap_norm_prefix
 def get_ids(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> set[str]:
@@ -191,8 +277,8 @@ def get_references(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> set[Refe
     except NoBuildError:
         logger.debug("[%s] no build", prefix)
         return set()
-    except (Exception, subprocess.CalledProcessError) as e:
-        logger.exception("[%s v%s] could not load: %s", prefix, version, e)
+    except (Exception, subprocess.CalledProcessError):
+        logger.exception("[%s v%s] could not load", prefix, version)
         return set()
 
 
@@ -229,8 +315,8 @@ def get_id_name_mapping(
     except NoBuildError:
         logger.debug("[%s] no build", prefix)
         return {}
-    except (Exception, subprocess.CalledProcessError) as e:
-        logger.exception("[%s v%s] could not load: %s", prefix, version, e)
+    except (Exception, subprocess.CalledProcessError):
+        logger.exception("[%s v%s] could not load", prefix, version)
         return {}
 
 
@@ -277,6 +363,18 @@ def get_id_definition_mapping(
     return _get_mapping()
 
 
+def get_definitions(
+    references: ReferencesHint, /, **kwargs: Unpack[GetOntologyKwargs]
+) -> list[str | None] | pd.Series:
+    """Get the definitions for many entities.
+
+    :param references: An iterable or :class:`pandas.Series` of CURIEs or references
+    :returns: A list of definitions aligned with the input, or a series with the same
+        index if a series was given. Entries are None if the definition can't be found.
+    """
+    return _help_get_batch(get_id_definition_mapping, references, **kwargs)
+
+
 @wrap_norm_prefix
 def get_obsolete(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> set[str]:
     """Get the set of obsolete local unique identifiers."""
@@ -2,6 +2,8 @@
 
 import logging
 from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
 
 import pandas as pd
 from tqdm import tqdm
@@ -20,7 +22,7 @@ from ..struct import OBOLiteral, Reference
 from ..struct.struct_utils import ReferenceHint, _ensure_ref
 from ..utils.cache import cached_df
 from ..utils.io import multidict
-from ..utils.path import CacheArtifact, get_cache_path
+from ..utils.path import CacheArtifact, get_cache_path, get_property_cache_path
 
 __all__ = [
     "get_filtered_properties_df",
@@ -37,6 +39,11 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+#: The maximum number of mappings for a given prefix, version, and property
+#: that are kept in memory by :func:`get_filtered_properties_mapping` and
+#: :func:`get_filtered_properties_multimapping`
+PROPERTY_CACHE_SIZE = 32
+
 
 def get_object_properties_df(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> pd.DataFrame:
     """Get a dataframe of object property triples."""
@@ -124,6 +131,22 @@ def get_properties_df(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> pd.Da
     return df[[f"{prefix}_id", "property", "value"]]
 
 
+@lru_cache(maxsize=PROPERTY_CACHE_SIZE)
+def _get_property_memo_helper(prefix: str, version: str | None, prop: str) -> dict[str, Any]:
+    """Get the in-memory cache for a property, keyed on the kind of mapping."""
+    return {}
+
+
+def _get_property_memo(prefix: str, prop: Reference, kwargs: GetOntologyKwargs) -> dict[str, Any]:
+    kwargs["version"] = get_version_from_kwargs(prefix, kwargs)
+    if check_should_force(kwargs):
+        # the mappings are rebuilt, so none of the ones in memory can be trusted
+        _get_property_memo_helper.cache_clear()
+    # only the prefix, version, and property are used for the key, since other
+    # arguments (e.g., for caching or progress bars) don't change the mapping
+    return _get_property_memo_helper(prefix, kwargs["version"], prop.curie)
+
+
 @wrap_norm_prefix
 def get_filtered_properties_mapping(
     prefix: str, prop: ReferenceHint, **kwargs: Unpack[GetOntologyKwargs]
@@ -134,9 +157,16 @@ def get_filtered_properties_mapping(
     :param prop: the property to extract
 
     :returns: A mapping from identifier to property value
+
+    The mapping is cached in memory for each prefix, version, and property, so it
+    shouldn't be modified. Forcing rebuilds it and clears the in-memory cache.
     """
-    df = get_filtered_properties_df(prefix, prop, **kwargs)
-    return dict(df.values)
+    prop = _ensure_ref(prop, ontology_prefix=prefix)
+    memo = _get_property_memo(prefix, prop, kwargs)
+    if "mapping" not in memo:
+        df = get_filtered_properties_df(prefix, prop.curie, **kwargs)
+        memo["mapping"] = dict(df.values)
+    return memo["mapping"]  # type:ignore[no-any-return]
 
 
 @wrap_norm_prefix
@@ -149,9 +179,16 @@ def get_filtered_properties_multimapping(
     :param prop: the property to extract
 
     :returns: A mapping from identifier to property values
+
+    The mapping is cached in memory for each prefix, version, and property, so it
+    shouldn't be modified. Forcing rebuilds it and clears the in-memory cache.
     """
-    df = get_filtered_properties_df(prefix, prop, **kwargs)
-    return multidict(df.values)
+    prop = _ensure_ref(prop, ontology_prefix=prefix)
+    memo = _get_property_memo(prefix, prop, kwargs)
+    if "multimapping" not in memo:
+        df = get_filtered_properties_df(prefix, prop.curie, **kwargs)
+        memo["multimapping"] = multidict(df.values)
+    return memo["multimapping"]  # type:ignore[no-any-return]
 
 
 def get_property(
@@ -206,8 +243,19 @@ def get_filtered_properties_df(
 
     :returns: A dataframe from identifier to property value. Columns are [<prefix>_id,
         value].
+
+    Each property is cached in its own file, so the full properties tables only need to
+    be read the first time a given property is requested.
     """
     prop = _ensure_ref(prop, ontology_prefix=prefix)
-    df = get_properties_df(prefix, **kwargs)
-    df = df.loc[df["property"] == prop.curie, [f"{prefix}_id", "value"]]
-    return df
+    version = get_version_from_kwargs(prefix, kwargs)
+    path = get_property_cache_path(prefix, prop, version=version)
+
+    @cached_df(
+        path=path, dtype=str, force=check_should_force(kwargs), cache=check_should_cache(kwargs)
+    )
+    def _df_getter() -> pd.DataFrame:
+        df = get_properties_df(prefix, **kwargs)
+        return df.loc[df["property"] == prop.curie, [f"{prefix}_id", "value"]]
+
+    return _df_getter()
@@ -25,6 +25,7 @@ from ..getters import get_ontology
 from ..identifier_utils import Reference, wrap_norm_prefix
 from ..struct.struct_utils import ReferenceHint, _ensure_ref
 from ..utils.cache import cached_df
+from ..utils.columnar import get_format_path, read_table
 from ..utils.path import CacheArtifact, get_cache_path, get_relation_cache_path
 
 __all__ = [
@@ -90,12 +91,16 @@ def get_filtered_relations_df(
     relation = _ensure_ref(relation, ontology_prefix=prefix)
     version = get_version_from_kwargs(prefix, kwargs)
     all_relations_path = get_cache_path(prefix, CacheArtifact.relations, version=version)
-    if all_relations_path.is_file():
-        logger.debug("[%] loading all relations from %s", prefix, all_relations_path)
-        df = pd.read_csv(all_relations_path, sep="\t", dtype=str)
-        idx = (df[RELATION_PREFIX] == relation.prefix) & (df[RELATION_ID] == relation.identifier)
-        columns = [f"{prefix}_id", TARGET_PREFIX, TARGET_ID]
-        return df.loc[idx, columns]
+    if all_relations_path.is_file() or get_format_path(all_relations_path).is_file():
+        logger.debug("[%s] loading all relations from %s", prefix, all_relations_path)
+        return read_table(
+            all_relations_path,
+            columns=[f"{prefix}_id", TARGET_PREFIX, TARGET_ID],
+            filters=[
+                (RELATION_PREFIX, "==", relation.prefix),
+                (RELATION_ID, "==", relation.identifier),
+            ],
+        )
 
     path = get_relation_cache_path(prefix, relation, version=version)
 
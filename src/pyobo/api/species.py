@@ -4,10 +4,12 @@ import logging
 from collections.abc import Mapping
 from functools import lru_cache
 
+import pandas as pd
 from typing_extensions import Unpack
 
 from .alts import get_primary_identifier
-from .utils import SimpleReferenceHint, _get_pi, get_version_from_kwargs
+from .names import _help_get_batch
+from .utils import ReferencesHint, SimpleReferenceHint, _get_pi, get_version_from_kwargs
 from ..constants import GetOntologyKwargs, check_should_force
 from ..getters import NoBuildError, get_ontology
 from ..identifier_utils import wrap_norm_prefix
@@ -17,6 +19,7 @@ from ..utils.path import CacheArtifact, get_cache_path
 __all__ = [
     "get_id_species_mapping",
     "get_species",
+    "get_species_batch",
 ]
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,19 @@ def get_species(
     return id_species.get(primary_id)
 
 
+def get_species_batch(
+    references: ReferencesHint, /, **kwargs: Unpack[GetOntologyKwargs]
+) -> list[str | None] | pd.Series:
+    """Get the species for many entities.
+
+    :param references: An iterable or :class:`pandas.Series` of CURIEs or references
+    :returns: A list of NCBI Taxonomy identifiers aligned with the input, or a series
+        with the same index if a series was given. Entries are None if the species can't
+        be found.
+    """
+    return _help_get_batch(get_id_species_mapping, references, upgrade_identifier=True, **kwargs)
+
+
 @lru_cache
 @wrap_norm_prefix
 def get_id_species_mapping(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> Mapping[str, str]:
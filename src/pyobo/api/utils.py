@@ -1,8 +1,11 @@
 """Utilities for high-level API."""
 
-from typing import TypeAlias
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TypeAlias, TypeVar
 
+import bioregistry
 import curies
+import pandas as pd
 from curies import ReferenceTuple
 
 from ..identifier_utils import Reference
@@ -15,6 +18,7 @@ from ..utils.ver import (
 )
 
 __all__ = [
+    "ReferencesHint",
     "SimpleReferenceHint",
     "VersionError",
     "get_version",
@@ -26,6 +30,11 @@ __all__ = [
 
 SimpleReferenceHint: TypeAlias = str | curies.Reference | ReferenceTuple
 
+#: A hint for many references, e.g., for batch lookup functions
+ReferencesHint: TypeAlias = Iterable[SimpleReferenceHint] | pd.Series
+
+X = TypeVar("X")
+
 
 def _get_pi(reference: SimpleReferenceHint, /) -> Reference:
     """Resolve a reference hint."""
@@ -36,3 +45,88 @@ def _get_pi(reference: SimpleReferenceHint, /) -> Reference:
     if isinstance(reference, str):
         return Reference.from_curie(reference)
     raise TypeError(f"unexpected type {type(reference)}")
+
+
+def _group_references(
+    references: ReferencesHint, /
+) -> tuple[int, dict[str, tuple[list[int], list[str]]]]:
+    """Group references by their normalized prefix.
+
+    :param references: An iterable of CURIEs or references
+    :returns: The number of references and a dictionary from normalized prefixes to
+        pairs of lists of the positions of the references and their standardized local
+        unique identifiers. References that aren't CURIEs or that have unregistered
+        prefixes are skipped.
+    """
+    raw_groups: dict[str, tuple[list[int], list[str]]] = {}
+    n = 0
+    for n, reference in enumerate(references, start=1):
+        if isinstance(reference, str):
+            prefix, delimiter, identifier = reference.partition(":")
+            if not delimiter:
+                continue
+        elif isinstance(reference, ReferenceTuple | curies.Reference):
+            prefix, identifier = reference.prefix, reference.identifier
+        else:
+            raise TypeError(f"unexpected type {type(reference)}")
+        positions, identifiers = raw_groups.setdefault(prefix, ([], []))
+        positions.append(n - 1)
+        identifiers.append(identifier)
+
+    rv: dict[str, tuple[list[int], list[str]]] = {}
+    for raw_prefix, (positions, identifiers) in raw_groups.items():
+        norm_prefix = bioregistry.normalize_prefix(raw_prefix)
+        if norm_prefix is None:
+            continue
+        identifiers = _standardize_identifiers(norm_prefix, identifiers)
+        # several raw prefixes (e.g., GO and go) can normalize to the same one
+        if norm_prefix in rv:
+            rv[norm_prefix][0].extend(positions)
+            rv[norm_prefix][1].extend(identifiers)
+        else:
+            rv[norm_prefix] = positions, identifiers
+    return n, rv
+
+
+def _standardize_identifiers(prefix: str, identifiers: list[str]) -> list[str]:
+    """Remove redundant prefixes and bananas from local unique identifiers.
+
+    This does the same as :meth:`bioregistry.Resource.standardize_identifier`, but only
+    looks up the banana once for all identifiers.
+    """
+    resource = bioregistry.get_resource(prefix)
+    if resource is None:
+        return identifiers
+    banana = resource.get_banana()
+    starts: list[str] = []
+    for peel in [resource.get_banana_peel(), "_"]:
+        if banana:
+            starts.append(f"{banana}{peel}".casefold())
+        starts.append(f"{resource.prefix.casefold()}{peel}")
+    starts_tuple = tuple(starts)
+
+    rv = []
+    for identifier in identifiers:
+        folded = identifier.casefold()
+        if folded.startswith(starts_tuple):
+            for start in starts:
+                if folded.startswith(start):
+                    identifier = identifier[len(start) :]
+                    break
+        rv.append(identifier)
+    return rv
+
+
+def _align(references: ReferencesHint, values: Sequence[X]) -> list[X] | pd.Series:
+    """Return a series if the references were given as a series, otherwise a list."""
+    if isinstance(references, pd.Series):
+        return pd.Series(values, index=references.index, dtype=object)
+    return list(values)
+
+
+def _map_series(series: pd.Series, mapping: Mapping[str, X]) -> pd.Series:
+    """Map the values in a series, giving NaN for missing keys."""
+    if isinstance(mapping, dict):
+        return series.map(mapping)
+    # don't copy other mappings, like compact ones, into a dictionary on each call
+    return series.map(mapping.get, na_action="ignore")
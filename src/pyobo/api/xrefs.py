@@ -27,6 +27,7 @@ from ..getters import get_ontology
 from ..identifier_utils import wrap_norm_prefix
 from ..struct import Obo
 from ..utils.cache import cached_df
+from ..utils.columnar import CacheFormat
 from ..utils.path import CacheArtifact, get_cache_path
 
 __all__ = [
@@ -190,8 +191,13 @@ def get_mappings_df(
         version = get_version_from_kwargs(prefix, kwargs)
         path = get_cache_path(prefix, CacheArtifact.mappings, version=version)
 
+        # the SSSOM metadata is in the header of the TSV file, so this always stays TSV
         @cached_df(
-            path=path, dtype=str, force=check_should_force(kwargs), cache=check_should_cache(kwargs)
+            path=path,
+            dtype=str,
+            force=check_should_force(kwargs),
+            cache=check_should_cache(kwargs),
+            cache_format=CacheFormat.tsv,
         )
         def _df_getter() -> pd.DataFrame:
             logger.info("[%s] rebuilding SSSOM", prefix)
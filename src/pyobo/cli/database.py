@@ -1,9 +1,10 @@
 """CLI for PyOBO Database Generation."""
 
 import logging
-from collections.abc import Callable, Iterable
+import os
+from collections.abc import Callable
 from pathlib import Path
-from typing import ParamSpec, TypeVar
+from typing import ParamSpec, TypeVar, cast
 
 import click
 from more_click import verbose_option
@@ -17,18 +18,7 @@ from .utils import (
     strict_option,
     zenodo_option,
 )
-from ..constants import (
-    ALTS_DATA_RECORD,
-    DEFINITIONS_RECORD,
-    JAVERT_RECORD,
-    OOH_NA_NA_RECORD,
-    PROPERTIES_RECORD,
-    RELATIONS_RECORD,
-    SPECIES_RECORD,
-    SYNONYMS_RECORD,
-    TYPEDEFS_RECORD,
-    DatabaseKwargs,
-)
+from ..constants import DatabaseKwargs, IterHelperHelperDict
 
 __all__ = [
     "main",
@@ -53,6 +43,38 @@ skip_pyobo_option = click.option(
 skip_below_option = click.option(
     "--skip-below", help="Skip prefixes lexically sorted below the given one"
 )
+incremental_option = click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only rebuild prefixes whose versions changed since the last build",
+)
+workers_option = click.option(
+    "--workers",
+    type=int,
+    help="The number of processes used to handle prefixes in parallel",
+)
+prefetch_option = click.option(
+    "--prefetch",
+    type=int,
+    help="The number of upcoming prefixes whose ontologies are downloaded in the background",
+)
+
+
+def _set_telemetry(_ctx: click.Context, _param: click.Parameter, value: Path | None) -> None:
+    if value is not None:
+        from ..utils.telemetry import TELEMETRY_ENVIRONMENT_VARIABLE
+
+        # use an environment variable so worker processes also report
+        os.environ[TELEMETRY_ENVIRONMENT_VARIABLE] = str(value.resolve())
+
+
+telemetry_option = click.option(
+    "--telemetry",
+    type=click.Path(dir_okay=False, path_type=Path),
+    callback=_set_telemetry,
+    expose_value=False,
+    help="Append the timing and peak memory of each phase to this JSON lines file",
+)
 
 
 def database_annotate(f: Callable[P, T]) -> Callable[P, T]:
@@ -67,6 +89,10 @@ def database_annotate(f: Callable[P, T]) -> Callable[P, T]:
         strict_option,
         skip_pyobo_option,
         skip_below_option,
+        workers_option,
+        prefetch_option,
+        incremental_option,
+        telemetry_option,
     ]
     for decorator in decorators:
         f = decorator(f)
@@ -82,8 +108,15 @@ def _update_database_kwargs(kwargs: DatabaseKwargs) -> DatabaseKwargs:
 
 @database_annotate
 @click.option("--eager-versions", is_flag=True)
+@click.option(
+    "--fused",
+    is_flag=True,
+    help="Visit each prefix once and build all databases at the same time",
+)
 @click.pass_context
-def build(ctx: click.Context, eager_versions: bool, **kwargs: Unpack[DatabaseKwargs]) -> None:
+def build(
+    ctx: click.Context, eager_versions: bool, fused: bool, **kwargs: Unpack[DatabaseKwargs]
+) -> None:
     """Build all databases."""
     # if no_strict and zenodo:
     #    click.secho("Must be strict before uploading", fg="red")
@@ -94,6 +127,21 @@ def build(ctx: click.Context, eager_versions: bool, **kwargs: Unpack[DatabaseKwa
 
         bioversions.get_rows(use_tqdm=True)
 
+    if fused:
+        from .database_utils import _build_fused
+
+        with logging_redirect_tqdm():
+            click.secho("Building all databases", fg="cyan", bold=True)
+            _build_fused(**kwargs)
+        return
+
+    if kwargs["force"] or kwargs["force_process"]:
+        from .database_utils import _clear_shards
+
+        # only the metadata gets built with forcing, so make sure the
+        # others don't resume from the shards of an unfinished build
+        _clear_shards(ctx.params["directory"])
+
     with logging_redirect_tqdm():
         click.secho("Collecting metadata and building", fg="cyan", bold=True)
         # note that this is the only one that needs a force=force
@@ -134,8 +182,10 @@ def cache(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> No
         click.echo("no zenodo for caching")
 
     kwargs["force_process"] = True
+    # everything is reprocessed, so there's nothing to do incrementally
+    kwargs.pop("incremental", None)
     with logging_redirect_tqdm():
-        for _ in iter_helper_helper(get_ontology, **kwargs):
+        for _ in iter_helper_helper(get_ontology, **cast(IterHelperHelperDict, kwargs)):
             # this pass intentional to consume the iterable
             pass
 
@@ -143,278 +193,74 @@ def cache(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> No
 @database_annotate
 def metadata(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-metadata dump."""
-    import bioregistry
-
-    from ..api import get_metadata
-    from ..constants import IterHelperHelperDict
-    from ..getters import db_output_helper, iter_helper_helper
-
-    def _iter_metadata_internal(
-        **kwargs: Unpack[IterHelperHelperDict],
-    ) -> Iterable[tuple[str, str, str, bool]]:
-        for prefix, metadata in iter_helper_helper(get_metadata, **kwargs):
-            if metadata.version is None and metadata.date is None:
-                continue
-            logger.debug(f"[{prefix}] using version {metadata.version}")
-            yield (
-                prefix,
-                metadata.version or "",
-                metadata.date.isoformat() if metadata.date else "",
-                bioregistry.is_deprecated(prefix),
-            )
-
-    it = _iter_metadata_internal(**kwargs)
-    db_output_helper(
-        it,
-        "metadata",
-        ("prefix", "version", "date", "deprecated"),
-        use_gzip=False,
-        directory=directory,
-    )
-    if zenodo:
-        click.secho("No Zenodo record for metadata", fg="red")
+    _build("metadata", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def names(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-identifier-name dump."""
-    from .database_utils import _iter_names
-    from ..getters import db_output_helper
-
-    it = _iter_names(**kwargs)
-    with logging_redirect_tqdm():
-        paths = db_output_helper(
-            it,
-            "names",
-            ("prefix", "identifier", "name"),
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4020486
-        update_zenodo(OOH_NA_NA_RECORD, paths)
+    _build("names", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def species(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-identifier-species dump."""
-    from .database_utils import _iter_species
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        it = _iter_species(**kwargs)
-        paths = db_output_helper(
-            it,
-            "species",
-            ("prefix", "identifier", "species"),
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/5334738
-        update_zenodo(SPECIES_RECORD, paths)
-
-
-def _extend_skip_set(kwargs: DatabaseKwargs, skip_set: set[str]) -> None:
-    ss = kwargs.get("skip_set")
-    if ss is None:
-        kwargs["skip_set"] = skip_set
-    else:
-        ss.update(skip_set)
+    _build("species", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def definitions(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-identifier-definition dump."""
-    from .database_utils import _iter_definitions
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        _extend_skip_set(kwargs, {"kegg.pathway", "kegg.genes", "kegg.genome", "umls"})
-        it = _iter_definitions(**kwargs)
-        paths = db_output_helper(
-            it,
-            "definitions",
-            ("prefix", "identifier", "definition"),
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4637061
-        update_zenodo(DEFINITIONS_RECORD, paths)
+    _build("definitions", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def typedefs(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the typedef prefix-identifier-name dump."""
-    from .database_utils import _iter_typedefs
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        _extend_skip_set(kwargs, {"ncbigene", "kegg.pathway", "kegg.genes", "kegg.genome"})
-        it = _iter_typedefs(**kwargs)
-        paths = db_output_helper(
-            it,
-            "typedefs",
-            ("prefix", "typedef_prefix", "identifier", "name"),
-            use_gzip=False,
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4644013
-        update_zenodo(TYPEDEFS_RECORD, paths)
+    _build("typedefs", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def alts(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-alt-id dump."""
-    from .database_utils import _iter_alts
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        _extend_skip_set(kwargs, {"kegg.pathway", "kegg.genes", "kegg.genome", "umls"})
-        it = _iter_alts(**kwargs)
-        paths = db_output_helper(
-            it,
-            "alts",
-            ("prefix", "identifier", "alt"),
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4021476
-        update_zenodo(ALTS_DATA_RECORD, paths)
+    _build("alts", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def synonyms(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the prefix-identifier-synonym dump."""
-    from .database_utils import _iter_synonyms
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        _extend_skip_set(kwargs, {"kegg.pathway", "kegg.genes", "kegg.genome"})
-        it = _iter_synonyms(**kwargs)
-        paths = db_output_helper(
-            it,
-            "synonyms",
-            ("prefix", "identifier", "synonym"),
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4021482
-        update_zenodo(SYNONYMS_RECORD, paths)
+    _build("synonyms", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def relations(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the relation dump."""
-    from .database_utils import _iter_relations
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        it = _iter_relations(**kwargs)
-        paths = db_output_helper(
-            it,
-            "relations",
-            (
-                "source_prefix",
-                "source_identifier",
-                "relation_prefix",
-                "relation_identifier",
-                "target_prefix",
-                "target_identifier",
-            ),
-            summary_detailed=(0, 2, 3),  # second column corresponds to relation type
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4625167
-        update_zenodo(RELATIONS_RECORD, paths)
+    _build("relations", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def edges(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the edges dump."""
-    from .database_utils import _iter_edges
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        it = _iter_edges(**kwargs)
-        db_output_helper(
-            it,
-            "edges",
-            (
-                ":START_ID",
-                ":TYPE",
-                ":END_ID",
-                "provenance",
-            ),
-            directory=directory,
-        )
-    if zenodo:
-        raise NotImplementedError
+    _build("edges", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def properties(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the properties dump."""
-    from .database_utils import _iter_properties
-    from ..getters import db_output_helper
-
-    with logging_redirect_tqdm():
-        it = _iter_properties(**kwargs)
-        paths = db_output_helper(
-            it,
-            "properties",
-            ("prefix", "identifier", "property", "value"),
-            summary_detailed=(0, 2),  # second column corresponds to property type
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
-
-        # see https://zenodo.org/record/4625172
-        update_zenodo(PROPERTIES_RECORD, paths)
+    _build("properties", directory, zenodo=zenodo, **kwargs)
 
 
 @database_annotate
 def mappings(zenodo: bool, directory: Path, **kwargs: Unpack[DatabaseKwargs]) -> None:
     """Make the SSSOM dump."""
-    from .database_utils import _iter_mappings
-    from ..getters import db_output_helper
-
-    columns = [
-        "subject_id",
-        "object_id",
-        "predicate_id",
-        "mapping_justification",
-        "mapping_source",
-    ]
-    with logging_redirect_tqdm():
-        it = _iter_mappings(**kwargs)
-        paths = db_output_helper(
-            it,
-            "mappings",
-            columns,
-            directory=directory,
-        )
-    if zenodo:
-        from zenodo_client import update_zenodo
+    _build("mappings", directory, zenodo=zenodo, **kwargs)
 
-        # TODO might not work because file paths for old xrefs were different
-        # see https://zenodo.org/record/4021477
-        update_zenodo(JAVERT_RECORD, paths)
+
+def _build(name: str, directory: Path, *, zenodo: bool, **kwargs: Unpack[DatabaseKwargs]) -> None:
+    from .database_utils import DATABASE_TABLES_DICT, _build_table
+
+    with logging_redirect_tqdm():
+        _build_table(DATABASE_TABLES_DICT[name], directory, zenodo=zenodo, **kwargs)
 
 
 if __name__ == "__main__":
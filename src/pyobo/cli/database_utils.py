@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import datetime
 import gzip
 import logging
-from collections.abc import Iterable
-from typing import cast
+import shutil
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
 
+import bioregistry
+import click
+import pandas as pd
+from pydantic import BaseModel, Field
+from pystow.utils import (
+    read_pydantic_json,
+    safe_open_reader,
+    safe_open_writer,
+    write_pydantic_json,
+)
 from tqdm.auto import tqdm
 from typing_extensions import Unpack
 
@@ -18,15 +33,38 @@ from ..api import (
     get_id_synonyms_mapping,
     get_id_to_alts,
     get_mappings_df,
+    get_metadata,
     get_properties_df,
     get_relations_df,
     get_typedef_df,
 )
-from ..constants import IterHelperHelperDict
-from ..getters import iter_helper, iter_helper_helper
+from ..constants import (
+    ALTS_DATA_RECORD,
+    DEFINITIONS_RECORD,
+    JAVERT_RECORD,
+    OOH_NA_NA_RECORD,
+    PROPERTIES_RECORD,
+    RELATIONS_RECORD,
+    SPECIES_RECORD,
+    SYNONYMS_RECORD,
+    TYPEDEFS_RECORD,
+    GetOntologyKwargs,
+    IterHelperHelperDict,
+)
+from ..getters import (
+    DatabaseOutput,
+    _call_handled,
+    _iter_mapping_rows,
+    _prefixes,
+    _prep_dir,
+    iter_helper,
+    iter_helper_helper,
+)
 from ..sources import pubchem
 from ..sources.ncbi import ncbigene
 from ..utils.path import ensure_path
+from ..utils.telemetry import span
+from ..utils.ver import VersionMetadata, get_version
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +88,7 @@ def _iter_names(
     :param leave: should the tqdm be left behind?
     """
     yield from iter_helper(get_id_name_mapping, leave=leave, **kwargs)
-    yield from _iter_ncbigene(1, 2)
+    yield from _iter_ncbigene_names()
     yield from _iter_pubchem_compound()
 
 
@@ -64,6 +102,20 @@ def _iter_pubchem_compound() -> Iterable[tuple[str, str, str]]:
             yield pubchem.PREFIX, identifier, name
 
 
+def _iter_metadata_rows(
+    prefix: str, metadata: VersionMetadata
+) -> Iterable[tuple[str, str, str, bool]]:
+    if metadata.version is None and metadata.date is None:
+        return
+    logger.debug(f"[{prefix}] using version {metadata.version}")
+    yield (
+        prefix,
+        metadata.version or "",
+        metadata.date.isoformat() if metadata.date else "",
+        bioregistry.is_deprecated(prefix),
+    )
+
+
 def _iter_species(
     leave: bool = False, **kwargs: Unpack[IterHelperHelperDict]
 ) -> Iterable[tuple[str, str, str]]:
@@ -77,15 +129,22 @@ def _iter_definitions(
 ) -> Iterable[tuple[str, str, str]]:
     """Iterate over all prefix-identifier-descriptions triples we can get."""
     yield from iter_helper(get_id_definition_mapping, leave=leave, **kwargs)
+    yield from _iter_ncbigene_definitions()
+
+
+def _iter_ncbigene_definitions() -> Iterable[tuple[str, str, str]]:
     yield from _iter_ncbigene(1, 8)
 
 
+def _iter_ncbigene_names() -> Iterable[tuple[str, str, str]]:
+    yield from _iter_ncbigene(1, 2)
+
+
 def _iter_alts(
     leave: bool = False, **kwargs: Unpack[IterHelperHelperDict]
 ) -> Iterable[tuple[str, str, str]]:
-    for prefix, identifier, alts in iter_helper(get_id_to_alts, leave=leave, **kwargs):
-        for alt in alts:
-            yield prefix, identifier, alt
+    for prefix, mapping in iter_helper_helper(get_id_to_alts, **kwargs):
+        yield from _iter_multimapping_rows(prefix, mapping, leave=leave)
 
 
 def _iter_synonyms(
@@ -95,44 +154,570 @@ def _iter_synonyms(
 
     :param leave: should the tqdm be left behind?
     """
-    for prefix, identifier, synonyms in iter_helper(get_id_synonyms_mapping, leave=leave, **kwargs):
-        for synonym in synonyms:
-            yield prefix, identifier, synonym
+    for prefix, mapping in iter_helper_helper(get_id_synonyms_mapping, **kwargs):
+        yield from _iter_multimapping_rows(prefix, mapping, leave=leave)
+
+
+def _iter_multimapping_rows(
+    prefix: str, mapping: Mapping[str, list[str]], leave: bool = False
+) -> Iterable[tuple[str, str, str]]:
+    for prefix_, identifier, values in _iter_mapping_rows(prefix, mapping, leave=leave):
+        for value in values:
+            yield prefix_, identifier, value
 
 
 def _iter_typedefs(**kwargs: Unpack[IterHelperHelperDict]) -> Iterable[tuple[str, str, str, str]]:
     """Iterate over all prefix-identifier-name triples we can get."""
     for prefix, df in iter_helper_helper(get_typedef_df, **kwargs):
-        for t in df.values:
-            if all(t):
-                yield cast(tuple[str, str, str, str], (prefix, *t))
+        yield from _iter_prefixed_rows(prefix, df)
 
 
 def _iter_relations(
     **kwargs: Unpack[IterHelperHelperDict],
 ) -> Iterable[tuple[str, str, str, str, str, str]]:
     for prefix, df in iter_helper_helper(get_relations_df, **kwargs):
-        for t in df.values:
-            if all(t):
-                yield cast(tuple[str, str, str, str, str, str], (prefix, *t))
+        yield from _iter_prefixed_rows(prefix, df)
 
 
 def _iter_edges(**kwargs: Unpack[IterHelperHelperDict]) -> Iterable[tuple[str, str, str, str]]:
     for prefix, df in iter_helper_helper(get_edges_df, **kwargs):
-        for row in df.values:
-            yield cast(tuple[str, str, str, str], (*row, prefix))
+        yield from _iter_edge_rows(prefix, df)
+
+
+def _iter_edge_rows(prefix: str, df: pd.DataFrame) -> Iterable[tuple[str, str, str, str]]:
+    for row in df.values:
+        yield cast(tuple[str, str, str, str], (*row, prefix))
 
 
 def _iter_properties(**kwargs: Unpack[IterHelperHelperDict]) -> Iterable[tuple[str, str, str, str]]:
     for prefix, df in iter_helper_helper(get_properties_df, **kwargs):
-        for t in df.values:
-            if all(t):
-                yield cast(tuple[str, str, str, str], (prefix, *t))
+        yield from _iter_prefixed_rows(prefix, df)
+
+
+def _iter_prefixed_rows(prefix: str, df: pd.DataFrame) -> Iterable[tuple[Any, ...]]:
+    for t in df.values:
+        if all(t):
+            yield (prefix, *t)
 
 
 def _iter_mappings(
     **kwargs: Unpack[IterHelperHelperDict],
 ) -> Iterable[tuple[str, str, str, str, str]]:
     it = iter_helper_helper(get_mappings_df, **kwargs)
-    for _prefix, df in it:
-        yield from df.values
+    for prefix, df in it:
+        yield from _iter_mappings_rows(prefix, df)
+
+
+def _iter_mappings_rows(prefix: str, df: pd.DataFrame) -> Iterable[tuple[str, str, str, str, str]]:
+    yield from df.values
+
+
+@dataclass(frozen=True)
+class DatabaseTable:
+    """Describes how one of the database dumps is built."""
+
+    #: The name of the dump, e.g., ``names``
+    name: str
+    #: The header for the dump
+    columns: tuple[str, ...]
+    #: A function that takes a prefix and returns something to turn into rows
+    getter: Callable[..., Any]
+    #: A function that turns a prefix and the result of the getter into rows
+    rows: Callable[[str, Any], Iterable[tuple[Any, ...]]]
+    #: Prefixes that are skipped for this dump
+    skip_set: frozenset[str] = frozenset()
+    #: Pairs of keys and functions that produce rows from outside the registry, which
+    #: are added at the end
+    extras: tuple[tuple[str, Callable[[], Iterable[tuple[Any, ...]]]], ...] = ()
+    #: Should the dump be compressed?
+    use_gzip: bool = True
+    #: The positions of columns to count in a detailed summary
+    summary_detailed: tuple[int, ...] | None = None
+    #: The Zenodo record to upload the dump to
+    zenodo_record: str | None = None
+
+    def get_output(
+        self,
+        directory: str | Path | None = None,
+        *,
+        versions: Mapping[str, str | None] | None = None,
+    ) -> DatabaseOutput:
+        """Get a sink for the rows of this dump."""
+        return DatabaseOutput(
+            self.name,
+            self.columns,
+            directory=directory,
+            use_gzip=self.use_gzip,
+            summary_detailed=self.summary_detailed,
+            versions=versions,
+        )
+
+
+_KEGG = frozenset({"kegg.pathway", "kegg.genes", "kegg.genome"})
+
+#: The dumps that are made from the metadata and content of each ontology, in the order
+#: in which they're built by ``pyobo database build``
+DATABASE_TABLES: list[DatabaseTable] = [
+    DatabaseTable(
+        "metadata",
+        ("prefix", "version", "date", "deprecated"),
+        get_metadata,
+        _iter_metadata_rows,
+        use_gzip=False,
+    ),
+    DatabaseTable(
+        "alts",
+        ("prefix", "identifier", "alt"),
+        get_id_to_alts,
+        _iter_multimapping_rows,
+        skip_set=_KEGG | {"umls"},
+        # see https://zenodo.org/record/4021476
+        zenodo_record=ALTS_DATA_RECORD,
+    ),
+    DatabaseTable(
+        "synonyms",
+        ("prefix", "identifier", "synonym"),
+        get_id_synonyms_mapping,
+        _iter_multimapping_rows,
+        skip_set=_KEGG,
+        # see https://zenodo.org/record/4021482
+        zenodo_record=SYNONYMS_RECORD,
+    ),
+    DatabaseTable(
+        "mappings",
+        ("subject_id", "object_id", "predicate_id", "mapping_justification", "mapping_source"),
+        get_mappings_df,
+        _iter_mappings_rows,
+        # TODO might not work because file paths for old xrefs were different
+        # see https://zenodo.org/record/4021477
+        zenodo_record=JAVERT_RECORD,
+    ),
+    DatabaseTable(
+        "names",
+        ("prefix", "identifier", "name"),
+        get_id_name_mapping,
+        _iter_mapping_rows,
+        extras=(
+            ("ncbigene", _iter_ncbigene_names),
+            ("pubchem.compound", _iter_pubchem_compound),
+        ),
+        # see https://zenodo.org/record/4020486
+        zenodo_record=OOH_NA_NA_RECORD,
+    ),
+    DatabaseTable(
+        "definitions",
+        ("prefix", "identifier", "definition"),
+        get_id_definition_mapping,
+        _iter_mapping_rows,
+        skip_set=_KEGG | {"umls"},
+        extras=(("ncbigene", _iter_ncbigene_definitions),),
+        # see https://zenodo.org/record/4637061
+        zenodo_record=DEFINITIONS_RECORD,
+    ),
+    DatabaseTable(
+        "properties",
+        ("prefix", "identifier", "property", "value"),
+        get_properties_df,
+        _iter_prefixed_rows,
+        summary_detailed=(0, 2),  # second column corresponds to property type
+        # see https://zenodo.org/record/4625172
+        zenodo_record=PROPERTIES_RECORD,
+    ),
+    DatabaseTable(
+        "relations",
+        (
+            "source_prefix",
+            "source_identifier",
+            "relation_prefix",
+            "relation_identifier",
+            "target_prefix",
+            "target_identifier",
+        ),
+        get_relations_df,
+        _iter_prefixed_rows,
+        summary_detailed=(0, 2, 3),  # second column corresponds to relation type
+        # see https://zenodo.org/record/4625167
+        zenodo_record=RELATIONS_RECORD,
+    ),
+    DatabaseTable(
+        "edges",
+        (":START_ID", ":TYPE", ":END_ID", "provenance"),
+        get_edges_df,
+        _iter_edge_rows,
+    ),
+    DatabaseTable(
+        "typedefs",
+        ("prefix", "typedef_prefix", "identifier", "name"),
+        get_typedef_df,
+        _iter_prefixed_rows,
+        skip_set=_KEGG | {"ncbigene"},
+        use_gzip=False,
+        # see https://zenodo.org/record/4644013
+        zenodo_record=TYPEDEFS_RECORD,
+    ),
+    DatabaseTable(
+        "species",
+        ("prefix", "identifier", "species"),
+        get_id_species_mapping,
+        _iter_mapping_rows,
+        # see https://zenodo.org/record/5334738
+        zenodo_record=SPECIES_RECORD,
+    ),
+]
+
+#: A dictionary from names to database tables
+DATABASE_TABLES_DICT: dict[str, DatabaseTable] = {table.name: table for table in DATABASE_TABLES}
+
+
+def _get_fused_results(prefix: str, **kwargs: Unpack[GetOntologyKwargs]) -> dict[str, Any]:
+    """Get the results of all database tables' getters for the prefix.
+
+    The metadata is retrieved first, respecting the ``force`` and ``force_process``
+    arguments. Its version is then passed to all other getters, without forcing, so the
+    ontology is loaded and its version is looked up only once.
+    """
+    rv: dict[str, Any] = {}
+    metadata_success, metadata = _call_handled(get_metadata, prefix, kwargs)
+    if metadata_success:
+        rv["metadata"] = metadata
+    updated_kwargs: GetOntologyKwargs = {**kwargs, "force": False, "force_process": False}
+    if metadata_success and metadata is not None and metadata.version:
+        updated_kwargs["version"] = metadata.version
+    for table in DATABASE_TABLES:
+        if table.name == "metadata" or prefix in table.skip_set:
+            continue
+        success, result = _call_handled(table.getter, prefix, updated_kwargs)
+        if success:
+            rv[table.name] = result
+    return rv
+
+
+class ShardRecord(BaseModel):
+    """A record of a completed shard in a :class:`ShardManifest`."""
+
+    #: The version of the resource that the shard was built from
+    version: str | None = None
+    #: The number of rows in the shard
+    count: int
+    #: When the shard was written
+    date: datetime.datetime
+
+
+class ShardManifest(BaseModel):
+    """A manifest of the per-prefix shards of a database table."""
+
+    #: Were the shards merged into the final dump? If so, the next build starts over.
+    merged: bool = False
+    #: Records for shards with rows for prefixes in the Bioregistry
+    prefixes: dict[str, ShardRecord] = Field(default_factory=dict)
+    #: Records for shards with rows from outside the Bioregistry
+    extras: dict[str, ShardRecord] = Field(default_factory=dict)
+
+
+class TableShards:
+    """Per-prefix shards of a database table, which make builds resumable.
+
+    Each prefix's rows are written to their own file in the ``shards`` subdirectory of
+    the database directory, and recorded in a manifest once complete. If a build
+    crashes, the next one skips prefixes whose shards are complete and whose versions
+    haven't changed. The shards are merged into the same outputs that
+    :func:`pyobo.getters.db_output_helper` makes.
+
+    In incremental mode, the shards from the last finished build are kept, so only
+    prefixes whose versions changed since then get rebuilt.
+    """
+
+    def __init__(
+        self,
+        table: DatabaseTable,
+        directory: str | Path | None = None,
+        *,
+        force: bool = False,
+        incremental: bool = False,
+    ) -> None:
+        """Load the manifest for the table's shards.
+
+        :param table: The database table
+        :param directory: The directory to output everything, or defaults to
+            :data:`pyobo.constants.DATABASE_DIRECTORY`.
+        :param force: Should existing shards be discarded?
+        :param incremental: Should the shards from the last finished build be reused
+            for prefixes whose versions haven't changed?
+        """
+        self.table = table
+        self.incremental = incremental
+        self.directory = directory
+        self.shards_directory = _prep_dir(directory).joinpath("shards", table.name)
+        self.shards_directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.shards_directory.joinpath("manifest.json")
+        if self.manifest_path.is_file() and not force:
+            self.manifest = read_pydantic_json(self.manifest_path, ShardManifest)
+        else:
+            self.manifest = ShardManifest()
+        if self.manifest.merged and incremental:
+            # reuse the shards from the last finished build
+            self.manifest.merged = False
+        elif self.manifest.merged:
+            # the last build finished, so start over
+            self.manifest = ShardManifest()
+
+    def _get_path(self, key: str, *, extra: bool = False) -> Path:
+        directory = self.shards_directory.joinpath("extras") if extra else self.shards_directory
+        directory.mkdir(exist_ok=True)
+        return directory.joinpath(f"{key}.tsv.gz")
+
+    def is_complete(self, key: str, version: str | None, *, extra: bool = False) -> bool:
+        """Check if the prefix has a complete shard built from the given version.
+
+        In incremental mode, shards whose versions are unknown are never complete,
+        since it's not possible to tell whether they changed.
+        """
+        if self.incremental and version is None:
+            return False
+        records = self.manifest.extras if extra else self.manifest.prefixes
+        record = records.get(key)
+        return (
+            record is not None
+            and record.version == version
+            and self._get_path(key, extra=extra).is_file()
+        )
+
+    def write(
+        self,
+        key: str,
+        rows: Iterable[tuple[Any, ...]],
+        *,
+        version: str | None = None,
+        extra: bool = False,
+    ) -> None:
+        """Write a shard and record it in the manifest."""
+        path = self._get_path(key, extra=extra)
+        # keep .gz as the last suffix, since it's used to decide whether to compress
+        tmp_path = path.with_name(f"{key}.tmp.tsv.gz")
+        count = 0
+        with (
+            span(key, f"shard:{self.table.name}", version=version) as record,
+            safe_open_writer(tmp_path) as writer,
+        ):
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+            record.rows = count
+        tmp_path.replace(path)
+        records = self.manifest.extras if extra else self.manifest.prefixes
+        records[key] = ShardRecord(version=version, count=count, date=datetime.datetime.now())
+        self._write_manifest()
+
+    def discard(self, key: str) -> None:
+        """Remove the shard for a prefix, e.g., if it couldn't be rebuilt.
+
+        Otherwise, the rows from an outdated version would get merged.
+        """
+        record = self.manifest.prefixes.pop(key, None)
+        if record is None:
+            return
+        logger.warning(
+            "[%s] discarding %s shard from version %s since it couldn't be rebuilt",
+            key,
+            self.table.name,
+            record.version,
+        )
+        self._get_path(key).unlink(missing_ok=True)
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        # the records are added in place, so pydantic considers them to be unset
+        write_pydantic_json(
+            self.manifest,
+            self.manifest_path,
+            indent=2,
+            exclude_unset=False,
+            exclude_defaults=False,
+        )
+
+    def _iter_rows(self, prefixes: Iterable[str]) -> Iterable[tuple[str, ...]]:
+        # each shard only has rows for a single prefix, and shards are
+        # visited in prefix order, so merging them is a concatenation
+        paths = [
+            self._get_path(prefix)
+            for prefix in sorted(prefixes)
+            if prefix in self.manifest.prefixes
+        ]
+        paths.extend(
+            self._get_path(key, extra=True)
+            for key, _ in self.table.extras
+            if key in self.manifest.extras
+        )
+        for path in paths:
+            with safe_open_reader(path) as reader:
+                for row in reader:
+                    yield tuple(row)
+
+    def merge(self, prefixes: Iterable[str]) -> list[Path]:
+        """Merge the shards for the given prefixes and all extras into the final outputs.
+
+        :param prefixes: The prefixes whose shards should be merged. This can include
+            prefixes that don't have shards, e.g., because they couldn't be loaded.
+
+        :returns: A sequence of paths that got created.
+        """
+        prefixes = list(prefixes)
+        versions = {
+            key: records[key].version
+            for records, keys in [
+                (self.manifest.prefixes, prefixes),
+                (self.manifest.extras, [key for key, _ in self.table.extras]),
+            ]
+            for key in keys
+            if key in records
+        }
+        with self.table.get_output(self.directory, versions=versions) as output:
+            for row in self._iter_rows(prefixes):
+                output.write(row)
+        self.manifest.merged = True
+        self._write_manifest()
+        return output.paths
+
+
+def _clear_shards(directory: str | Path | None = None) -> None:
+    """Remove the shards for all database tables."""
+    shutil.rmtree(_prep_dir(directory).joinpath("shards"), ignore_errors=True)
+
+
+def _get_table_prefixes(table: DatabaseTable, **kwargs: Unpack[IterHelperHelperDict]) -> list[str]:
+    """Get all prefixes that should be in the database table, ignoring ``skip_below``."""
+    skip_set = set(table.skip_set)
+    skip_set.update(kwargs.get("skip_set") or ())
+    return list(_prefixes(skip_set=skip_set, skip_pyobo=kwargs.get("skip_pyobo", False)))
+
+
+def _get_incomplete_prefixes(
+    prefixes: Iterable[str], shards: Iterable[TableShards], skip_below: str | None = None
+) -> list[str]:
+    """Get the prefixes that don't have complete shards with the current version."""
+    shards = list(shards)
+    rv = []
+    for prefix in prefixes:
+        if skip_below is not None and prefix < skip_below:
+            continue
+        if not any(prefix in s.manifest.prefixes for s in shards):
+            # avoid looking up the version when there are no shards to compare to
+            rv.append(prefix)
+            continue
+        version = get_version(prefix)
+        if all(s.is_complete(prefix, version) for s in shards if prefix not in s.table.skip_set):
+            logger.debug("[%s] skipping since shards for version %s are complete", prefix, version)
+            continue
+        rv.append(prefix)
+    return rv
+
+
+def _build_table(
+    table: DatabaseTable,
+    directory: str | Path | None = None,
+    *,
+    zenodo: bool = False,
+    incremental: bool = False,
+    **kwargs: Unpack[IterHelperHelperDict],
+) -> list[Path]:
+    """Build a database table in per-prefix shards, then merge them.
+
+    :param table: The database table
+    :param directory: The directory to output everything, or defaults to
+        :data:`pyobo.constants.DATABASE_DIRECTORY`.
+    :param zenodo: Should the dump be uploaded to Zenodo?
+    :param incremental: Should the shards from the last build be reused for prefixes
+        whose versions haven't changed?
+    :param kwargs: Keyword arguments passed to :func:`iter_helper_helper`
+
+    :returns: A sequence of paths that got created.
+    """
+    shards = TableShards(table, directory, force=_check_force(kwargs), incremental=incremental)
+    all_prefixes = _get_table_prefixes(table, **kwargs)
+    prefixes = _get_incomplete_prefixes(all_prefixes, [shards], kwargs.get("skip_below"))
+    built: set[str] = set()
+    for prefix, result in iter_helper_helper(table.getter, prefixes=prefixes, **kwargs):
+        shards.write(prefix, table.rows(prefix, result), version=get_version(prefix))
+        built.add(prefix)
+    for prefix in prefixes:
+        if prefix not in built:
+            shards.discard(prefix)
+    _write_extras(shards)
+    paths = shards.merge(all_prefixes)
+    if zenodo:
+        _upload(table, paths)
+    return paths
+
+
+def _check_force(kwargs: IterHelperHelperDict) -> bool:
+    return kwargs.get("force", False) or kwargs.get("force_process", False)
+
+
+def _write_extras(shards: TableShards) -> None:
+    for key, extra in shards.table.extras:
+        version = get_version(key)
+        if shards.is_complete(key, version, extra=True):
+            continue
+        click.secho(f"Extra rows for {shards.table.name} from {key}", fg="cyan", bold=True)
+        shards.write(key, extra(), version=version, extra=True)
+
+
+def _upload(table: DatabaseTable, paths: list[Path]) -> None:
+    if table.zenodo_record is None:
+        click.secho(f"No Zenodo record for {table.name}", fg="red")
+        return
+
+    from zenodo_client import update_zenodo
+
+    update_zenodo(table.zenodo_record, paths)
+
+
+def _build_fused(
+    directory: str | Path | None = None,
+    *,
+    zenodo: bool = False,
+    incremental: bool = False,
+    **kwargs: Unpack[IterHelperHelperDict],
+) -> dict[str, list[Path]]:
+    """Build all database tables while visiting each prefix only once.
+
+    :param directory: The directory to output everything, or defaults to
+        :data:`pyobo.constants.DATABASE_DIRECTORY`.
+    :param zenodo: Should the dumps be uploaded to Zenodo?
+    :param incremental: Should the shards from the last build be reused for prefixes
+        whose versions haven't changed?
+    :param kwargs: Keyword arguments passed to :func:`iter_helper_helper`
+
+    :returns: A dictionary from database table names to the paths that got created
+    """
+    force = _check_force(kwargs)
+    shards = {
+        table.name: TableShards(table, directory, force=force, incremental=incremental)
+        for table in DATABASE_TABLES
+    }
+    all_prefixes = list(
+        _prefixes(skip_set=kwargs.get("skip_set"), skip_pyobo=kwargs.get("skip_pyobo", False))
+    )
+    prefixes = _get_incomplete_prefixes(all_prefixes, shards.values(), kwargs.get("skip_below"))
+    built: defaultdict[str, set[str]] = defaultdict(set)
+    for prefix, results in iter_helper_helper(_get_fused_results, prefixes=prefixes, **kwargs):
+        version = get_version(prefix)
+        for table in DATABASE_TABLES:
+            if table.name in results:
+                rows = table.rows(prefix, results[table.name])
+                shards[table.name].write(prefix, rows, version=version)
+                built[table.name].add(prefix)
+
+    rv = {}
+    for table in DATABASE_TABLES:
+        table_shards = shards[table.name]
+        for prefix in prefixes:
+            if prefix not in built[table.name]:
+                table_shards.discard(prefix)
+        _write_extras(table_shards)
+        rv[table.name] = table_shards.merge(
+            prefix for prefix in all_prefixes if prefix not in table.skip_set
+        )
+        if zenodo:
+            _upload(table, rv[table.name])
+    return rv
@@ -51,6 +51,8 @@ BUILD_SUBDIRECTORY_NAME = "build"
 CACHE_SUBDIRECTORY_NAME = "cache"
 #: the directory for caching relations
 RELATION_SUBDIRECTORY_NAME = "relations"
+#: the directory for caching properties
+PROPERTY_SUBDIRECTORY_NAME = "properties"
 
 SPECIES_REMAPPING = {
     "Canis familiaris": "Canis lupus familiaris",
@@ -151,6 +153,12 @@ class DatabaseKwargs(TypedDict):
     skip_pyobo: bool
     #: An enumerated set of prefixes to skip
     skip_set: set[str] | None
+    #: The number of processes used to handle prefixes in parallel
+    workers: NotRequired[int | None]
+    #: The number of upcoming prefixes whose ontologies are downloaded ahead of time
+    prefetch: NotRequired[int | None]
+    #: Should only prefixes whose versions changed since the last build be rebuilt?
+    incremental: NotRequired[bool]
 
 
 class SlimGetOntologyKwargs(TypedDict):
@@ -217,6 +225,10 @@ class IterHelperHelperDict(SlimGetOntologyKwargs):
     skip_pyobo: bool
     #: An enumerated set of prefixes to skip
     skip_set: set[str] | None
+    #: The number of processes used to handle prefixes in parallel
+    workers: NotRequired[int | None]
+    #: The number of upcoming prefixes whose ontologies are downloaded ahead of time
+    prefetch: NotRequired[int | None]
 
 
 #: The ontology format
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
+import itertools
 import logging
 import pathlib
 import subprocess
@@ -10,18 +12,20 @@ import time
 import typing
 import urllib.error
 import zipfile
-from collections import Counter
+from collections import Counter, deque
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from pathlib import Path
 from textwrap import indent
-from typing import Any, TypeVar
+from types import TracebackType
+from typing import Any, Self, TypeVar, cast
 
 import bioregistry
 import click
 import pystow.utils
+import requests.adapters
 import requests.exceptions
 from bioregistry.schema import AnnotatedURL, RDFFormat
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pystow.utils import write_pydantic_json
 from tabulate import tabulate
 from tqdm.auto import tqdm
@@ -41,15 +45,20 @@ from .identifier_utils import ParseError, wrap_norm_prefix
 from .plugins import has_nomenclature_plugin, run_nomenclature_plugin
 from .struct import Obo
 from .struct.obo import from_obo_path, from_obonet
+from .struct.obo.reader import OBOParser
+from .struct.snapshot import read_snapshot, write_snapshot
 from .utils.io import safe_open_writer
 from .utils.misc import _get_version_from_artifact
 from .utils.path import ensure_path, prefix_directory_join
+from .utils.telemetry import span
 from .version import get_git_hash, get_version
 
 __all__ = [
     "REQUIRES_NO_ROBOT_CHECK",
     "SKIP",
+    "DatabaseOutput",
     "NoBuildError",
+    "OntologyPrefetcher",
     "UnhandledFormatError",
     "db_output_helper",
     "get_ontology",
@@ -101,6 +110,7 @@ def get_ontology(
     upgrade: bool = True,
     cache: bool = True,
     use_tqdm: bool = True,
+    parser: OBOParser = "obonet",
 ) -> Obo:
     """Get the OBO for a given graph.
 
@@ -116,7 +126,11 @@ def get_ontology(
         ontologies like VO.
     :param upgrade: If set to true, will automatically upgrade relationships, such as
         ``obo:chebi#part_of`` to ``BFO:0000051``
-    :param cache: Should cached objects be written? defaults to True
+    :param cache: Should cached objects be written? defaults to True. This includes a
+        binary snapshot of the built ontology, which is loaded directly on subsequent
+        calls unless ``force`` or ``force_process`` are given.
+    :param parser: The parser used for OBO flat files. Use ``native`` for PyOBO's
+        streaming parser, which avoids building an intermediate :mod:`obonet` graph.
 
     :returns: An OBO object
 
@@ -135,7 +149,8 @@ def get_ontology(
     if force:
         force_process = True
     if has_nomenclature_plugin(prefix):
-        obo = run_nomenclature_plugin(prefix, version=version)
+        with span(prefix, "plugin"):
+            obo = run_nomenclature_plugin(prefix, version=version)
         if cache:
             logger.debug("[%s] caching nomenclature plugin", prefix)
             obo.write_default(force=force_process)
@@ -149,14 +164,36 @@ def get_ontology(
         version = _get_version_from_artifact(prefix)
         logger.info(f"[%s] current version is {version}", prefix)
 
+    # these change how the ontology is built, so a snapshot can only be reused if it was
+    # built with the same ones
+    settings = {"strict": strict, "upgrade": upgrade, "parser": parser}
+    if cache:
+        snapshot_path = prefix_directory_join(
+            prefix, BUILD_SUBDIRECTORY_NAME, name=f"{prefix}.obo.pickle", version=version
+        )
+        with span(prefix, "read_snapshot") as record:
+            snapshot = None if force_process else read_snapshot(snapshot_path, settings=settings)
+            record.extras["hit"] = snapshot is not None
+        if snapshot is not None:
+            logger.debug("[%s] using snapshot at %s", prefix, snapshot_path)
+            return snapshot
+    else:
+        snapshot_path = None
+
     if force_process:
         obonet_json_gz_path = None
+    elif parser != "obonet":
+        logger.debug("[%s] not using the obonet parser, so dont look for an obonet file", prefix)
+        obonet_json_gz_path = None
     elif not cache:
         logger.debug("[%s] caching was turned off, so dont look for an obonet file", prefix)
         obonet_json_gz_path = None
     else:
         obonet_json_gz_path = prefix_directory_join(
-            prefix, BUILD_SUBDIRECTORY_NAME, name=f"{prefix}.obonet.json.gz", version=version
+            prefix,
+            BUILD_SUBDIRECTORY_NAME,
+            name=_get_obonet_cache_name(prefix, strict=strict, upgrade=upgrade),
+            version=version,
         )
         logger.debug(
             "[%s] caching is turned on, so look for an obonet file at %s",
@@ -167,37 +204,48 @@ def get_ontology(
             from .utils.cache import get_gzipped_graph
 
             logger.debug("[%s] using obonet cache at %s", prefix, obonet_json_gz_path)
-            return from_obonet(
-                get_gzipped_graph(obonet_json_gz_path),
-                strict=strict,
-                version=version,
-                upgrade=upgrade,
-                use_tqdm=use_tqdm,
-            )
+            with span(prefix, "read_obonet_cache"):
+                graph = get_gzipped_graph(obonet_json_gz_path)
+            with span(prefix, "from_obonet"):
+                obo = from_obonet(
+                    graph,
+                    strict=strict,
+                    version=version,
+                    upgrade=upgrade,
+                    use_tqdm=use_tqdm,
+                )
+            _write_snapshot(obo, snapshot_path, settings)
+            return obo
         else:
             logger.debug("[%s] no obonet cache found at %s", prefix, obonet_json_gz_path)
 
-    path_pack = _ensure_ontology_path(prefix, force=force, version=version)
+    with span(prefix, "download", version=version):
+        path_pack = _ensure_ontology_path(prefix, force=force, version=version)
     if path_pack is None:
         raise NoBuildError(prefix)
     ontology_format, path, rdf_format = path_pack
     if ontology_format == "obo":
         pass  # all gucci
     elif ontology_format in {"owl", "rdf"}:
-        path = _convert_to_obo(path)
+        with span(prefix, "robot_convert"):
+            path = _convert_to_obo(path)
     elif ontology_format == "json":
         from .struct.obograph import read_obograph
 
-        obo = read_obograph(prefix=prefix, path=path)
+        with span(prefix, "parse_obograph"):
+            obo = read_obograph(prefix=prefix, path=path)
         if cache:
             obo.write_default(force=force_process)
+        _write_snapshot(obo, snapshot_path, _without_parser(settings))
         return obo
     elif ontology_format == "skos":
         from .struct.skos import read_skos
 
-        obo = read_skos(prefix=prefix, path=path, rdf_format=rdf_format)
+        with span(prefix, "parse_skos"):
+            obo = read_skos(prefix=prefix, path=path, rdf_format=rdf_format)
         if cache:
             obo.write_default(force=force)
+        _write_snapshot(obo, snapshot_path, _without_parser(settings))
         return obo
     else:
         raise UnhandledFormatError(f"[{prefix}] unhandled ontology file format: {path.suffix}")
@@ -209,13 +257,38 @@ def get_ontology(
         version=version,
         upgrade=upgrade,
         use_tqdm=use_tqdm,
+        parser=parser,
         _cache_path=obonet_json_gz_path,
     )
     if cache:
         obo.write_default(force=force_process)
+    _write_snapshot(obo, snapshot_path, settings)
     return obo
 
 
+def _get_obonet_cache_name(prefix: str, *, strict: bool, upgrade: bool) -> str:
+    """Get the name of the obonet cache, which is keyed on the settings it was built with."""
+    parts = [prefix]
+    if strict:
+        parts.append("strict")
+    if not upgrade:
+        parts.append("no-upgrade")
+    return ".".join(parts) + ".obonet.json.gz"
+
+
+def _without_parser(settings: Mapping[str, Any]) -> dict[str, Any]:
+    # the OBO parser has no effect on other formats, so it's not stored in their snapshots
+    return {key: value for key, value in settings.items() if key != "parser"}
+
+
+def _write_snapshot(obo: Obo, path: Path | None, settings: Mapping[str, Any]) -> None:
+    if path is None:
+        return
+    logger.debug("[%s] writing snapshot to %s", obo.ontology, path)
+    with span(obo.ontology, "write_snapshot"):
+        write_snapshot(obo, path, settings=settings)
+
+
 ONTOLOGY_FORMAT_TO_SUFFIX: dict[OntologyFormat, str] = {
     "skos": ".ttl",
 }
@@ -238,9 +311,10 @@ def _name_from_url(
     return name
 
 
-def _ensure_ontology_path(
-    prefix: str, *, force: bool, version: str | None
-) -> OntologyPathPack | None:
+def _iter_ontology_downloads(
+    prefix: str,
+) -> Iterable[tuple[OntologyFormat, str, RDFFormat | None, str]]:
+    """Iterate over the formats, URLs, RDF formats, and file names to try downloading."""
     rdf_format: RDFFormat | None
     for ontology_format, getter in ONTOLOGY_GETTERS:
         match getter(prefix):
@@ -255,7 +329,13 @@ def _ensure_ontology_path(
                 raise TypeError
 
         name = _name_from_url(url, ontology_format, rdf_format=rdf_format)
+        yield ontology_format, url, rdf_format, name
 
+
+def _ensure_ontology_path(
+    prefix: str, *, force: bool, version: str | None
+) -> OntologyPathPack | None:
+    for ontology_format, url, rdf_format, name in _iter_ontology_downloads(prefix):
         try:
             path = ensure_path(
                 prefix, url=url, force=force, version=version, name=name, backend="requests"
@@ -269,6 +349,144 @@ def _ensure_ontology_path(
     return None
 
 
+#: The number of bytes read at a time while prefetching
+PREFETCH_CHUNK_SIZE = 1 << 20
+
+#: The connect and read timeouts, in seconds, used while prefetching
+PREFETCH_TIMEOUT = (10, 300)
+
+
+class OntologyPrefetcher:
+    """Download the ontologies for upcoming prefixes in a thread pool.
+
+    Files are downloaded to the same paths as in :func:`get_ontology`, so when the
+    ontology for a prefix is later built, the download is skipped. All downloads share
+    one HTTP session, so connections to the same hosts get reused.
+
+    Prefetching is best effort. If a download fails, it's logged and the ontology is
+    downloaded as usual when it's built, which reports the error properly.
+
+    .. code-block:: python
+
+        from pyobo.getters import OntologyPrefetcher, get_ontology
+
+        prefixes = ["go", "chebi", "doid"]
+        with OntologyPrefetcher(workers=2) as prefetcher:
+            for prefix in prefixes:
+                prefetcher.submit(prefix)
+            for prefix in prefixes:
+                prefetcher.wait(prefix)
+                ontology = get_ontology(prefix)
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        version: str | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        """Prepare a prefetcher.
+
+        :param workers: The number of downloads to run at the same time
+        :param version: The pre-looked-up version for all prefixes. If not given, it's
+            looked up for each prefix the same way as in :func:`get_ontology`.
+        :param session: The HTTP session used for all downloads. If not given, one is
+            made and closed with the prefetcher.
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        self.version = version
+        self._close_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._futures: dict[str, Future[OntologyPathPack | None]] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel pending downloads, wait for running ones, and close the session."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._close_session:
+            self.session.close()
+
+    def submit(self, prefix: str) -> None:
+        """Start downloading the ontology for the prefix, unless it was already started."""
+        if prefix not in self._futures:
+            self._futures[prefix] = self._executor.submit(self._prefetch_handled, prefix)
+
+    def wait(self, prefix: str) -> OntologyPathPack | None:
+        """Wait for the download of the ontology for the prefix, if it was started.
+
+        :param prefix: The prefix of the ontology
+        :returns: The format and path of the downloaded ontology, if it was downloaded
+            or already available, otherwise None
+        """
+        future = self._futures.pop(prefix, None)
+        if future is None or future.cancelled():
+            return None
+        return future.result()
+
+    def _prefetch_handled(self, prefix: str) -> OntologyPathPack | None:
+        try:
+            with span(prefix, "prefetch"):
+                return self._prefetch(prefix)
+        except Exception:
+            logger.debug("[%s] could not prefetch", prefix, exc_info=True)
+            return None
+
+    def _prefetch(self, prefix: str) -> OntologyPathPack | None:
+        # these mirror the cases in get_ontology where nothing gets downloaded
+        if has_nomenclature_plugin(prefix):
+            return None
+        version = self.version or _get_version_from_artifact(prefix)
+        for name in [f"{prefix}.obo.pickle", f"{prefix}.obonet.json.gz"]:
+            if prefix_directory_join(
+                prefix, BUILD_SUBDIRECTORY_NAME, name=name, version=version, ensure_exists=False
+            ).is_file():
+                return None
+
+        for ontology_format, url, rdf_format, name in _iter_ontology_downloads(prefix):
+            path = prefix_directory_join(prefix, name=name, version=version)
+            if not path.is_file():
+                try:
+                    _download_with_session(self.session, url, path)
+                except requests.exceptions.RequestException as e:
+                    logger.debug("[%s] could not prefetch %s - %s", prefix, url, e)
+                    continue
+            return OntologyPathPack(ontology_format, path, rdf_format)
+        return None
+
+
+def _download_with_session(session: requests.Session, url: str, path: Path) -> None:
+    """Download the URL to a temporary file, then move it to the path."""
+    tmp_path = path.with_name(path.name + ".prefetch")
+    try:
+        with session.get(url, stream=True, timeout=PREFETCH_TIMEOUT) as res:
+            res.raise_for_status()
+            with tmp_path.open("wb") as file:
+                for chunk in res.iter_content(chunk_size=PREFETCH_CHUNK_SIZE):
+                    file.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(path)
+
+
 #: A dictionary of prefixes to skip during full build with reasons as values
 SKIP: dict[str, str] = {
     "ncbigene": "too big, refs acquired from other dbs",
@@ -310,19 +528,25 @@ def iter_helper(
 ) -> Iterable[tuple[str, str, X]]:
     """Yield all mappings extracted from each database given."""
     for prefix, mapping in iter_helper_helper(f, **kwargs):
-        it = tqdm(
-            mapping.items(),
-            desc=f"iterating {prefix}",
-            leave=leave,
-            unit_scale=True,
-            disable=None,
-        )
-        for key, value in it:
-            if isinstance(value, str):
-                value = value.strip('"').replace("\n", " ").replace("\t", " ").replace("  ", " ")
-            # TODO deal with when this is not a string?
-            if value:
-                yield prefix, key, value
+        yield from _iter_mapping_rows(prefix, mapping, leave=leave)
+
+
+def _iter_mapping_rows(
+    prefix: str, mapping: Mapping[str, X], leave: bool = False
+) -> Iterable[tuple[str, str, X]]:
+    it = tqdm(
+        mapping.items(),
+        desc=f"iterating {prefix}",
+        leave=leave,
+        unit_scale=True,
+        disable=None,
+    )
+    for key, value in it:
+        if isinstance(value, str):
+            value = value.strip('"').replace("\n", " ").replace("\t", " ").replace("  ", " ")
+        # TODO deal with when this is not a string?
+        if value:
+            yield prefix, key, value
 
 
 def _prefixes(
@@ -362,6 +586,9 @@ def iter_helper_helper(
     skip_below: str | None = None,
     skip_pyobo: bool = False,
     skip_set: set[str] | None = None,
+    workers: int | None = None,
+    prefixes: Sequence[str] | None = None,
+    prefetch: int | None = None,
     **kwargs: Unpack[SlimGetOntologyKwargs],
 ) -> Iterable[tuple[str, X]]:
     """Yield all mappings extracted from each database given.
@@ -373,6 +600,15 @@ def iter_helper_helper(
         iterative curation
     :param skip_pyobo: If true, skip sources implemented in PyOBO
     :param skip_set: A pre-defined blacklist to skip
+    :param workers: If more than one, ``f`` is run for several prefixes at the same time
+        in a process pool with this many workers. In this case, ``f`` and its results
+        must be picklable. Results are still yielded in the same order as prefixes.
+    :param prefixes: An explicit sequence of prefixes to use instead of the ones
+        selected from the Bioregistry with ``skip_below``, ``skip_pyobo``, and
+        ``skip_set``
+    :param prefetch: If given, download the ontologies for this many upcoming prefixes
+        in a thread pool while ``f`` runs on the current one. This has no effect when
+        forcing, nor in a process pool, where downloads already run at the same time.
     :param strict: If true, will raise exceptions and crash the program instead of
         logging them.
     :param kwargs: Keyword arguments passed to ``f``.
@@ -384,75 +620,149 @@ def iter_helper_helper(
 
     :yields: A prefix and the result of the callable ``f``
     """
-    from robot_obo_tool import ROBOTError
-
-    strict = kwargs.get("strict", True)
-    prefixes = list(
-        _prefixes(
-            skip_set=skip_set,
-            skip_below=skip_below,
-            skip_pyobo=skip_pyobo,
+    if prefixes is None:
+        prefixes = list(
+            _prefixes(
+                skip_set=skip_set,
+                skip_below=skip_below,
+                skip_pyobo=skip_pyobo,
+            )
         )
-    )
+    if workers is None or workers <= 1:
+        results = _iter_calls(f, prefixes, kwargs, prefetch=prefetch)
+    else:
+        results = _iter_calls_parallel(f, prefixes, kwargs, workers)
     prefix_it = tqdm(
-        prefixes, disable=not use_tqdm, desc=f"Building with {f.__name__}()", unit="resource"
+        results,
+        total=len(prefixes),
+        disable=not use_tqdm,
+        desc=f"Building with {f.__name__}()",
+        unit="resource",
     )
-    for prefix in prefix_it:
+    for prefix, (success, yv) in prefix_it:
         prefix_it.set_postfix(prefix=prefix)
-        tqdm.write(
-            click.style(f"\n{prefix} - {bioregistry.get_name(prefix)}", fg="green", bold=True)
-        )
-        try:
-            yv = f(prefix, **kwargs)
-        except (UnhandledFormatError, NoBuildError) as e:
-            # make sure this comes before the other runtimeerror catch
-            logger.warning("[%s] %s", prefix, e)
-        except urllib.error.HTTPError as e:
-            logger.warning("[%s] HTTP %s: unable to download %s", prefix, e.getcode(), e.geturl())
-            if strict and not bioregistry.is_deprecated(prefix):
-                raise
-        except urllib.error.URLError as e:
-            logger.warning("[%s] unable to download - %s", prefix, e.reason)
-            if strict and not bioregistry.is_deprecated(prefix):
-                raise
-        except requests.exceptions.ConnectTimeout as e:
-            logger.warning("[%s] unable to download - %s", prefix, e)
-            if strict and not bioregistry.is_deprecated(prefix):
-                raise
-        except ParseError as e:
-            if not e.node:
-                logger.warning("[%s] %s", prefix, e)
-            else:
-                logger.warning(str(e))
-            if strict and not bioregistry.is_deprecated(prefix):
-                raise e
-        except RuntimeError as e:
-            if "DrugBank" not in str(e):
-                raise
-            logger.warning("[drugbank] invalid credentials")
-        except (subprocess.CalledProcessError, ROBOTError):
-            logger.warning("[%s] ROBOT was unable to convert OWL to OBO", prefix)
-        except ValueError as e:
-            if _is_xml(e):
-                # this means that it tried doing parsing on an xml page
-                logger.warning(
-                    "no resource available for %s. See http://www.obofoundry.org/ontology/%s",
-                    prefix,
-                    prefix,
-                )
-            else:
-                logger.exception(
-                    "[%s] got exception %s while parsing", prefix, e.__class__.__name__
+        if success:
+            yield prefix, cast(X, yv)
+
+
+def _announce_prefix(prefix: str) -> None:
+    tqdm.write(click.style(f"\n{prefix} - {bioregistry.get_name(prefix)}", fg="green", bold=True))
+
+
+def _iter_calls(
+    f: Callable[[str, Unpack[GetOntologyKwargs]], X],
+    prefixes: Sequence[str],
+    kwargs: SlimGetOntologyKwargs,
+    *,
+    prefetch: int | None = None,
+) -> Iterable[tuple[str, tuple[bool, X | None]]]:
+    if not prefetch or kwargs.get("force"):
+        for prefix in prefixes:
+            _announce_prefix(prefix)
+            yield prefix, _call_handled(f, prefix, kwargs)
+        return
+
+    with OntologyPrefetcher(workers=prefetch) as prefetcher:
+        for i, prefix in enumerate(prefixes):
+            for upcoming in prefixes[i : i + prefetch + 1]:
+                prefetcher.submit(upcoming)
+            _announce_prefix(prefix)
+            # make sure the download is finished so it doesn't get started again
+            prefetcher.wait(prefix)
+            yield prefix, _call_handled(f, prefix, kwargs)
+
+
+def _iter_calls_parallel(
+    f: Callable[[str, Unpack[GetOntologyKwargs]], X],
+    prefixes: Iterable[str],
+    kwargs: SlimGetOntologyKwargs,
+    workers: int,
+) -> Iterable[tuple[str, tuple[bool, X | None]]]:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    prefix_it = iter(prefixes)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    # only keep a bounded number of results in flight, so memory
+    # doesn't grow if the consumer is slower than the workers
+    pending: deque[tuple[str, Future[tuple[bool, X | None]]]] = deque()
+    try:
+        for prefix in itertools.islice(prefix_it, 2 * workers):
+            pending.append((prefix, executor.submit(_call_handled, f, prefix, kwargs)))
+        while pending:
+            prefix, future = pending.popleft()
+            for next_prefix in itertools.islice(prefix_it, 1):
+                pending.append(
+                    (next_prefix, executor.submit(_call_handled, f, next_prefix, kwargs))
                 )
-        except zipfile.BadZipFile as e:
-            # This can happen if there's an error on UMLS
-            logger.exception("[%s] got exception %s while parsing", prefix, e.__class__.__name__)
-        except TypeError as e:
-            logger.exception("[%s] got exception %s while parsing", prefix, e.__class__.__name__)
-            if strict:
-                raise e
+            _announce_prefix(prefix)
+            # if the worker raised an exception, it gets re-raised here
+            yield prefix, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _call_handled(
+    f: Callable[[str, Unpack[GetOntologyKwargs]], X],
+    prefix: str,
+    kwargs: SlimGetOntologyKwargs,
+) -> tuple[bool, X | None]:
+    """Call the function on the prefix and handle errors that shouldn't stop a build.
+
+    :returns: A pair of whether the function returned successfully and its result
+    """
+    from robot_obo_tool import ROBOTError
+
+    strict = kwargs.get("strict", True)
+    try:
+        yv = f(prefix, **kwargs)
+    except (UnhandledFormatError, NoBuildError) as e:
+        # make sure this comes before the other runtimeerror catch
+        logger.warning("[%s] %s", prefix, e)
+    except urllib.error.HTTPError as e:
+        logger.warning("[%s] HTTP %s: unable to download %s", prefix, e.getcode(), e.geturl())
+        if strict and not bioregistry.is_deprecated(prefix):
+            raise
+    except urllib.error.URLError as e:
+        logger.warning("[%s] unable to download - %s", prefix, e.reason)
+        if strict and not bioregistry.is_deprecated(prefix):
+            raise
+    except requests.exceptions.ConnectTimeout as e:
+        logger.warning("[%s] unable to download - %s", prefix, e)
+        if strict and not bioregistry.is_deprecated(prefix):
+            raise
+    except ParseError as e:
+        if not e.node:
+            logger.warning("[%s] %s", prefix, e)
         else:
-            yield prefix, yv
+            logger.warning(str(e))
+        if strict and not bioregistry.is_deprecated(prefix):
+            raise
+    except RuntimeError as e:
+        if "DrugBank" not in str(e):
+            raise
+        logger.warning("[drugbank] invalid credentials")
+    except (subprocess.CalledProcessError, ROBOTError):
+        logger.warning("[%s] ROBOT was unable to convert OWL to OBO", prefix)
+    except ValueError as e:
+        if _is_xml(e):
+            # this means that it tried doing parsing on an xml page
+            logger.warning(
+                "no resource available for %s. See http://www.obofoundry.org/ontology/%s",
+                prefix,
+                prefix,
+            )
+        else:
+            logger.exception("[%s] got exception %s while parsing", prefix, e.__class__.__name__)
+    except zipfile.BadZipFile as e:
+        # This can happen if there's an error on UMLS
+        logger.exception("[%s] got exception %s while parsing", prefix, e.__class__.__name__)
+    except TypeError as e:
+        logger.exception("[%s] got exception %s while parsing", prefix, e.__class__.__name__)
+        if strict:
+            raise
+    else:
+        return True, yv
+    return False, None
 
 
 def _is_xml(e: Exception) -> bool:
@@ -461,7 +771,7 @@ def _is_xml(e: Exception) -> bool:
     )
 
 
-def _prep_dir(directory: None | str | pathlib.Path) -> pathlib.Path:
+def _prep_dir(directory: str | pathlib.Path | None) -> pathlib.Path:
     if directory is None:
         rv = DATABASE_DIRECTORY
     elif isinstance(directory, str):
@@ -479,7 +789,7 @@ def db_output_helper(
     db_name: str,
     columns: Sequence[str],
     *,
-    directory: None | str | pathlib.Path = None,
+    directory: str | pathlib.Path | None = None,
     strict: bool = False,
     use_gzip: bool = True,
     summary_detailed: Sequence[int] | None = None,
@@ -496,79 +806,155 @@ def db_output_helper(
 
     :returns: A sequence of paths that got created.
     """
-    start = time.time()
-    directory = _prep_dir(directory)
+    with DatabaseOutput(
+        db_name,
+        columns,
+        directory=directory,
+        use_gzip=use_gzip,
+        summary_detailed=summary_detailed,
+    ) as output:
+        for row in it:
+            output.write(row)
+    return output.paths
 
-    c: typing.Counter[str] = Counter()
-    c_detailed: typing.Counter[tuple[str, ...]] = Counter()
 
-    if use_gzip:
-        db_path = directory.joinpath(f"{db_name}.tsv.gz")
-    else:
-        db_path = directory.joinpath(f"{db_name}.tsv")
-    db_sample_path = directory.joinpath(f"{db_name}_sample.tsv")
-    db_summary_path = directory.joinpath(f"{db_name}_summary.tsv")
-    db_summary_detailed_path = directory.joinpath(f"{db_name}_summary_detailed.tsv")
-    db_metadata_path = directory.joinpath(f"{db_name}_metadata.json")
-    rv: list[tuple[str, pathlib.Path]] = [
-        ("Metadata", db_metadata_path),
-        ("Data", db_path),
-        ("Sample", db_sample_path),
-        ("Summary", db_summary_path),
-    ]
-
-    logger.info("writing %s to %s", db_name, db_path)
-    logger.info("writing %s sample to %s", db_name, db_sample_path)
-    sample_rows = []
-
-    with safe_open_writer(db_path) as writer:
-        # for the first 10 rows, put it in a sample file too
-        with safe_open_writer(db_sample_path) as sample_writer:
-            # write header
-            writer.writerow(columns)
-            sample_writer.writerow(columns)
-
-            for row, _ in zip(it, range(10), strict=False):
-                c[row[0]] += 1
-                if summary_detailed is not None:
-                    c_detailed[tuple(row[i] for i in summary_detailed)] += 1
-                writer.writerow(row)
-                sample_writer.writerow(row)
-                sample_rows.append(row)
-
-        # continue just in the gzipped one
-        for row in it:
-            c[row[0]] += 1
-            if summary_detailed is not None:
-                c_detailed[tuple(row[i] for i in summary_detailed)] += 1
-            writer.writerow(row)
-
-    with safe_open_writer(db_summary_path) as summary_writer:
-        summary_writer.writerows(c.most_common())
-
-    if summary_detailed is not None:
-        logger.info(f"writing {db_name} detailed summary to {db_summary_detailed_path}")
-        with safe_open_writer(db_summary_detailed_path) as detailed_summary_writer:
-            detailed_summary_writer.writerows((*keys, v) for keys, v in c_detailed.most_common())
-        rv.append(("Summary (Detailed)", db_summary_detailed_path))
-
-    database_metadata = DatabaseMetadata(
-        version=get_version(),
-        git_hash=get_git_hash(),
-        date=datetime.datetime.now(),
-        count=sum(c.values()),
-    )
-    write_pydantic_json(database_metadata, db_metadata_path, indent=2)
+class DatabaseOutput:
+    """A sink for the rows of a database build, used by :func:`db_output_helper`.
 
-    elapsed = time.time() - start
-    click.secho(f"\nWrote the following files in {elapsed:.1f} seconds\n", fg="green")
-    click.secho(indent(tabulate(rv), " "), fg="green")
+    This is useful when the rows for several databases are produced at the same time,
+    since the data, sample, summary, and metadata files for each can be written
+    together in a single pass.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        columns: Sequence[str],
+        *,
+        directory: str | pathlib.Path | None = None,
+        use_gzip: bool = True,
+        summary_detailed: Sequence[int] | None = None,
+        versions: Mapping[str, str | None] | None = None,
+    ) -> None:
+        """Prepare the output files for a database.
+
+        :param db_name: name of the output resource (e.g., "alts", "names")
+        :param columns: The names of the columns
+        :param directory: The directory to output everything, or defaults to
+            :data:`pyobo.constants.DATABASE_DIRECTORY`.
+        :param use_gzip: Should the data file be compressed?
+        :param summary_detailed: The positions of columns to count in a detailed summary
+        :param versions: The versions of the resources that the rows come from, which
+            are recorded in the metadata
+        """
+        self.start = time.time()
+        self.db_name = db_name
+        self.columns = columns
+        self.summary_detailed = summary_detailed
+        self.versions = dict(versions or {})
+        self.directory = _prep_dir(directory)
+
+        self.counter: typing.Counter[str] = Counter()
+        self.counter_detailed: typing.Counter[tuple[str, ...]] = Counter()
+        self.sample_rows: list[tuple[Any, ...]] = []
+
+        if use_gzip:
+            self.db_path = self.directory.joinpath(f"{db_name}.tsv.gz")
+        else:
+            self.db_path = self.directory.joinpath(f"{db_name}.tsv")
+        self.db_sample_path = self.directory.joinpath(f"{db_name}_sample.tsv")
+        self.db_summary_path = self.directory.joinpath(f"{db_name}_summary.tsv")
+        self.db_summary_detailed_path = self.directory.joinpath(f"{db_name}_summary_detailed.tsv")
+        self.db_metadata_path = self.directory.joinpath(f"{db_name}_metadata.json")
+        self._labeled_paths: list[tuple[str, pathlib.Path]] = [
+            ("Metadata", self.db_metadata_path),
+            ("Data", self.db_path),
+            ("Sample", self.db_sample_path),
+            ("Summary", self.db_summary_path),
+        ]
+        self._stack = contextlib.ExitStack()
+        self._sample_stack = contextlib.ExitStack()
+        self._writer: Any = None
+        self._sample_writer: Any = None
+
+    @property
+    def paths(self) -> list[pathlib.Path]:
+        """Get the paths that get created."""
+        return [path for _, path in self._labeled_paths]
+
+    def __enter__(self) -> Self:
+        self._span_context = span(None, f"database:{self.db_name}")
+        self._span = self._span_context.__enter__()
+        logger.info("writing %s to %s", self.db_name, self.db_path)
+        logger.info("writing %s sample to %s", self.db_name, self.db_sample_path)
+        self._writer = self._stack.enter_context(safe_open_writer(self.db_path))
+        # for the first 10 rows, put it in a sample file too
+        self._sample_writer = self._sample_stack.enter_context(
+            safe_open_writer(self.db_sample_path)
+        )
+        # write header
+        self._writer.writerow(self.columns)
+        self._sample_writer.writerow(self.columns)
+        return self
+
+    def write(self, row: tuple[Any, ...]) -> None:
+        """Write a row."""
+        self.counter[row[0]] += 1
+        if self.summary_detailed is not None:
+            self.counter_detailed[tuple(row[i] for i in self.summary_detailed)] += 1
+        self._writer.writerow(row)
+        if self._sample_writer is not None:
+            self._sample_writer.writerow(row)
+            self.sample_rows.append(row)
+            if len(self.sample_rows) >= 10:
+                # continue just in the gzipped one
+                self._sample_writer = None
+                self._sample_stack.close()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._sample_stack.close()
+        self._stack.close()
+        if exc_type is None:
+            self._finish()
+        self._span_context.__exit__(exc_type, exc_value, traceback)
+
+    def _finish(self) -> None:
+        # the time spent writing the summary and metadata is included in the span
+        self._span.rows = sum(self.counter.values())
+        with safe_open_writer(self.db_summary_path) as summary_writer:
+            summary_writer.writerows(self.counter.most_common())
+
+        if self.summary_detailed is not None:
+            logger.info(
+                f"writing {self.db_name} detailed summary to {self.db_summary_detailed_path}"
+            )
+            with safe_open_writer(self.db_summary_detailed_path) as detailed_summary_writer:
+                detailed_summary_writer.writerows(
+                    (*keys, v) for keys, v in self.counter_detailed.most_common()
+                )
+            self._labeled_paths.append(("Summary (Detailed)", self.db_summary_detailed_path))
+
+        database_metadata = DatabaseMetadata(
+            version=get_version(),
+            git_hash=get_git_hash(),
+            date=datetime.datetime.now(),
+            count=sum(self.counter.values()),
+            versions=self.versions,
+        )
+        write_pydantic_json(database_metadata, self.db_metadata_path, indent=2)
 
-    click.secho("\nSample rows:\n", fg="green")
-    click.secho(indent(tabulate(sample_rows, headers=columns), " "), fg="green")
-    click.echo()
+        elapsed = time.time() - self.start
+        click.secho(f"\nWrote the following files in {elapsed:.1f} seconds\n", fg="green")
+        click.secho(indent(tabulate(self._labeled_paths), " "), fg="green")
 
-    return [path for _, path in rv]
+        click.secho("\nSample rows:\n", fg="green")
+        click.secho(indent(tabulate(self.sample_rows, headers=self.columns), " "), fg="green")
+        click.echo()
 
 
 class DatabaseMetadata(BaseModel):
@@ -578,3 +964,5 @@ class DatabaseMetadata(BaseModel):
     git_hash: str  # PyOBO git hash
     date: datetime.datetime
     count: int
+    #: The versions of the resources that were included, if they were resolved
+    versions: dict[str, str | None] = Field(default_factory=dict)
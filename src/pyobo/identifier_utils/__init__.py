@@ -3,9 +3,11 @@
 from curies_processing import get_rules
 
 from .api import (
+    PARSE_CACHE_SIZE,
     DefaultCoercionError,
     EmptyStringError,
     NotCURIEError,
+    ParseCacheInfo,
     ParseError,
     ParseValidationError,
     Reference,
@@ -13,26 +15,40 @@ from .api import (
     UnregisteredPrefixError,
     _is_valid_identifier,
     _parse_str_or_curie_or_uri_helper,
+    clear_parse_cache,
     get_converter,
+    get_parse_cache_info,
     standardize_ec,
     wrap_norm_prefix,
 )
+from .interning import ReferencePool, get_reference_pool, intern_reference
 from .relations import ground_relation
+from .trusted import ReferenceFactory, get_reference_factory, trusted_reference
 
 __all__ = [
+    "PARSE_CACHE_SIZE",
     "DefaultCoercionError",
     "EmptyStringError",
     "NotCURIEError",
+    "ParseCacheInfo",
     "ParseError",
     "ParseValidationError",
     "Reference",
+    "ReferenceFactory",
+    "ReferencePool",
     "UnparsableIRIError",
     "UnregisteredPrefixError",
     "_is_valid_identifier",
     "_parse_str_or_curie_or_uri_helper",
+    "clear_parse_cache",
     "get_converter",
+    "get_parse_cache_info",
+    "get_reference_factory",
+    "get_reference_pool",
     "get_rules",
     "ground_relation",
+    "intern_reference",
     "standardize_ec",
+    "trusted_reference",
     "wrap_norm_prefix",
 ]
@@ -5,7 +5,16 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from functools import lru_cache, wraps
-from typing import Annotated, Any, ClassVar, Concatenate, ParamSpec, TypeVar
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Concatenate,
+    NamedTuple,
+    ParamSpec,
+    TypeAlias,
+    TypeVar,
+)
 
 import bioregistry
 import click
@@ -15,19 +24,24 @@ from curies_processing import get_rules
 from pydantic import ValidationError
 from typing_extensions import Doc
 
+from .interning import get_reference_pool
 from .reference import Reference
 from .relations import ground_relation
 
 __all__ = [
+    "PARSE_CACHE_SIZE",
     "DefaultCoercionError",
     "EmptyStringError",
     "NotCURIEError",
+    "ParseCacheInfo",
     "ParseError",
     "ParseValidationError",
     "Reference",
     "UnparsableIRIError",
     "UnregisteredPrefixError",
     "_parse_str_or_curie_or_uri_helper",
+    "clear_parse_cache",
+    "get_parse_cache_info",
     "standardize_ec",
     "wrap_norm_prefix",
 ]
@@ -37,6 +51,8 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_REFERENCE_POOL = get_reference_pool()
+
 Line = Annotated[str | None, Doc("""The OBO line where the parsing happened""")]
 
 
@@ -63,6 +79,12 @@ class ParseError(BaseException):
         self.predicate = predicate
         self.line = line
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the default pickling calls the class with ``args``, which doesn't work with
+        # the keyword-only arguments, so errors raised in a process pool couldn't get
+        # back to the parent process. Instead, rebuild the error from its attributes.
+        return _rebuild_parse_error, (self.__class__, self.__dict__)
+
     def __str__(self) -> str:
         s = ""
         if self.node:
@@ -80,6 +102,12 @@ class ParseError(BaseException):
         return s
 
 
+def _rebuild_parse_error(cls: type[ParseError], state: dict[str, Any]) -> ParseError:
+    rv = cls.__new__(cls)
+    rv.__dict__.update(state)
+    return rv
+
+
 class ParseValidationError(ParseError):
     """Raised on a validation error."""
 
@@ -147,6 +175,43 @@ def get_converter() -> PreprocessingConverter:
     )
 
 
+#: The maximum number of entries in the memo cache used by
+#: :func:`_parse_str_or_curie_or_uri_helper`
+PARSE_CACHE_SIZE = 2**16
+
+#: Represents a failed parse as the error class, the cleaned string,
+#: and the validation error (for :class:`ParseValidationError`)
+_ParseFailure: TypeAlias = tuple[type[ParseError], str, ValidationError | None]
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics about the memo cache used for parsing CURIEs and IRIs."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were served by the cache."""
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+
+def get_parse_cache_info() -> ParseCacheInfo:
+    """Get statistics about the CURIE and IRI parsing memo cache."""
+    hits, misses, maxsize, currsize = _parse_str_or_curie_or_uri_cached.cache_info()
+    return ParseCacheInfo(hits=hits, misses=misses, maxsize=maxsize, currsize=currsize)
+
+
+def clear_parse_cache() -> None:
+    """Clear the CURIE and IRI parsing memo cache and its statistics."""
+    _parse_str_or_curie_or_uri_cached.cache_clear()
+
+
 def _parse_str_or_curie_or_uri_helper(
     str_or_curie_or_uri: str,
     *,
@@ -168,17 +233,50 @@ def _parse_str_or_curie_or_uri_helper(
     - Normalizes the namespace
     - Checks against a blacklist for the entire curie, for the namespace, and for
       suffixes.
+
+    The outcome only depends on the string, the ontology prefix, whether to upgrade,
+    and the name, so it's memoized on those (see :func:`get_parse_cache_info`). The
+    node, predicate, line, and context are only used to construct errors.
     """
-    str_or_curie_or_uri = _preclean_uri(str_or_curie_or_uri)
-    if not str_or_curie_or_uri:
-        return EmptyStringError(
-            str_or_curie_or_uri,
+    rv = _parse_str_or_curie_or_uri_cached(str_or_curie_or_uri, ontology_prefix, upgrade, name)
+    if rv is None:
+        return BlocklistError()
+    if not isinstance(rv, tuple):
+        # the memo cache only covers recently parsed strings, whereas the
+        # pool shares references for as long as anything uses them
+        return _REFERENCE_POOL.intern(rv)
+    error_cls, curie, exc = rv
+    if exc is not None:
+        return ParseValidationError(
+            curie,
             ontology_prefix=ontology_prefix,
             node=node,
             predicate=predicate,
             line=line,
             context=context,
+            exc=exc,
         )
+    return error_cls(
+        curie,
+        ontology_prefix=ontology_prefix,
+        node=node,
+        predicate=predicate,
+        line=line,
+        context=context,
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_str_or_curie_or_uri_cached(
+    str_or_curie_or_uri: str,
+    ontology_prefix: str | None,
+    upgrade: bool,
+    name: str | None,
+) -> Reference | _ParseFailure | None:
+    """Parse a string, returning None if it's blocked."""
+    str_or_curie_or_uri = _preclean_uri(str_or_curie_or_uri)
+    if not str_or_curie_or_uri:
+        return EmptyStringError, str_or_curie_or_uri, None
 
     rules = get_rules()
 
@@ -196,59 +294,30 @@ def _parse_str_or_curie_or_uri_helper(
             return r2
 
     if rules.str_is_blocked(str_or_curie_or_uri, context=ontology_prefix):
-        return BlocklistError()
+        return None
 
     if _is_uri(str_or_curie_or_uri):
         rt = bioregistry.parse_iri(
             str_or_curie_or_uri, on_failure_return_type=FailureReturnType.single
         )
         if rt is None:
-            return UnparsableIRIError(
-                str_or_curie_or_uri,
-                ontology_prefix=ontology_prefix,
-                node=node,
-                predicate=predicate,
-                line=line,
-                context=context,
-            )
+            return UnparsableIRIError, str_or_curie_or_uri, None
         try:
             rv = Reference.model_validate(
                 {"prefix": rt.prefix, "identifier": rt.identifier, "name": name}
             )
         except ValidationError as exc:
-            return ParseValidationError(
-                str_or_curie_or_uri,
-                ontology_prefix=ontology_prefix,
-                node=node,
-                predicate=predicate,
-                line=line,
-                context=context,
-                exc=exc,
-            )
+            return ParseValidationError, str_or_curie_or_uri, exc
         else:
             return rv
 
     prefix, delimiter, identifier = str_or_curie_or_uri.partition(":")
     if not delimiter:
-        return NotCURIEError(
-            str_or_curie_or_uri,
-            ontology_prefix=ontology_prefix,
-            node=node,
-            predicate=predicate,
-            line=line,
-            context=context,
-        )
+        return NotCURIEError, str_or_curie_or_uri, None
 
     norm_node_prefix = bioregistry.normalize_prefix(prefix)
     if not norm_node_prefix:
-        return UnregisteredPrefixError(
-            str_or_curie_or_uri,
-            ontology_prefix=ontology_prefix,
-            node=node,
-            predicate=predicate,
-            line=line,
-            context=context,
-        )
+        return UnregisteredPrefixError, str_or_curie_or_uri, None
 
     identifier = bioregistry.standardize_identifier(norm_node_prefix, identifier)
     try:
@@ -256,15 +325,7 @@ def _parse_str_or_curie_or_uri_helper(
             {"prefix": norm_node_prefix, "identifier": identifier, "name": name}
         )
     except ValidationError as exc:
-        return ParseValidationError(
-            str_or_curie_or_uri,
-            ontology_prefix=ontology_prefix,
-            node=node,
-            predicate=predicate,
-            line=line,
-            exc=exc,
-            context=context,
-        )
+        return ParseValidationError, str_or_curie_or_uri, exc
     else:
         return rv
 
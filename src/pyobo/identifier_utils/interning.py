@@ -0,0 +1,124 @@
+"""A pool of shared references.
+
+The same references, e.g., for parents, cross-references, and the targets of
+relationships, appear on thousands of terms in an ontology. Rather than keeping a
+separate :class:`Reference` object for each occurrence, references can be interned
+in a pool, which returns one shared object per distinct prefix, identifier, and name.
+This saves memory, and since dictionary and set lookups check identity first,
+looking up shared references is faster, too.
+
+By default, the pool only holds weak references, so references are dropped from the
+pool once no ontology uses them anymore.
+
+.. code-block:: python
+
+    from pyobo.identifier_utils import Reference, intern_reference
+
+    a = intern_reference(Reference(prefix="go", identifier="0000001"))
+    b = intern_reference(Reference(prefix="go", identifier="0000001"))
+    assert a is b
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import MutableMapping
+
+import curies
+
+from .reference import Reference
+
+__all__ = [
+    "ReferencePool",
+    "get_reference_pool",
+    "intern_reference",
+]
+
+#: The key for a reference in a pool
+_Key = tuple[str, str, str | None]
+
+
+class ReferencePool:
+    """A pool that gives one shared reference per prefix, identifier, and name."""
+
+    def __init__(self, *, weak: bool = True) -> None:
+        """Prepare a pool.
+
+        :param weak: If true, the pool only holds weak references, so the references
+            are dropped once nothing else uses them. Otherwise, all references are kept
+            until the pool is cleared.
+        """
+        self._references: MutableMapping[_Key, Reference] = (
+            weakref.WeakValueDictionary() if weak else {}
+        )
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def clear(self) -> None:
+        """Remove all references from the pool."""
+        self._references.clear()
+
+    def intern(self, reference: Reference) -> Reference:
+        """Get the shared reference that's equal to the given one.
+
+        :param reference: A reference
+        :returns: The reference in the pool, or the given reference if none was there,
+            in which case it's added to the pool
+        """
+        key = reference.prefix, reference.identifier, reference.name
+        rv = self._references.get(key)
+        if rv is None:
+            rv = self._references.setdefault(key, reference)
+        return rv
+
+    def get(self, prefix: str, identifier: str, name: str | None = None) -> Reference:
+        """Get the shared reference for the prefix, identifier, and name.
+
+        :param prefix: A prefix, which is normalized if it's not already
+        :param identifier: A local unique identifier
+        :param name: An optional name
+        :returns: The reference in the pool. A new reference is only constructed and
+            validated if there isn't one in the pool yet.
+        """
+        rv = self._references.get((prefix, identifier, name))
+        if rv is None:
+            rv = self.intern(Reference(prefix=prefix, identifier=identifier, name=name))
+            # also remember the reference under the prefix before normalization,
+            # so later lookups with the same prefix skip constructing it again
+            if rv.prefix != prefix:
+                self._references.setdefault((prefix, identifier, name), rv)
+        return rv
+
+    def from_reference(self, reference: curies.Reference) -> Reference:
+        """Get the shared reference for a reference from :mod:`curies`."""
+        if isinstance(reference, Reference):
+            return self.intern(reference)
+        name = reference.name if isinstance(reference, curies.NamableReference) else None
+        return self.get(reference.prefix, reference.identifier, name)
+
+    def from_curie(self, curie: str, name: str | None = None) -> Reference:
+        """Get the shared reference for a CURIE."""
+        prefix, delimiter, identifier = curie.partition(":")
+        if not delimiter:
+            # let the reference raise the appropriate error
+            return Reference.from_curie(curie, name=name)
+        return self.get(prefix, identifier, name)
+
+
+#: The default pool, used by the OBO and OBO Graph readers and by stanzas
+_POOL = ReferencePool()
+
+
+def get_reference_pool() -> ReferencePool:
+    """Get the default reference pool."""
+    return _POOL
+
+
+def intern_reference(reference: curies.Reference) -> Reference:
+    """Get the shared reference from the default pool.
+
+    :param reference: A reference, which might be a reference from :mod:`curies`
+    :returns: A PyOBO reference that's shared with all other equal references
+    """
+    return _POOL.from_reference(reference)
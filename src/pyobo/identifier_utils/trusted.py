@@ -0,0 +1,107 @@
+"""Construct references without validating them.
+
+Constructing a :class:`Reference` normalizes its prefix against the Bioregistry, then
+standardizes and validates its identifier. Sources that build hundreds of millions of
+references, where the prefix is a constant and identifiers are already standard (e.g.,
+numeric database identifiers), can skip this with a :class:`ReferenceFactory`, which
+only checks the prefix once.
+
+.. code-block:: python
+
+    from pyobo.identifier_utils import ReferenceFactory
+
+    pubchem_compound = ReferenceFactory("pubchem.compound")
+    reference = pubchem_compound("2244", name="aspirin")
+
+For debugging, set the ``PYOBO_VALIDATE_TRUSTED`` environment variable to a number
+``n`` to fully validate every ``n``-th trusted reference, which raises an exception
+if it's invalid or if its identifier isn't already standard.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import cache
+
+import bioregistry
+from bioregistry import NormalizedPrefix
+
+from .reference import Reference
+
+__all__ = [
+    "TRUSTED_VALIDATION_ENVIRONMENT_VARIABLE",
+    "ReferenceFactory",
+    "get_reference_factory",
+    "trusted_reference",
+]
+
+#: The environment variable for how often trusted references are validated
+TRUSTED_VALIDATION_ENVIRONMENT_VARIABLE = "PYOBO_VALIDATE_TRUSTED"
+
+
+def _get_validation_interval() -> int | None:
+    value = os.getenv(TRUSTED_VALIDATION_ENVIRONMENT_VARIABLE)
+    if not value:
+        return None
+    return int(value)
+
+
+class ReferenceFactory:
+    """Construct references for one prefix, without validating each one."""
+
+    def __init__(self, prefix: str, *, validate_every: int | None = None) -> None:
+        """Prepare a reference factory.
+
+        :param prefix: A prefix, which is normalized against the Bioregistry once
+        :param validate_every: If given, every ``n``-th reference is fully validated.
+            Defaults to the value of the ``PYOBO_VALIDATE_TRUSTED`` environment
+            variable.
+
+        :raises ValueError: If the prefix isn't registered in the Bioregistry
+        """
+        norm_prefix = bioregistry.normalize_prefix(prefix)
+        if norm_prefix is None:
+            raise ValueError(f"unregistered prefix: {prefix}")
+        # wrap it once here, since references are constructed without validation
+        self.prefix = NormalizedPrefix(norm_prefix)
+        self.validate_every = (
+            validate_every if validate_every is not None else _get_validation_interval()
+        )
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.prefix!r})"
+
+    def __call__(self, identifier: str, name: str | None = None) -> Reference:
+        """Construct a reference with the given identifier and name.
+
+        :param identifier: A local unique identifier, which is assumed to already be
+            standard and valid for the prefix
+        :param name: An optional name
+        :returns: A reference
+        """
+        if self.validate_every:
+            self._count += 1
+            if self._count % self.validate_every == 0:
+                return self._validate(identifier, name)
+        return Reference.model_construct(prefix=self.prefix, identifier=identifier, name=name)
+
+    def _validate(self, identifier: str, name: str | None) -> Reference:
+        rv = Reference(prefix=self.prefix, identifier=identifier, name=name)
+        if rv.identifier != identifier:
+            raise ValueError(
+                f"[{self.prefix}] trusted identifier {identifier} is not standard. "
+                f"It should be {rv.identifier}"
+            )
+        return rv
+
+
+@cache
+def get_reference_factory(prefix: str) -> ReferenceFactory:
+    """Get a shared reference factory for the prefix."""
+    return ReferenceFactory(prefix)
+
+
+def trusted_reference(prefix: str, identifier: str, name: str | None = None) -> Reference:
+    """Construct a reference without validating it, see :class:`ReferenceFactory`."""
+    return get_reference_factory(prefix)(identifier, name)
@@ -1,7 +1,7 @@
 """Wrapper around NER functionalities."""
 
-from .api import get_grounder
-from .normalizer import ground
+from .api import clear_grounder_cache, get_grounder, get_grounding_index
+from .normalizer import ground, ground_many
 from .scispacy_utils import (
     get_scispacy_entities,
     get_scispacy_entity_linker,
@@ -9,9 +9,12 @@ from .scispacy_utils import (
 )
 
 __all__ = [
+    "clear_grounder_cache",
     "get_grounder",
+    "get_grounding_index",
     "get_scispacy_entities",
     "get_scispacy_entity_linker",
     "get_scispacy_knowledgebase",
     "ground",
+    "ground_many",
 ]
@@ -3,64 +3,300 @@
 from __future__ import annotations
 
 import logging
+import pickle
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 from subprocess import CalledProcessError
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
 
 import ssslm
 from ssslm import LiteralMapping
 from tqdm import tqdm
 from typing_extensions import Unpack
 
-from pyobo.api import get_literal_mappings
-from pyobo.constants import GetOntologyKwargs, check_should_use_tqdm
+from pyobo.api import get_literal_mappings, get_obsolete_references
+from pyobo.constants import (
+    GetOntologyKwargs,
+    check_should_cache,
+    check_should_force,
+    check_should_use_tqdm,
+)
 from pyobo.getters import NoBuildError
 from pyobo.struct import Reference
+from pyobo.utils.cache import cached_pickle
+from pyobo.utils.path import CacheArtifact, get_cache_path
+from pyobo.utils.ver import get_version_from_kwargs
 
 if TYPE_CHECKING:
     import gilda
 
 __all__ = [
+    "GROUNDER_REGISTRY",
+    "GrounderCacheInfo",
+    "GrounderRegistry",
+    "clear_grounder_cache",
     "get_grounder",
+    "get_grounding_index",
 ]
 
 logger = logging.getLogger(__name__)
 
+#: A lexical index from normalized text to gilda terms
+GroundingIndex: TypeAlias = "dict[str, list[gilda.Term]]"
+
+#: The default number of grounders kept in memory by :class:`GrounderRegistry`
+GROUNDER_CACHE_SIZE = 16
+
+#: A key for a grounder, consisting of the prefix/version pairs, whether
+#: obsolete terms were skipped, and the grounder class
+GrounderKey: TypeAlias = tuple[
+    tuple[tuple[str, str | None], ...], bool, "type[gilda.Grounder] | None"
+]
+
+
+class GrounderCacheInfo(NamedTuple):
+    """Statistics about the grounder registry."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    #: The total number of literal mappings in all cached grounders
+    literal_mappings: int
+
+
+class GrounderRegistry:
+    """A least recently used cache of grounders.
+
+    Building a grounder requires loading literal mappings and indexing them, which is
+    much more expensive than a single query, so grounders are kept around for reuse.
+    The size of the cache is bounded by the number of grounders and optionally by the
+    total number of literal mappings in them, as a proxy for memory usage.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = GROUNDER_CACHE_SIZE,
+        max_literal_mappings: int | None = None,
+    ) -> None:
+        """Instantiate the registry.
+
+        :param maxsize: The maximum number of grounders to keep. If none, is unbounded.
+        :param max_literal_mappings: The maximum total number of literal mappings to
+            keep across all grounders. If none, is unbounded.
+        """
+        self.maxsize = maxsize
+        self.max_literal_mappings = max_literal_mappings
+        self._data: OrderedDict[GrounderKey, tuple[ssslm.Grounder[Reference], int]] = OrderedDict()
+        self._literal_mappings = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: GrounderKey) -> ssslm.Grounder[Reference] | None:
+        """Get a grounder, if it's been cached, and mark it as recently used."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._data.move_to_end(key)
+            return value[0]
+
+    def put(self, key: GrounderKey, grounder: ssslm.Grounder[Reference], size: int) -> None:
+        """Cache a grounder, evicting the least recently used ones if necessary.
+
+        :param key: The key for the grounder
+        :param grounder: The grounder
+        :param size: The number of literal mappings in the grounder
+        """
+        if self.max_literal_mappings is not None and size > self.max_literal_mappings:
+            logger.debug("not caching grounder with %d literal mappings", size)
+            return
+        with self._lock:
+            if key in self._data:
+                self._literal_mappings -= self._data.pop(key)[1]
+            self._data[key] = grounder, size
+            self._literal_mappings += size
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+                self.max_literal_mappings is not None
+                and self._literal_mappings > self.max_literal_mappings
+            ):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._literal_mappings -= evicted_size
+
+    def clear(self) -> None:
+        """Remove all grounders and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._literal_mappings = 0
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> GrounderCacheInfo:
+        """Get statistics about the registry."""
+        with self._lock:
+            return GrounderCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._data),
+                literal_mappings=self._literal_mappings,
+            )
+
+
+#: The registry used by :func:`get_grounder`
+GROUNDER_REGISTRY = GrounderRegistry()
+
+
+def clear_grounder_cache() -> None:
+    """Clear the registry used by :func:`get_grounder`."""
+    GROUNDER_REGISTRY.clear()
+
 
 def get_grounder(
     prefixes: str | Iterable[str],
     *,
     grounder_cls: type[gilda.Grounder] | None = None,
-    versions: None | str | Iterable[str | None] | dict[str, str] = None,
+    versions: str | Iterable[str | None] | dict[str, str] | None = None,
     skip_obsolete: bool = False,
     raise_on_missing: bool = False,
+    use_registry: bool = True,
     **kwargs: Unpack[GetOntologyKwargs],
 ) -> ssslm.Grounder[Reference]:
-    """Get a grounder for the given prefix(es)."""
-    all_literal_mappings: list[LiteralMapping[Reference]] = []
-    it = _clean_prefix_versions(prefixes, versions=versions)
+    """Get a grounder for the given prefix(es).
+
+    :param use_registry: Should grounders be reused from (and stored in)
+        :data:`GROUNDER_REGISTRY`? The registry is also skipped when rebuilding is
+        forced.
+
+    Grounders are keyed on the prefixes, their versions, whether obsolete terms are
+    skipped, and the grounder class, so repeated calls return the same grounder.
+    """
+    it = [
+        (prefix, get_version_from_kwargs(prefix, {**kwargs, "version": version}))
+        for prefix, version in _clean_prefix_versions(prefixes, versions=versions)
+    ]
+    if not use_registry or check_should_force(kwargs):
+        return _get_grounder(it, grounder_cls, skip_obsolete, raise_on_missing, **kwargs)[0]
+
+    key: GrounderKey = tuple(it), skip_obsolete, grounder_cls
+    if (grounder := GROUNDER_REGISTRY.get(key)) is not None:
+        return grounder
+    grounder, size = _get_grounder(it, grounder_cls, skip_obsolete, raise_on_missing, **kwargs)
+    GROUNDER_REGISTRY.put(key, grounder, size)
+    return grounder
+
+
+def _get_grounder(
+    it: list[tuple[str, str | None]],
+    grounder_cls: type[gilda.Grounder] | None,
+    skip_obsolete: bool,
+    raise_on_missing: bool,
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> tuple[ssslm.Grounder[Reference], int]:
+    entries: GroundingIndex = {}
     disable = len(it) == 1 or not check_should_use_tqdm(kwargs)
     for prefix, kwargs["version"] in tqdm(it, leave=False, disable=disable):
         try:
-            literal_mappings = get_literal_mappings(prefix, skip_obsolete=skip_obsolete, **kwargs)
+            index = get_grounding_index(prefix, skip_obsolete=skip_obsolete, **kwargs)
         except (NoBuildError, CalledProcessError) as e:
             logger.warning("[%s] unable to get literal mappings: %s", prefix, e)
             continue
         else:
-            if not literal_mappings:
+            if not index:
                 if raise_on_missing:
                     raise ValueError(f"no literal mappings were loaded for {prefix}")
                 logger.warning("[%s] no literal mappings loaded", prefix)
-            all_literal_mappings.extend(literal_mappings)
+            if len(it) == 1:
+                entries = index
+            else:
+                for norm_text, terms in index.items():
+                    entries.setdefault(norm_text, []).extend(terms)
+
+    if grounder_cls is None:
+        import gilda
+
+        grounder_cls = gilda.Grounder
+
+    grounder = ssslm.GildaGrounder(grounder_cls(entries), reference_cls=Reference)
+    return grounder, sum(len(terms) for terms in entries.values())
+
+
+def get_grounding_index(
+    prefix: str, *, skip_obsolete: bool = False, **kwargs: Unpack[GetOntologyKwargs]
+) -> GroundingIndex:
+    """Get a lexical index from normalized text to :class:`gilda.Term` objects.
+
+    :param prefix: The prefix of the resource
+    :param skip_obsolete: Should obsolete terms be removed from the index?
+
+    :returns: A dictionary that can be passed directly to :class:`gilda.Grounder`. This
+        is cached as :data:`CacheArtifact.grounding_index` for each version of the
+        resource, so later processes don't have to convert, normalize, and deduplicate
+        literal mappings again.
+    """
+    version = get_version_from_kwargs(prefix, kwargs)
+    path = get_cache_path(prefix, CacheArtifact.grounding_index, version=version)
+
+    def _get_index(force: bool) -> GroundingIndex:
+        @cached_pickle(path=path, force=force, cache=check_should_cache(kwargs))
+        def _index_getter() -> GroundingIndex:
+            return _index_literal_mappings(get_literal_mappings(prefix, **kwargs))
+
+        rv: GroundingIndex = _index_getter()
+        return rv
+
+    force = check_should_force(kwargs)
+    try:
+        index = _get_index(force)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        # e.g., if the index was written with an incompatible version of gilda
+        logger.warning("[%s] could not load grounding index from %s: %s", prefix, path, e)
+        index = _get_index(True)
+
+    if skip_obsolete:
+        obsoletes = {
+            (reference.prefix, reference.identifier)
+            for reference in get_obsolete_references(prefix, **kwargs)
+        }
+        index = {
+            norm_text: filtered_terms
+            for norm_text, terms in index.items()
+            if (filtered_terms := [term for term in terms if (term.db, term.id) not in obsoletes])
+        }
+    return index
+
+
+def _index_literal_mappings(
+    literal_mappings: Iterable[LiteralMapping[Reference]],
+) -> GroundingIndex:
+    terms = ssslm.literal_mappings_to_gilda(literal_mappings, on_error="ignore")
+    if terms:
+        from gilda.term import filter_out_duplicates
 
-    return ssslm.make_grounder(
-        all_literal_mappings, implementation="gilda", grounder_cls=grounder_cls
-    )
+        # suppress logging counting of terms
+        logging.getLogger("gilda.term").setLevel(logging.WARNING)
+        terms = filter_out_duplicates(terms)  # type:ignore[no-untyped-call]
+    rv: GroundingIndex = {}
+    for term in terms:
+        rv.setdefault(term.norm_text, []).append(term)
+    return rv
 
 
 def _clean_prefix_versions(
     prefixes: str | Iterable[str],
-    versions: None | str | Iterable[str | None] | dict[str, str] = None,
+    versions: str | Iterable[str | None] | dict[str, str] | None = None,
 ) -> list[tuple[str, str | None]]:
     if isinstance(prefixes, str):
         prefixes = [prefixes]
@@ -13,6 +13,7 @@ from ..struct import Reference
 
 __all__ = [
     "ground",
+    "ground_many",
 ]
 
 
@@ -60,3 +61,28 @@ def ground(
     if strict_match:
         raise ValueError(f"no match found for query: {query} against prefixes: {prefix}")
     return None
+
+
+def ground_many(
+    prefix: str | Iterable[str],
+    queries: Iterable[str],
+    **kwargs: Unpack[GetOntologyKwargs],
+) -> list[Reference | None]:
+    """Normalize several strings given the prefix's labels and synonyms.
+
+    :param prefix: If a string, only grounds against that namespace. If a list, will try
+        grounding against all in that order
+    :param queries: The strings to try grounding
+
+    :returns: A list with the best match for each query, or none if a query couldn't be
+        grounded. Duplicate queries are only grounded once.
+    """
+    grounder = get_grounder(prefix, **kwargs)
+    matches: dict[str, Reference | None] = {}
+    rv = []
+    for query in queries:
+        if query not in matches:
+            match = grounder.get_best_match(query)
+            matches[query] = Reference.from_reference(match.reference) if match else None
+        rv.append(matches[query])
+    return rv
@@ -1,6 +1,6 @@
 """Gene Ontology."""
 
-from pyobo import get_descendants
+from pyobo import Reference, get_descendants
 
 __all__ = [
     "is_biological_process",
@@ -51,8 +51,7 @@ def is_cellular_component(identifier: str) -> bool:
 
 
 def _is_descendant(identifier: str, ancestor: str) -> bool:
-    identifier = identifier.lower()
-    if not identifier.startswith("go:"):
-        identifier = f"go:{identifier}"
-    descendants = get_descendants("go", ancestor)
-    return descendants is not None and identifier in descendants
+    if identifier.lower().startswith("go:"):
+        identifier = identifier[len("go:") :]
+    descendants = get_descendants(Reference(prefix="go", identifier=ancestor))
+    return descendants is not None and Reference(prefix="go", identifier=identifier) in descendants
@@ -7,7 +7,9 @@ import bioregistry
 import pandas as pd
 from tqdm.auto import tqdm
 
+from ...identifier_utils import ReferenceFactory
 from ...struct import Obo, Reference, Term, from_species
+from ...utils.compact import CompactMapping, use_compact_mappings
 from ...utils.path import ensure_df
 
 __all__ = [
@@ -63,6 +65,8 @@ def get_ncbigene_id_to_species_mapping() -> Mapping[str, str]:
 
 def _get_ncbigene_info_subset(usecols: list[str]) -> Mapping[str, str]:
     df = _get_ncbigene_subset(usecols)
+    if use_compact_mappings():
+        return CompactMapping(df[usecols[0]].to_numpy(), df[usecols[1]].to_numpy())
     return dict(df.values)
 
 
@@ -163,11 +167,13 @@ def get_terms(force: bool = False) -> Iterable[Term]:
         df.values, total=len(df.index), desc=f"mapping {PREFIX}", unit_scale=True, unit="gene"
     )
     warning_prefixes = set()
+    # gene identifiers are already standard, so skip validating each one
+    ncbigene_reference = ReferenceFactory(PREFIX)
     for tax_id, gene_id, symbol, xref_curies, description, _gene_type in it:
         if pd.isna(symbol):
             continue
         term = Term(
-            reference=Reference(prefix=PREFIX, identifier=gene_id, name=symbol),
+            reference=ncbigene_reference(gene_id, name=symbol),
             definition=description if pd.notna(description) else None,
         )
         term.set_species(identifier=tax_id)
@@ -179,6 +185,8 @@ def get_terms(force: bool = False) -> Iterable[Term]:
                     xref_curie = xref_curie[len("xref_curie") :]
                 elif xref_curie.startswith("nome:WB:"):
                     xref_curie = xref_curie[len("nome:") :]
+                # the xrefs come from many resources and aren't all valid, so unlike the
+                # gene's own reference, they're still validated
                 xref_prefix, xref_id = bioregistry.parse_curie(xref_curie)
                 if xref_prefix and xref_id:
                     term.append_xref(Reference(prefix=xref_prefix, identifier=xref_id))
@@ -10,7 +10,8 @@ from tqdm.auto import tqdm
 
 from ..api import get_name_id_mapping
 from ..api.utils import get_version
-from ..struct import Obo, Reference, Synonym, Term
+from ..identifier_utils import ReferenceFactory
+from ..struct import Obo, Synonym, Term
 from ..utils.iter import iterate_gzips_together
 from ..utils.path import ensure_df, ensure_path
 
@@ -82,10 +83,9 @@ def get_pubchem_id_to_mesh_id(version: str) -> Mapping[str, str]:
     mesh_ids = []
     for name in df["mesh_id"]:
         mesh_id = mesh_name_to_id.get(name)
-        if mesh_id is None:
-            if name not in needs_curation:
-                needs_curation.add(name)
-                logger.debug("[mesh] needs curating: %s", name)
+        if mesh_id is None and name not in needs_curation:
+            needs_curation.add(name)
+            logger.debug("[mesh] needs curating: %s", name)
         mesh_ids.append(mesh_id)
     logger.info("[mesh] %d/%d need updating", len(needs_curation), len(mesh_ids))
     df["mesh_id"] = mesh_ids
@@ -114,17 +114,23 @@ def get_terms(*, version: str, use_tqdm: bool = True, force: bool = False) -> It
     if use_tqdm:
         total = 146000000  # got this by reading the exports page
         it = tqdm(it, desc=f"mapping {PREFIX}", unit_scale=True, unit="compound", total=total)
+    # there are more than a hundred million compounds, so skip validating
+    # each reference since the identifiers from PubChem are already standard
+    pubchem_reference = ReferenceFactory(PREFIX)
+    chebi_reference = ReferenceFactory("chebi")
+    chembl_reference = ReferenceFactory("chembl")
+    inchi_reference = ReferenceFactory("inchi")
     for identifier, name, raw_synonyms in it:
-        reference = Reference(prefix=PREFIX, identifier=identifier, name=name)
+        reference = pubchem_reference(identifier, name=name)
         xrefs = []
         synonyms = []
         for synonym in raw_synonyms:
             if synonym.startswith("CHEBI:"):
-                xrefs.append(Reference(prefix="chebi", identifier=removeprefix(synonym, "CHEBI:")))
+                xrefs.append(chebi_reference(removeprefix(synonym, "CHEBI:")))
             elif synonym.startswith("CHEMBL"):
-                xrefs.append(Reference(prefix="chembl", identifier=synonym))
+                xrefs.append(chembl_reference(synonym))
             elif synonym.startswith("InChI="):
-                xrefs.append(Reference(prefix="inchi", identifier=synonym))
+                xrefs.append(inchi_reference(synonym))
             # elif synonym.startswith("SCHEMBL"):
             #     xrefs.append(Reference(prefix="schembl", identifier=synonym))
             else:
@@ -13,6 +13,7 @@ from tqdm.auto import tqdm
 from umls_downloader import open_mrconso_dict_reader, open_umls_semantic_types
 
 from pyobo import Obo, Reference, SynonymTypeDef, Term
+from pyobo.identifier_utils import ReferenceFactory
 from pyobo.sources.umls.get_synonym_types import get_umls_typedefs
 
 __all__ = [
@@ -23,6 +24,10 @@ PREFIX = "umls"
 SOURCE_VOCAB_URL = "https://www.nlm.nih.gov/research/umls/sourcereleasedocs/index.html"
 UMLS_TYPEDEFS: dict[str, SynonymTypeDef] = get_umls_typedefs()
 
+#: CUIs and semantic type identifiers are already standard, so they don't need validating
+_umls_reference = ReferenceFactory(PREFIX)
+_sty_reference = ReferenceFactory("sty")
+
 
 class UMLSGetter(Obo):
     """An ontology representation of UMLS."""
@@ -85,7 +90,7 @@ def _get_term(
         return None
     preferred_line = preferred_lines[0]
 
-    term = Term.from_triple(prefix=PREFIX, identifier=cui, name=preferred_line["STR"])
+    term = Term(reference=_umls_reference(cui, name=preferred_line["STR"]))
 
     for row in cui_lines:  # TODO this adds a duplicate for the preferred line
         xref_prefix = bioregistry.normalize_prefix(row["SAB - source name"])
@@ -96,6 +101,7 @@ def _get_term(
         elif "," in xref_identifier:
             provenance = []  # TODO handle this?
         else:
+            # codes from source vocabularies are messy, so these are still validated
             try:
                 ref = Reference(prefix=xref_prefix, identifier=xref_identifier)
             except ValueError:
@@ -110,7 +116,7 @@ def _get_term(
         )
 
     for sty_id in semantic_types.get(cui, ()):
-        term.append_parent(Reference(prefix="sty", identifier=sty_id))
+        term.append_parent(_sty_reference(sty_id))
     return term
 
 
@@ -6,11 +6,12 @@ import logging
 import typing as t
 from collections import Counter
 from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, TypeAlias
+from typing import Any, Literal, TypeAlias
 
 import bioregistry
 import networkx as nx
@@ -28,6 +29,7 @@ from .reader_utils import (
     _chomp_typedef,
     _parse_provenance_list,
 )
+from .tokenizer import iterate_obo_stanzas
 from .. import vocabulary as v
 from ..reference import OBOLiteral, _obo_parse_identifier, default_reference
 from ..struct import (
@@ -52,6 +54,7 @@ from ...identifier_utils import (
 )
 from ...utils.cache import write_gzipped_graph
 from ...utils.misc import _prioritize_version
+from ...utils.telemetry import span
 
 __all__ = [
     "from_obo_path",
@@ -61,6 +64,9 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+#: The parser used for OBO flat files
+OBOParser: TypeAlias = Literal["obonet", "native"]
+
 
 def from_obo_path(
     path: str | Path,
@@ -71,18 +77,59 @@ def from_obo_path(
     upgrade: bool = True,
     use_tqdm: bool = False,
     ignore_obsolete: bool = False,
+    parser: OBOParser = "obonet",
     _cache_path: Path | None = None,
 ) -> Obo:
-    """Get the OBO graph from a path."""
+    """Get the OBO graph from a path.
+
+    :param parser: The parser to use. By default, uses :mod:`obonet` to construct a
+        graph, which is then converted. If ``native`` is given, uses PyOBO's streaming
+        tokenizer, which creates terms directly from each stanza without building an
+        intermediate graph. In this case, no obonet cache is written.
+    """
     path = Path(path).expanduser().resolve()
+    if parser == "native":
+        logger.info("[%s] parsing OBO natively from %s", prefix or "<unknown>", path)
+        if path.suffix.endswith(".zip"):
+            with (
+                span(prefix, "parse_native"),
+                open_zipfile(path, path.name.removesuffix(".zip")) as file,
+            ):
+                return _from_obo_lines(
+                    file,
+                    prefix,
+                    strict=strict,
+                    version=version,
+                    upgrade=upgrade,
+                    use_tqdm=use_tqdm,
+                    ignore_obsolete=ignore_obsolete,
+                )
+        with span(prefix, "parse_native"), safe_open(path, operation="read") as file:
+            return _from_obo_lines(
+                file,
+                prefix,
+                strict=strict,
+                version=version,
+                upgrade=upgrade,
+                use_tqdm=use_tqdm,
+                ignore_obsolete=ignore_obsolete,
+            )
+    elif parser != "obonet":
+        raise ValueError(f"unknown OBO parser: {parser}")
+
     if path.suffix.endswith(".zip"):
         logger.info("[%s] parsing zipped OBO with obonet from %s", prefix or "<unknown>", path)
-        with open_zipfile(path, path.name.removesuffix(".zip")) as file:
+        with (
+            span(prefix, "parse_obonet") as record,
+            open_zipfile(path, path.name.removesuffix(".zip")) as file,
+        ):
             graph = _read_obo(file, prefix, ignore_obsolete=ignore_obsolete, use_tqdm=use_tqdm)
+            record.rows = graph.number_of_nodes()
     else:
         logger.info("[%s] parsing OBO with obonet from %s", prefix or "<unknown>", path)
-        with safe_open(path, operation="read") as file:
+        with span(prefix, "parse_obonet") as record, safe_open(path, operation="read") as file:
             graph = _read_obo(file, prefix, ignore_obsolete=ignore_obsolete, use_tqdm=use_tqdm)
+            record.rows = graph.number_of_nodes()
 
     if prefix:
         # Make sure the graph is named properly
@@ -90,10 +137,14 @@ def from_obo_path(
 
     if _cache_path:
         logger.info("[%s] writing obonet cache to %s", prefix, _cache_path)
-        write_gzipped_graph(path=_cache_path, graph=graph)
+        with span(prefix, "write_obonet_cache"):
+            write_gzipped_graph(path=_cache_path, graph=graph)
 
     # Convert to an Obo instance and return
-    return from_obonet(graph, strict=strict, version=version, upgrade=upgrade, use_tqdm=use_tqdm)
+    with span(prefix, "from_obonet"):
+        return from_obonet(
+            graph, strict=strict, version=version, upgrade=upgrade, use_tqdm=use_tqdm
+        )
 
 
 def _read_obo(
@@ -131,11 +182,22 @@ def from_str(
     upgrade: bool = True,
     ignore_obsolete: bool = False,
     use_tqdm: bool = False,
+    parser: OBOParser = "obonet",
 ) -> Obo:
     """Read an ontology from a string representation."""
     import obonet
 
     text = dedent(text).strip()
+    if parser == "native":
+        return _from_obo_lines(
+            text.splitlines(),
+            prefix=None,
+            strict=strict,
+            version=version,
+            upgrade=upgrade,
+            use_tqdm=use_tqdm,
+            ignore_obsolete=ignore_obsolete,
+        )
     io = StringIO()
     io.write(text)
     io.seek(0)
@@ -156,14 +218,195 @@ def from_obonet(
     ontology_prefix = _normalize_prefix_strict(ontology_prefix_raw)
     logger.info("[%s] extracting OBO using obonet", ontology_prefix)
 
-    date = _get_date(graph=graph, ontology_prefix=ontology_prefix)
-    name = _get_name(graph=graph, ontology_prefix=ontology_prefix)
-    imports = graph.graph.get("import")
+    header = _process_header(
+        graph.graph,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        version=version,
+        upgrade=upgrade,
+    )
+
+    missing_typedefs: set[ReferenceTuple] = set()
 
-    macro_config = MacroConfig(graph.graph, strict=strict, ontology_prefix=ontology_prefix)
+    #: CURIEs to typedefs
+    typedefs: Mapping[ReferenceTuple, TypeDef] = {
+        typedef.pair: typedef
+        for typedef in iterate_typedefs(
+            graph,
+            ontology_prefix=ontology_prefix,
+            strict=strict,
+            upgrade=upgrade,
+            macro_config=header.macro_config,
+        )
+    }
+
+    terms = _get_terms(
+        graph,
+        strict=strict,
+        ontology_prefix=ontology_prefix,
+        upgrade=upgrade,
+        typedefs=typedefs,
+        missing_typedefs=missing_typedefs,
+        synonym_typedefs=header.synonym_typedefs,
+        subset_typedefs=header.subset_typedefs,
+        macro_config=header.macro_config,
+        use_tqdm=use_tqdm,
+    )
+
+    return header.build(terms=terms, typedefs=typedefs)
+
+
+def _from_obo_lines(
+    lines: Iterable[str],
+    prefix: str | None,
+    *,
+    strict: bool = False,
+    version: str | None = None,
+    upgrade: bool = True,
+    use_tqdm: bool = False,
+    ignore_obsolete: bool = False,
+) -> Obo:
+    """Get all the terms from the lines of an OBO file, one stanza at a time.
+
+    Since ``[Typedef]`` stanzas conventionally appear after all ``[Term]`` stanzas,
+    checking relations for missing typedefs is deferred until the end.
+    """
+    stanzas = iter(
+        iterate_obo_stanzas(
+            tqdm(
+                lines,
+                disable=not use_tqdm,
+                unit_scale=True,
+                desc=f"[{prefix or ''}] parsing OBO",
+                leave=True,
+            )
+        )
+    )
+    _, header_data = next(stanzas)
+    # this mirrors how obonet populates the name
+    if "ontology" in header_data:
+        header_data["name"] = header_data["ontology"]
+    if prefix:
+        _clean_header_ontology(header_data, prefix)
+    ontology_prefix = _normalize_prefix_strict(header_data["ontology"])
+    logger.info("[%s] extracting OBO using native parser", ontology_prefix)
+    header = _process_header(
+        header_data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        version=version,
+        upgrade=upgrade,
+    )
+
+    terms: list[Term] = []
+    typedef_data: list[dict[str, Any]] = []
+    for stanza_type, data in stanzas:
+        if stanza_type == "Typedef":
+            typedef_data.append(data)
+            continue
+        if stanza_type != "Term":
+            continue
+        if ignore_obsolete and data.get("is_obsolete") == "true":
+            continue
+        node = data.pop("id", None)
+        if node is None:
+            logger.warning("[%s] skipping stanza with no identifier: %s", ontology_prefix, data)
+            continue
+        reference = _parse_stanza_id(
+            node,
+            data,
+            strict=strict,
+            ontology_prefix=ontology_prefix,
+            upgrade=upgrade,
+        )
+        if reference is None or reference.prefix != ontology_prefix:
+            continue
+        if not data:
+            # this allows us to skip anything that isn't really defined
+            continue
+        terms.append(
+            _process_term(
+                reference,
+                data,
+                strict=strict,
+                ontology_prefix=ontology_prefix,
+                upgrade=upgrade,
+                typedefs=None,
+                missing_typedefs=set(),
+                synonym_typedefs=header.synonym_typedefs,
+                subset_typedefs=header.subset_typedefs,
+                macro_config=header.macro_config,
+            )
+        )
+
+    typedefs: Mapping[ReferenceTuple, TypeDef] = {
+        typedef.pair: typedef
+        for typedef in _iterate_typedefs(
+            typedef_data,
+            ontology_prefix=ontology_prefix,
+            strict=strict,
+            upgrade=upgrade,
+            macro_config=header.macro_config,
+        )
+    }
+    _warn_missing_typedefs(terms, typedefs=typedefs, ontology_prefix=ontology_prefix)
+    return header.build(terms=terms, typedefs=typedefs)
+
+
+@dataclass
+class _OBOHeader:
+    """The processed contents of an OBO document's header."""
+
+    ontology_prefix: str
+    name: str
+    date: datetime | None
+    data_version: str | None
+    imports: list[str] | None
+    auto_generated_by: str | None
+    macro_config: MacroConfig
+    subset_typedefs: SubsetTypeDefs
+    synonym_typedefs: Mapping[ReferenceTuple, SynonymTypeDef]
+    root_terms: list[Reference]
+    property_values: list[Annotation]
+    idspaces: dict[str, str]
+
+    def build(self, *, terms: list[Term], typedefs: Mapping[ReferenceTuple, TypeDef]) -> Obo:
+        """Build an ontology from the header and the given terms and typedefs."""
+        return build_ontology(
+            prefix=self.ontology_prefix,
+            name=self.name,
+            auto_generated_by=self.auto_generated_by,
+            typedefs=list(typedefs.values()),
+            synonym_typedefs=list(self.synonym_typedefs.values()),
+            date=self.date,
+            version=self.data_version,
+            idspaces=self.idspaces,
+            root_terms=self.root_terms,
+            subsetdefs=self.subset_typedefs,
+            properties=self.property_values,
+            imports=self.imports,
+            # ontology_iri
+            # ontology_version_iri
+            terms=terms,
+        )
+
+
+def _process_header(
+    header: dict[str, Any],
+    *,
+    ontology_prefix: str,
+    strict: bool,
+    version: str | None,
+    upgrade: bool,
+) -> _OBOHeader:
+    date = _get_date(header, ontology_prefix=ontology_prefix)
+    name = _get_name(header, ontology_prefix=ontology_prefix)
+    imports = header.get("import")
+
+    macro_config = MacroConfig(header, strict=strict, ontology_prefix=ontology_prefix)
 
     data_version = _prioritize_version(
-        data_version=graph.graph.get("data-version") or None,
+        data_version=header.get("data-version") or None,
         ontology_prefix=ontology_prefix,
         version=version,
         date=date,
@@ -173,14 +416,12 @@ def from_obonet(
             f"[{ontology_prefix}] slashes not allowed in data versions because of filesystem usage: {data_version}"
         )
 
-    missing_typedefs: set[ReferenceTuple] = set()
-
-    subset_typedefs = _get_subsetdefs(graph.graph, ontology_prefix=ontology_prefix, strict=strict)
+    subset_typedefs = _get_subsetdefs(header, ontology_prefix=ontology_prefix, strict=strict)
 
     root_terms: list[Reference] = []
     property_values: list[Annotation] = []
     for ann in iterate_node_properties(
-        graph.graph,
+        header,
         ontology_prefix=ontology_prefix,
         upgrade=upgrade,
         node=Reference(prefix="obo", identifier=ontology_prefix),
@@ -201,65 +442,37 @@ def from_obonet(
         else:
             property_values.append(ann)
 
-    for remark in graph.graph.get("remark", []):
+    for remark in header.get("remark", []):
         property_values.append(Annotation(has_comment.reference, OBOLiteral.string(remark)))
 
     idspaces: dict[str, str] = {}
-    for x in graph.graph.get("idspace", []):
+    for x in header.get("idspace", []):
         prefix, uri_prefix, *_ = (y.strip() for y in x.split(" ", 2))
         idspaces[prefix] = uri_prefix
 
-    #: CURIEs to typedefs
-    typedefs: Mapping[ReferenceTuple, TypeDef] = {
-        typedef.pair: typedef
-        for typedef in iterate_typedefs(
-            graph,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            upgrade=upgrade,
-            macro_config=macro_config,
-        )
-    }
-
     synonym_typedefs: Mapping[ReferenceTuple, SynonymTypeDef] = {
         synonym_typedef.pair: synonym_typedef
-        for synonym_typedef in iterate_graph_synonym_typedefs(
-            graph,
+        for synonym_typedef in _iterate_synonym_typedefs(
+            header.get("synonymtypedef", []),
             ontology_prefix=ontology_prefix,
             strict=strict,
             upgrade=upgrade,
         )
     }
 
-    terms = _get_terms(
-        graph,
-        strict=strict,
+    return _OBOHeader(
         ontology_prefix=ontology_prefix,
-        upgrade=upgrade,
-        typedefs=typedefs,
-        missing_typedefs=missing_typedefs,
-        synonym_typedefs=synonym_typedefs,
-        subset_typedefs=subset_typedefs,
-        macro_config=macro_config,
-        use_tqdm=use_tqdm,
-    )
-
-    return build_ontology(
-        prefix=ontology_prefix,
         name=name,
-        auto_generated_by=graph.graph.get("auto-generated-by"),
-        typedefs=list(typedefs.values()),
-        synonym_typedefs=list(synonym_typedefs.values()),
         date=date,
-        version=data_version,
-        idspaces=idspaces,
-        root_terms=root_terms,
-        subsetdefs=subset_typedefs,
-        properties=property_values,
+        data_version=data_version,
         imports=imports,
-        # ontology_iri
-        # ontology_version_iri
-        terms=terms,
+        auto_generated_by=header.get("auto-generated-by"),
+        macro_config=macro_config,
+        subset_typedefs=subset_typedefs,
+        synonym_typedefs=synonym_typedefs,
+        root_terms=root_terms,
+        property_values=property_values,
+        idspaces=idspaces,
     )
 
 
@@ -290,73 +503,100 @@ def _get_terms(
             # this allows us to skip anything that isn't really defined
             # caveat: this misses terms that are just defined with an ID
             continue
-
-        term = Term(
-            reference=reference,
-            builtin=_get_boolean(data, "builtin"),
-            is_anonymous=_get_boolean(data, "is_anonymous"),
-            is_obsolete=_get_boolean(data, "is_obsolete"),
-            namespace=data.get("namespace"),
-        )
-
-        _process_alts(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_parents(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_synonyms(
-            term,
-            data,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            upgrade=upgrade,
-            synonym_typedefs=synonym_typedefs,
-        )
-        _process_xrefs(
-            term,
-            data,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            macro_config=macro_config,
-            upgrade=upgrade,
-        )
-        _process_properties(
-            term,
-            data,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            upgrade=upgrade,
-            typedefs=typedefs,
-        )
-        _process_relations(
-            term,
-            data,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            upgrade=upgrade,
-            typedefs=typedefs,
-            missing_typedefs=missing_typedefs,
-        )
-        _process_replaced_by(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_subsets(
-            term,
-            data,
-            ontology_prefix=ontology_prefix,
-            strict=strict,
-            subset_typedefs=subset_typedefs,
+        terms.append(
+            _process_term(
+                reference,
+                data,
+                strict=strict,
+                ontology_prefix=ontology_prefix,
+                upgrade=upgrade,
+                typedefs=typedefs,
+                missing_typedefs=missing_typedefs,
+                synonym_typedefs=synonym_typedefs,
+                subset_typedefs=subset_typedefs,
+                macro_config=macro_config,
+            )
         )
-        _process_intersection_of(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_union_of(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_equivalent_to(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_disjoint_from(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_consider(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_comment(term, data)
-        _process_description(term, data, ontology_prefix=ontology_prefix, strict=strict)
-        _process_creation_date(term, data)
-
-        terms.append(term)
     return terms
 
 
+def _process_term(
+    reference: Reference,
+    data: dict[str, Any],
+    *,
+    strict: bool,
+    ontology_prefix: str,
+    upgrade: bool,
+    typedefs: Mapping[ReferenceTuple, TypeDef] | None,
+    synonym_typedefs: Mapping[ReferenceTuple, SynonymTypeDef],
+    subset_typedefs: SubsetTypeDefs,
+    missing_typedefs: set[ReferenceTuple],
+    macro_config: MacroConfig,
+) -> Term:
+    term = Term(
+        reference=reference,
+        builtin=_get_boolean(data, "builtin"),
+        is_anonymous=_get_boolean(data, "is_anonymous"),
+        is_obsolete=_get_boolean(data, "is_obsolete"),
+        namespace=data.get("namespace"),
+    )
+
+    _process_alts(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_parents(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_synonyms(
+        term,
+        data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        upgrade=upgrade,
+        synonym_typedefs=synonym_typedefs,
+    )
+    _process_xrefs(
+        term,
+        data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        macro_config=macro_config,
+        upgrade=upgrade,
+    )
+    _process_properties(
+        term,
+        data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        upgrade=upgrade,
+        typedefs=typedefs or {},
+    )
+    _process_relations(
+        term,
+        data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        upgrade=upgrade,
+        typedefs=typedefs,
+        missing_typedefs=missing_typedefs,
+    )
+    _process_replaced_by(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_subsets(
+        term,
+        data,
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        subset_typedefs=subset_typedefs,
+    )
+    _process_intersection_of(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_union_of(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_equivalent_to(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_disjoint_from(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_consider(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_comment(term, data)
+    _process_description(term, data, ontology_prefix=ontology_prefix, strict=strict)
+    _process_creation_date(term, data)
+    return term
+
+
 def _process_description(
-    term: Stanza, data: dict[str, Any], *, ontology_prefix: str, strict: bool
+    term: Term | TypeDef, data: dict[str, Any], *, ontology_prefix: str, strict: bool
 ) -> None:
     definition, definition_references = get_definition(
         data, node=term.reference, strict=strict, ontology_prefix=ontology_prefix
@@ -521,9 +761,14 @@ def _process_relations(
     ontology_prefix: str,
     strict: bool,
     upgrade: bool,
-    typedefs: Mapping[ReferenceTuple, TypeDef],
+    typedefs: Mapping[ReferenceTuple, TypeDef] | None,
     missing_typedefs: set[ReferenceTuple],
 ) -> None:
+    """Process relationships.
+
+    If ``typedefs`` is None, checking for missing typedefs is skipped. This is useful
+    when the typedefs aren't available yet, e.g., during streaming parsing.
+    """
     relations_references = list(
         iterate_node_relationships(
             data,
@@ -534,18 +779,49 @@ def _process_relations(
         )
     )
     for relation, reference in relations_references:
-        if (
-            relation.pair not in typedefs
-            and relation.pair not in default_typedefs
-            and relation.pair not in missing_typedefs
-        ):
-            missing_typedefs.add(relation.pair)
-            logger.warning("[%s] has no typedef for %s", ontology_prefix, relation.curie)
-            logger.debug("[%s] available typedefs: %s", ontology_prefix, set(typedefs))
+        if typedefs is not None:
+            _check_typedef(
+                relation,
+                typedefs=typedefs,
+                missing_typedefs=missing_typedefs,
+                ontology_prefix=ontology_prefix,
+            )
         # TODO parse axioms
         term.append_relationship(relation, reference)
 
 
+def _check_typedef(
+    relation: Reference,
+    *,
+    typedefs: Mapping[ReferenceTuple, TypeDef],
+    missing_typedefs: set[ReferenceTuple],
+    ontology_prefix: str,
+) -> None:
+    if (
+        relation.pair not in typedefs
+        and relation.pair not in default_typedefs
+        and relation.pair not in missing_typedefs
+    ):
+        missing_typedefs.add(relation.pair)
+        logger.warning("[%s] has no typedef for %s", ontology_prefix, relation.curie)
+        logger.debug("[%s] available typedefs: %s", ontology_prefix, set(typedefs))
+
+
+def _warn_missing_typedefs(
+    terms: Iterable[Term], *, typedefs: Mapping[ReferenceTuple, TypeDef], ontology_prefix: str
+) -> None:
+    """Check for missing typedefs after all terms' relationships have been processed."""
+    missing_typedefs: set[ReferenceTuple] = set()
+    for term in terms:
+        for relation in term.relationships:
+            _check_typedef(
+                relation,
+                typedefs=typedefs,
+                missing_typedefs=missing_typedefs,
+                ontology_prefix=ontology_prefix,
+            )
+
+
 def _process_replaced_by(
     stanza: Stanza, data: dict[str, Any], *, ontology_prefix: str, strict: bool
 ) -> None:
@@ -580,10 +856,9 @@ def _process_subsets(
         ontology_prefix=ontology_prefix,
         counter=SUBSET_ERROR_COUNTER,
     ):
-        if reference not in subset_typedefs:
-            if reference not in UNDEFINED_SUBSETS:
-                logger.debug("[%s] undefined subset: %s", stanza.curie, reference)
-                UNDEFINED_SUBSETS.add(reference)
+        if reference not in subset_typedefs and reference not in UNDEFINED_SUBSETS:
+            logger.debug("[%s] undefined subset: %s", stanza.curie, reference)
+            UNDEFINED_SUBSETS.add(reference)
         stanza.append_subset(reference)
 
 
@@ -737,7 +1012,7 @@ def _get_subsetdefs(
     for subsetdef in graph.get("subsetdef", []):
         left, _, right = subsetdef.partition(" ")
         if not right:
-            logger.warning("[%s] subsetdef did not have two parts", ontology_prefix, subsetdef)
+            logger.warning("[%s] subsetdef did not have two parts: %s", ontology_prefix, subsetdef)
             continue
         left_ref = _obo_parse_identifier(
             left,
@@ -756,16 +1031,21 @@ def _get_subsetdefs(
 
 def _clean_graph_ontology(graph: nx.MultiDiGraph, prefix: str) -> None:
     """Update the ontology entry in the graph's metadata, if necessary."""
-    if "ontology" not in graph.graph:
+    _clean_header_ontology(graph.graph, prefix)
+
+
+def _clean_header_ontology(header: dict[str, Any], prefix: str) -> None:
+    """Update the ontology entry in the header, if necessary."""
+    if "ontology" not in header:
         logger.debug('[%s] missing "ontology" key', prefix)
-        graph.graph["ontology"] = prefix
-    elif not graph.graph["ontology"].isalpha():
+        header["ontology"] = prefix
+    elif not header["ontology"].isalpha():
         logger.debug(
             "[%s] ontology prefix `%s` has a strange format. replacing with prefix",
             prefix,
-            graph.graph["ontology"],
+            header["ontology"],
         )
-        graph.graph["ontology"] = prefix
+        header["ontology"] = prefix
 
 
 def _iter_obo_graph(
@@ -780,49 +1060,64 @@ def _iter_obo_graph(
     for node, data in tqdm(
         graph.nodes(data=True), disable=not use_tqdm, unit_scale=True, desc=f"[{ontology_prefix}]"
     ):
-        name = data.get("name")
-        match _parse_str_or_curie_or_uri_helper(
-            node,
-            ontology_prefix=ontology_prefix,
-            name=name,
-            upgrade=upgrade,
-            context="stanza ID",
-        ):
-            case Reference() as reference:
-                yield reference, data
-            case NotCURIEError() as exc:
-                if _is_valid_identifier(node):
-                    yield default_reference(ontology_prefix, node, name=name), data
-                elif strict:
-                    raise exc
-                else:
-                    logger.warning(str(exc))
-            case ParseError() as exc:
-                if strict:
-                    raise exc
-                else:
-                    logger.warning(str(exc))
-            # if blacklisted, just skip it with no warning
+        reference = _parse_stanza_id(
+            node, data, strict=strict, ontology_prefix=ontology_prefix, upgrade=upgrade
+        )
+        if reference is not None:
+            yield reference, data
+
+
+def _parse_stanza_id(
+    node: str,
+    data: dict[str, Any],
+    *,
+    strict: bool = False,
+    ontology_prefix: str,
+    upgrade: bool,
+) -> Reference | None:
+    """Parse the identifier of a stanza."""
+    name = data.get("name")
+    match _parse_str_or_curie_or_uri_helper(
+        node,
+        ontology_prefix=ontology_prefix,
+        name=name,
+        upgrade=upgrade,
+        context="stanza ID",
+    ):
+        case Reference() as reference:
+            return reference
+        case NotCURIEError() as exc:
+            if _is_valid_identifier(node):
+                return default_reference(ontology_prefix, node, name=name)
+            elif strict:
+                raise exc
+            else:
+                logger.warning(str(exc))
+        case ParseError() as exc:
+            if strict:
+                raise exc
+            else:
+                logger.warning(str(exc))
+        # if blacklisted, just skip it with no warning
+    return None
 
 
-def _get_date(graph: nx.MultiDiGraph, ontology_prefix: str) -> datetime | None:
+def _get_date(header: Mapping[str, Any], ontology_prefix: str) -> datetime | None:
     try:
-        rv = datetime.strptime(graph.graph["date"], DATE_FORMAT)
+        rv = datetime.strptime(header["date"], DATE_FORMAT)
     except KeyError:
         logger.info("[%s] does not report a date", ontology_prefix)
         return None
     except ValueError:
-        logger.info(
-            "[%s] reports a date that can't be parsed: %s", ontology_prefix, graph.graph["date"]
-        )
+        logger.info("[%s] reports a date that can't be parsed: %s", ontology_prefix, header["date"])
         return None
     else:
         return rv
 
 
-def _get_name(graph: nx.MultiDiGraph, ontology_prefix: str) -> str:
+def _get_name(header: Mapping[str, Any], ontology_prefix: str) -> str:
     try:
-        rv = t.cast(str, graph.graph["name"])
+        rv = t.cast(str, header["name"])
     except KeyError:
         logger.info("[%s] does not report a name", ontology_prefix)
         return ontology_prefix
@@ -834,19 +1129,33 @@ def iterate_graph_synonym_typedefs(
     graph: nx.MultiDiGraph, *, ontology_prefix: str, strict: bool = False, upgrade: bool
 ) -> Iterable[SynonymTypeDef]:
     """Get synonym type definitions from an :mod:`obonet` graph."""
-    for line in graph.graph.get("synonymtypedef", []):
+    yield from _iterate_synonym_typedefs(
+        graph.graph.get("synonymtypedef", []),
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        upgrade=upgrade,
+    )
+
+
+def _iterate_synonym_typedefs(
+    lines: Iterable[str], *, ontology_prefix: str, strict: bool = False, upgrade: bool
+) -> Iterable[SynonymTypeDef]:
+    for line in lines:
         # TODO handle trailing comments
-        line, _, specificity = (x.strip() for x in line.rpartition('"'))
-        specificity = specificity.upper()
-        if not specificity:
+        head, _, specificity_str = (x.strip() for x in line.rpartition('"'))
+        specificity_str = specificity_str.upper()
+        specificity: SynonymScope | None
+        if not specificity_str:
             specificity = None
-        elif specificity not in t.get_args(SynonymScope):
+        elif specificity_str not in t.get_args(SynonymScope):
             if strict:
-                raise ValueError(f"invalid synonym specificty: {specificity}")
-            logger.warning("[%s] invalid synonym specificty: %s", ontology_prefix, specificity)
+                raise ValueError(f"invalid synonym specificty: {specificity_str}")
+            logger.warning("[%s] invalid synonym specificty: %s", ontology_prefix, specificity_str)
             specificity = None
+        else:
+            specificity = t.cast(SynonymScope, specificity_str)
 
-        curie, name = line.split(" ", 1)
+        curie, name = head.split(" ", 1)
         # the name should be in quotes, so strip them out
         name = name.strip().strip('"')
         # TODO unquote the string?
@@ -872,6 +1181,23 @@ def iterate_typedefs(
     macro_config: MacroConfig | None = None,
 ) -> Iterable[TypeDef]:
     """Get type definitions from an :mod:`obonet` graph."""
+    yield from _iterate_typedefs(
+        graph.graph.get("typedefs", []),
+        ontology_prefix=ontology_prefix,
+        strict=strict,
+        upgrade=upgrade,
+        macro_config=macro_config,
+    )
+
+
+def _iterate_typedefs(
+    typedef_data: Iterable[dict[str, Any]],
+    *,
+    ontology_prefix: str,
+    strict: bool = False,
+    upgrade: bool,
+    macro_config: MacroConfig | None = None,
+) -> Iterable[TypeDef]:
     if macro_config is None:
         macro_config = MacroConfig(strict=strict, ontology_prefix=ontology_prefix)
     # can't really have a pre-defined set of synonym typedefs here!
@@ -879,7 +1205,7 @@ def iterate_typedefs(
     typedefs: Mapping[ReferenceTuple, TypeDef] = {}
     subset_typedefs: SubsetTypeDefs = {}  # FIXME
     missing_typedefs: set[ReferenceTuple] = set()
-    for data in graph.graph.get("typedefs", []):
+    for data in typedef_data:
         if "id" in data:
             typedef_id = data["id"]
         elif "identifier" in data:
@@ -1065,7 +1391,7 @@ def _process_chain_helper(
 
 def get_definition(
     data: dict[str, Any], *, node: Reference, ontology_prefix: str, strict: bool = False
-) -> tuple[None | str, list[Reference | OBOLiteral]]:
+) -> tuple[str | None, list[Reference | OBOLiteral]]:
     """Extract the definition from the data."""
     definition = data.get("def")  # it's allowed not to have a definition
     if not definition:
@@ -1081,7 +1407,7 @@ def _extract_definition(
     node: Reference,
     strict: bool = False,
     ontology_prefix: str,
-) -> tuple[None | str, list[Reference | OBOLiteral]]:
+) -> tuple[str | None, list[Reference | OBOLiteral]]:
     """Extract the definitions."""
     if not s.startswith('"'):
         logger.warning(f"[{node.curie}] definition does not start with a quote")
@@ -0,0 +1,164 @@
+"""A streaming tokenizer for the OBO 1.4 flat file format.
+
+This tokenizer produces the same dictionaries for each stanza as :mod:`obonet`
+(i.e., tags mapped to strings for tags that can only appear once and to lists
+of strings otherwise, with trailing modifiers and comments removed), but it
+yields them one at a time instead of constructing a :class:`networkx.MultiDiGraph`.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+__all__ = [
+    "HEADER",
+    "iterate_obo_stanzas",
+    "parse_tag_line",
+]
+
+#: The stanza type used for the header frame
+HEADER = "Header"
+
+#: A regular expression to parse lines that contain
+#: trailing modifiers or comments, adapted from obonet
+TAG_LINE_PATTERN = re.compile(
+    r"""^
+    (?P<tag>.+?):\s*             # tag and separator
+    (?P<value>.*?)               # value: match anything (non-greedy)
+    (?:\s                        # optional trailing modifier
+        (?P<trailing_modifier>
+            (?<!\\)\{[^{}]*\}    # match unescaped {...}
+        )
+    )?
+    (?:\s
+        (?P<comment>            # optional comment
+            (?<!\\)![^\n]*      # match unescaped ! followed by any characters
+        )
+    )?
+    \s*$                        # optional trailing whitespace
+    """,
+    re.VERBOSE,
+)
+
+HEADER_TAG_SINGULARITY = {
+    "format-version": True,
+    "data-version": True,
+    "version": True,
+    "ontology": True,
+    "date": True,
+    "saved-by": True,
+    "auto-generated-by": True,
+    "default-relationship-id-prefix": True,
+}
+
+TERM_TAG_SINGULARITY = {
+    "id": True,
+    "is_anonymous": True,
+    "name": True,
+    "namespace": True,
+    "def": True,
+    "comment": True,
+    "is_obsolete": True,
+    "builtin": True,
+    "created_by": True,
+    "creation_date": True,
+}
+
+TYPEDEF_TAG_SINGULARITY = {
+    "id": True,
+    "is_anonymous": True,
+    "name": True,
+    "namespace": True,
+    "def": True,
+    "domain": True,
+    "range": True,
+    "is_cyclic": True,
+    "is_reflexive": True,
+    "is_symmetric": True,
+    "is_anti_symmetric": True,
+    "is_transitive": True,
+    "is_metadata_tag": True,
+    "is_class_level": True,
+}
+
+INSTANCE_TAG_SINGULARITY = {
+    "id": True,
+    "is_anonymous": True,
+    "name": True,
+    "namespace": True,
+    "comment": True,
+    "instance_of": True,
+    "created_by": True,
+    "creation_date": True,
+    "is_obsolete": True,
+}
+
+STANZA_TAG_SINGULARITY: Mapping[str, Mapping[str, bool]] = {
+    HEADER: HEADER_TAG_SINGULARITY,
+    "Term": TERM_TAG_SINGULARITY,
+    "Typedef": TYPEDEF_TAG_SINGULARITY,
+    "Instance": INSTANCE_TAG_SINGULARITY,
+}
+
+
+def parse_tag_line(line: str) -> tuple[str, str]:
+    r"""Parse a tag-value line, removing trailing modifiers and comments.
+
+    :param line: A line from an OBO file
+    :returns: A pair of the tag and value
+
+    :raises ValueError: If the line can't be parsed
+
+    >>> parse_tag_line("name: lysine dehydrogenase activity\n")
+    ('name', 'lysine dehydrogenase activity')
+    >>> parse_tag_line("is_a: GO:0016491 ! oxidoreductase activity")
+    ('is_a', 'GO:0016491')
+    """
+    # the fast path is for lines that can't contain
+    # trailing modifiers or comments, which is most of them
+    if "!" not in line and "{" not in line:
+        tag, sep, value = line.partition(":")
+        if sep and tag:
+            return tag, value.strip()
+    match = TAG_LINE_PATTERN.match(line)
+    if match is None:
+        raise ValueError(f"Tag-value pair parsing failed for:\n{line}")
+    return match.group("tag"), match.group("value")
+
+
+def iterate_obo_stanzas(lines: Iterable[str]) -> Iterable[tuple[str, dict[str, Any]]]:
+    """Iterate over the frames in an OBO file.
+
+    :param lines: An iterable of lines from an OBO file
+    :yields: Pairs of stanza types (e.g., ``Term``, ``Typedef``, ``Instance``) and
+        dictionaries representing the tag-value pairs. The first pair is always the
+        header, whose stanza type is :data:`HEADER`.
+
+    Unlike :mod:`obonet`, blank lines inside a stanza are allowed, since a stanza
+    only ends when the next one begins.
+    """
+    stanza_type = HEADER
+    singularity: Mapping[str, bool] = HEADER_TAG_SINGULARITY
+    data: dict[str, Any] = {}
+    for line in lines:
+        if line.startswith("!"):
+            continue
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("[") and stripped.endswith("]"):
+            yield stanza_type, data
+            stanza_type = stripped[1:-1]
+            singularity = STANZA_TAG_SINGULARITY.get(stanza_type, {})
+            data = {}
+            continue
+        tag, value = parse_tag_line(line)
+        if singularity.get(tag, False):
+            data[tag] = value
+        elif tag in data:
+            data[tag].append(value)
+        else:
+            data[tag] = [value]
+    yield stanza_type, data
@@ -17,7 +17,7 @@ from obographs import (
 )
 
 from pyobo import Obo, Reference, StanzaType, Synonym, Term, TypeDef, build_ontology
-from pyobo.identifier_utils import get_converter
+from pyobo.identifier_utils import get_converter, get_reference_pool, intern_reference
 from pyobo.struct import Annotation, OBOLiteral
 from pyobo.struct import vocabulary as v
 from pyobo.struct.obograph.utils import INVERSE_PROPERTY_TYPE_MAP
@@ -64,7 +64,7 @@ def from_standardized_graph(prefix: str, graph: StandardizedGraph) -> Obo:
                 typedefs[stanza.reference] = stanza
 
     for edge in graph.edges:
-        s, p, o = (Reference.from_reference(r) for r in (edge.subject, edge.predicate, edge.object))
+        s, p, o = (intern_reference(r) for r in (edge.subject, edge.predicate, edge.object))
         if s in terms:
             stanza = terms[s]
             stanza.append_relationship(p, o)
@@ -77,12 +77,12 @@ def from_standardized_graph(prefix: str, graph: StandardizedGraph) -> Obo:
     auto_generated_by: str | None = None
     if graph.meta:
         for prop in graph.meta.properties or []:
-            predicate = Reference.from_reference(prop.predicate)
+            predicate = intern_reference(prop.predicate)
             if predicate == has_ontology_root_term:
                 if isinstance(prop.value, str):
                     raise TypeError
                 else:
-                    root_terms.append(Reference.from_reference(prop.value))
+                    root_terms.append(intern_reference(prop.value))
             elif predicate == v.obo_autogenerated_by:
                 if not isinstance(prop.value, str):
                     raise TypeError
@@ -95,45 +95,41 @@ def from_standardized_graph(prefix: str, graph: StandardizedGraph) -> Obo:
                         # TODO obographs are limited by ability to specify datatype?
                         value=OBOLiteral.string(prop.value)
                         if isinstance(prop.value, str)
-                        else Reference.from_reference(prop.value),
+                        else intern_reference(prop.value),
                     )
                 )
 
     for equivalent_node_set in graph.equivalent_node_sets:
-        equivalent_reference = Reference.from_reference(equivalent_node_set.node)
+        equivalent_reference = intern_reference(equivalent_node_set.node)
         if equivalent_reference in terms:
             for equivalent in equivalent_node_set.equivalents:
-                terms[equivalent_reference].append_equivalent_to(
-                    Reference.from_reference(equivalent)
-                )
+                terms[equivalent_reference].append_equivalent_to(intern_reference(equivalent))
         elif equivalent_reference in typedefs:
             for equivalent in equivalent_node_set.equivalents:
-                typedefs[equivalent_reference].append_equivalent_to(
-                    Reference.from_reference(equivalent)
-                )
+                typedefs[equivalent_reference].append_equivalent_to(intern_reference(equivalent))
         else:
             logger.warning(
                 "unknown reference node in equivalent_node_set: %s", equivalent_reference.curie
             )
 
     for _domain_range_axiom in graph.domain_range_axioms or []:
-        p = Reference.from_reference(_domain_range_axiom.predicate)
+        p = intern_reference(_domain_range_axiom.predicate)
         if p not in typedefs:
             continue
         # the OBO Graph model allows for multiple ranges
         # or domains, but OBO only one.
         if _domain_range_axiom.ranges:
-            typedefs[p].range = Reference.from_reference(_domain_range_axiom.ranges[0])
+            typedefs[p].range = intern_reference(_domain_range_axiom.ranges[0])
         if _domain_range_axiom.domains:
-            typedefs[p].domain = Reference.from_reference(_domain_range_axiom.domains[0])
+            typedefs[p].domain = intern_reference(_domain_range_axiom.domains[0])
 
     for _property_chain_axiom in graph.property_chain_axioms:
-        p = Reference.from_reference(_property_chain_axiom.predicate)
+        p = intern_reference(_property_chain_axiom.predicate)
         if p not in typedefs or not _property_chain_axiom.chain:
             continue
         # TODO check if its also transitive_over and/or equivalent_to_chain
         typedefs[p].holds_over_chain.append(
-            [Reference.from_reference(r) for r in _property_chain_axiom.chain]
+            [intern_reference(r) for r in _property_chain_axiom.chain]
         )
 
     for _logical_definition_axiom in graph.logical_definition_axioms:
@@ -189,11 +185,7 @@ def _from_property(node: StandardizedNode) -> TypeDef:
 
 
 def _get_ref(node: StandardizedNode) -> Reference:
-    return Reference(
-        prefix=node.reference.prefix,
-        identifier=node.reference.identifier,
-        name=node.label,
-    )
+    return get_reference_pool().get(node.reference.prefix, node.reference.identifier, node.label)
 
 
 def _process_term_meta(meta: StandardizedMeta, term: Term) -> None:
@@ -204,7 +196,7 @@ def _process_term_meta(meta: StandardizedMeta, term: Term) -> None:
             term.append_definition_xref(definition_xref)
 
     if meta.subsets:
-        term.subsets.extend(Reference.from_reference(r) for r in meta.subsets)
+        term.subsets.extend(intern_reference(r) for r in meta.subsets)
 
     for xref in meta.xrefs or []:
         term.append_xref(xref.reference)
@@ -235,8 +227,8 @@ def _from_synonym(syn: StandardizedSynonym) -> Synonym | None:
     return Synonym(
         name=syn.text,
         specificity=REV_SYNONYM_SCOPE[syn.predicate],
-        type=Reference.from_reference(syn.type) if syn.type is not None else None,
-        provenance=[Reference.from_reference(r) for r in syn.xrefs or []],
+        type=intern_reference(syn.type) if syn.type is not None else None,
+        provenance=[intern_reference(r) for r in syn.xrefs or []],
     )
 
 
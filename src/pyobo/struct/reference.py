@@ -80,6 +80,8 @@ def _parse_str_or_curie_or_uri(
 class Referenced:
     """A class that contains a reference."""
 
+    __slots__ = ()
+
     reference: Reference
 
     def __hash__(self) -> int:
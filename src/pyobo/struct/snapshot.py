@@ -0,0 +1,134 @@
+"""Binary snapshots of built ontologies.
+
+Loading an ontology from its source (or from the intermediate :mod:`obonet` cache)
+requires parsing and validating every CURIE again. A snapshot stores the already
+built terms, typedefs, synonym typedefs, and metadata of an :class:`Obo` in a
+versioned pickle, so it can be loaded directly.
+
+Since the settings used for building an ontology (e.g., strict parsing) change the
+result, they're stored in the snapshot, and a snapshot is only loaded with the same
+settings. Settings that don't apply to how an ontology was built (e.g., the OBO parser
+for an OBO Graph JSON source) can be left out of its snapshot, in which case they're
+ignored when reading.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .struct import Obo, _make_ad_hoc_ontology
+from ..version import get_version as get_pyobo_version
+
+__all__ = [
+    "SNAPSHOT_SCHEMA_VERSION",
+    "read_snapshot",
+    "write_snapshot",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The version of the snapshot payload's schema. Increment this
+#: when the snapshot's layout changes in a way that isn't compatible
+SNAPSHOT_SCHEMA_VERSION = 2
+
+
+def write_snapshot(
+    obo: Obo, path: str | Path, *, settings: Mapping[str, Any] | None = None
+) -> None:
+    """Write a binary snapshot of the ontology.
+
+    :param obo: An ontology
+    :param path: The path to write the snapshot to
+    :param settings: The settings used to build the ontology, e.g., ``strict``
+    """
+    payload: dict[str, Any] = {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "pyobo_version": get_pyobo_version(),
+        "settings": dict(settings or {}),
+        "ontology": obo.ontology,
+        "name": obo.name,
+        "auto_generated_by": obo.auto_generated_by,
+        "typedefs": obo.typedefs,
+        "synonym_typedefs": obo.synonym_typedefs,
+        "date": obo.date,
+        "data_version": obo.data_version,
+        "idspaces": obo.idspaces,
+        "root_terms": obo.root_terms,
+        "subsetdefs": obo.subsetdefs,
+        "property_values": obo.property_values,
+        "imports": obo.imports,
+        "ontology_iri": obo.ontology_iri,
+        "ontology_version_iri": obo.ontology_version_iri,
+        "terms": list(obo),
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first so a partially written
+    # snapshot is never picked up by a concurrent reader
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as file:
+        pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+
+
+def read_snapshot(path: str | Path, *, settings: Mapping[str, Any] | None = None) -> Obo | None:
+    """Read a binary snapshot of an ontology.
+
+    :param path: The path to a snapshot written with :func:`write_snapshot`
+    :param settings: The settings that the ontology should have been built with. Only
+        the ones stored in the snapshot are compared.
+    :returns: An ontology, or None if the snapshot doesn't exist, can't be read, or
+        was written with a different schema, PyOBO version, or settings.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as file:
+            payload = pickle.load(file)  # noqa:S301
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError) as e:
+        logger.warning("could not read snapshot at %s: %s", path, e)
+        return None
+    if not isinstance(payload, dict):
+        logger.warning("invalid snapshot at %s", path)
+        return None
+    if payload.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+        logger.debug("[%s] outdated snapshot schema at %s", payload.get("ontology"), path)
+        return None
+    if payload.get("pyobo_version") != get_pyobo_version():
+        logger.debug("[%s] snapshot was written by a different PyOBO", payload.get("ontology"))
+        return None
+    if not _settings_match(payload.get("settings"), settings or {}):
+        logger.debug(
+            "[%s] snapshot was built with different settings: %s",
+            payload.get("ontology"),
+            payload.get("settings"),
+        )
+        return None
+    return _make_ad_hoc_ontology(
+        _ontology=payload["ontology"],
+        _name=payload["name"],
+        _auto_generated_by=payload["auto_generated_by"],
+        _typedefs=payload["typedefs"],
+        _synonym_typedefs=payload["synonym_typedefs"],
+        _date=payload["date"],
+        _data_version=payload["data_version"],
+        _idspaces=payload["idspaces"],
+        _root_terms=payload["root_terms"],
+        _subsetdefs=payload["subsetdefs"],
+        _property_values=payload["property_values"],
+        _imports=payload["imports"],
+        _ontology_iri=payload["ontology_iri"],
+        _ontology_version_iri=payload["ontology_version_iri"],
+        terms=payload["terms"],
+    )
+
+
+def _settings_match(stored: Any, settings: Mapping[str, Any]) -> bool:
+    if not isinstance(stored, dict):
+        return False
+    return all(key in settings and settings[key] == value for key, value in stored.items())
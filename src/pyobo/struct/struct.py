@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import csv
 import datetime
 import inspect
 import itertools as itt
@@ -13,7 +14,9 @@ import tempfile
 import warnings
 from collections import ChainMap, defaultdict
 from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from textwrap import dedent
 from typing import Annotated, Any, ClassVar, Literal, Self, TextIO, cast, overload
@@ -58,6 +61,8 @@ from .struct_utils import (
     _get_prefixes_from_annotations,
     _get_references_from_annotations,
     _tag_property_targets,
+    lazy_containers,
+    lazy_field,
 )
 from .utils import _boolean_tag, obo_escape_slim
 from ..constants import (
@@ -72,8 +77,15 @@ from ..constants import (
     TypeDefType,
     get_semantic_mapping_metadata,
 )
-from ..identifier_utils import Reference
+from ..identifier_utils import Reference, get_reference_pool
 from ..utils.cache import write_gzipped_graph
+from ..utils.columnar import (
+    CacheFormat,
+    get_cache_format,
+    get_format_path,
+    read_table,
+    write_table,
+)
 from ..utils.io import multidict, write_iterable_tsv
 from ..utils.path import (
     CacheArtifact,
@@ -81,6 +93,7 @@ from ..utils.path import (
     get_relation_cache_path,
     prefix_directory_join,
 )
+from ..utils.telemetry import span
 from ..utils.ver import VersionMetadata, get_version
 from ..version import get_version as get_pyobo_version
 
@@ -266,9 +279,27 @@ default_synonym_typedefs: dict[ReferenceTuple, SynonymTypeDef] = {
 }
 
 
-@dataclass
+@lazy_containers(
+    relationships="defaultdict",
+    _axioms="defaultdict",
+    properties="defaultdict",
+    parents="list",
+    intersection_of="list",
+    union_of="list",
+    equivalent_to="list",
+    disjoint_from="list",
+    synonyms="list",
+    xrefs="list",
+    subsets="list",
+)
+@dataclass(slots=True)
 class Term(Stanza):
-    """A term in OBO."""
+    """A term in OBO.
+
+    Since there can be millions of terms in an ontology, terms use slots and their
+    containers, which usually stay empty, are only allocated when they're first
+    accessed.
+    """
 
     #: The primary reference for the entity
     reference: Reference
@@ -277,26 +308,26 @@ class Term(Stanza):
     definition: str | None = None
 
     #: Object properties
-    relationships: RelationsHint = field(default_factory=lambda: defaultdict(list))
+    relationships: RelationsHint = lazy_field()
 
-    _axioms: AnnotationsDict = field(default_factory=lambda: defaultdict(list))
+    _axioms: AnnotationsDict = lazy_field()
 
-    properties: PropertiesHint = field(default_factory=lambda: defaultdict(list))
+    properties: PropertiesHint = lazy_field()
 
     #: Relationships with the default "is_a"
-    parents: list[Reference] = field(default_factory=list)
+    parents: list[Reference] = lazy_field()
 
-    intersection_of: IntersectionOfHint = field(default_factory=list)
-    union_of: UnionOfHint = field(default_factory=list)
-    equivalent_to: list[Reference] = field(default_factory=list)
-    disjoint_from: list[Reference] = field(default_factory=list)
+    intersection_of: IntersectionOfHint = lazy_field()
+    union_of: UnionOfHint = lazy_field()
+    equivalent_to: list[Reference] = lazy_field()
+    disjoint_from: list[Reference] = lazy_field()
 
     #: Synonyms of this term
-    synonyms: list[Synonym] = field(default_factory=list)
+    synonyms: list[Synonym] = lazy_field()
 
     #: Database cross-references, see :func:`get_mappings` for
     #: access to all mappings in an SSSOM-like interface
-    xrefs: list[Reference] = field(default_factory=list)
+    xrefs: list[Reference] = lazy_field()
 
     #: The sub-namespace within the ontology
     namespace: str | None = None
@@ -308,7 +339,7 @@ class Term(Stanza):
 
     builtin: bool | None = None
     is_anonymous: bool | None = None
-    subsets: list[Reference] = field(default_factory=list)
+    subsets: list[Reference] = lazy_field()
 
     def __hash__(self) -> int:
         # have to re-define hash because of the @dataclass
@@ -437,9 +468,10 @@ class Term(Stanza):
             from pyobo.resources.ncbitaxon import get_ncbitaxon_name
 
             name = get_ncbitaxon_name(identifier)
-        return self.append_relationship(
-            v.from_species, Reference(prefix=NCBITAXON_PREFIX, identifier=identifier, name=name)
-        )
+        # there are few species compared to terms, so this usually
+        # gets a shared reference without constructing a new one
+        species = get_reference_pool().get(NCBITAXON_PREFIX, identifier, name)
+        return self.append_relationship(v.from_species, species)
 
     # docstr-coverage:excused `overload`
     @overload
@@ -890,8 +922,8 @@ class Obo:
         ) -> None:
             try:
                 inst = cls(force=force, data_version=version)
-            except Exception as e:
-                click.secho(f"[{cls.ontology}] Got an exception during instantiation - {type(e)}")
+            except Exception:
+                logger.exception("[%s] got an exception during instantiation", cls.ontology)
                 sys.exit(1)
             inst.write_default(
                 write_obograph=False,
@@ -1120,7 +1152,7 @@ class Obo:
 
     def write_obo(
         self,
-        file: None | str | TextIO | Path = None,
+        file: str | TextIO | Path | None = None,
         *,
         use_tqdm: bool = False,
         emit_object_properties: bool = True,
@@ -1292,36 +1324,46 @@ class Obo:
 
     def _get_cache_config(
         self,
-    ) -> list[tuple[CacheArtifact, Sequence[str], Callable[..., Iterable[tuple[Any, ...]]]]]:
+    ) -> list[tuple[CacheArtifact, Sequence[str], Callable[[Stanza], Iterable[tuple[Any, ...]]]]]:
+        """Get the cache artifacts, their headers, and functions generating rows per stanza."""
+        typedefs = self._index_typedefs()
         return [
-            (CacheArtifact.names, [f"{self.ontology}_id", "name"], self.iterate_id_name),
+            (CacheArtifact.names, [f"{self.ontology}_id", "name"], self._iter_stanza_id_name),
             (
                 CacheArtifact.definitions,
                 [f"{self.ontology}_id", "definition"],
-                self.iterate_id_definition,
+                self._iter_stanza_id_definition,
             ),
             (
                 CacheArtifact.species,
                 [f"{self.ontology}_id", "taxonomy_id"],
-                self.iterate_id_species,
+                self._iter_stanza_id_species,
+            ),
+            (CacheArtifact.alts, [f"{self.ontology}_id", "alt_id"], self._iter_stanza_alt_rows),
+            (
+                CacheArtifact.relations,
+                self.relations_header,
+                partial(self._iter_stanza_relation_rows, _warned=set(), typedefs=typedefs),
+            ),
+            (
+                CacheArtifact.edges,
+                self.edges_header,
+                partial(self._iter_stanza_edge_rows, _warned=set(), typedefs=typedefs),
             ),
-            (CacheArtifact.alts, [f"{self.ontology}_id", "alt_id"], self.iterate_alt_rows),
-            (CacheArtifact.relations, self.relations_header, self.iter_relation_rows),
-            (CacheArtifact.edges, self.edges_header, self.iterate_edge_rows),
             (
                 CacheArtifact.object_properties,
                 self.object_properties_header,
-                self.iter_object_properties,
+                self._iter_stanza_object_properties,
             ),
             (
                 CacheArtifact.literal_properties,
                 self.literal_properties_header,
-                self.iter_literal_properties,
+                self._iter_stanza_literal_properties,
             ),
             (
                 CacheArtifact.literal_mappings,
                 ssslm.LiteralMappingTuple._fields,
-                self.iterate_literal_mapping_rows,
+                self._iter_stanza_literal_mapping_rows,
             ),
         ]
 
@@ -1337,8 +1379,20 @@ class Obo:
         with self._get_cache_path(CacheArtifact.prefixes).open("w") as file:
             json.dump(self._get_clean_idspaces(), file, indent=2)
 
-    def write_cache(self, *, force: bool = False) -> None:
-        """Write cache parts."""
+    def write_cache(self, *, force: bool = False, use_tqdm: bool = False) -> None:
+        """Write cache parts.
+
+        All tabular cache artifacts, the SSSOM mappings, and the relation-specific
+        caches are generated during a single pass over the stanzas, so ontologies that
+        are expensive to iterate (e.g., ``iter_only`` sources) are only iterated once.
+        During the pass, rows are written to temporary files, so at most one artifact is
+        held in memory at a time while it's sorted and written. Artifacts that already
+        exist are skipped unless ``force`` is given.
+
+        Tabular artifacts are written in the format given by the ``PYOBO_CACHE_FORMAT``
+        environment variable, see :mod:`pyobo.utils.columnar`.
+        """
+        cache_format = get_cache_format()
         typedefs_path = self._get_cache_path(CacheArtifact.typedefs)
         logger.debug(
             "[%s] caching typedefs to %s",
@@ -1347,54 +1401,124 @@ class Obo:
         )
         typedef_df: pd.DataFrame = self.get_typedef_df()
         typedef_df.sort_values(list(typedef_df.columns), inplace=True)
-        typedef_df.to_csv(typedefs_path, sep="\t", index=False)
+        write_table(typedef_df, typedefs_path, cache_format=cache_format)
 
-        for cache_artifact, header, fn in self._get_cache_config():
+        config = {
+            cache_artifact: (header, fn) for cache_artifact, header, fn in self._get_cache_config()
+        }
+        paths: dict[CacheArtifact, Path] = {}
+        for cache_artifact in config:
             path = self._get_cache_path(cache_artifact)
-            if path.is_file() and not force:
+            if get_format_path(path, cache_format).is_file() and not force:
                 continue
-            logger.info(
-                f"[{self._prefix_version}] writing {cache_artifact.name} to {path}",
-            )
-            write_iterable_tsv(
-                path=path,
-                header=header,
-                it=fn(),
-            )
-
-        semantic_mapping_metadata = get_semantic_mapping_metadata(
-            self.ontology, version=self.data_version, lookup_missing_version=False
-        )
-        semantic_mappings = self.get_semantic_mappings()
-        converter = bioregistry.get_default_converter()
-        semantic_mappings_path = self._get_cache_path(CacheArtifact.mappings)
-        sssom_pydantic.write(
-            semantic_mappings,
-            semantic_mappings_path,
-            metadata=semantic_mapping_metadata,
-            converter=converter,
-        )
+            paths[cache_artifact] = path
 
         typedefs = self._index_typedefs()
+        relation_paths: list[tuple[Reference, Path]] = []
         for relation in (v.is_a, v.has_part, v.part_of, v.from_species, v.orthologous):
             if relation is not v.is_a and relation.pair not in typedefs:
                 continue
-            relations_path = get_relation_cache_path(
+            relation_cache_path = get_relation_cache_path(
                 self.ontology, reference=relation, version=self.data_version
             )
-            if relations_path.is_file() and not force:
+            if get_format_path(relation_cache_path, cache_format).is_file() and not force:
                 continue
+            relation_paths.append((relation, relation_cache_path))
+
+        license_url = bioregistry.get_license_url(self.ontology)
+        source = _get_download_source(self.ontology)
+        counts: dict[CacheArtifact, int] = dict.fromkeys(paths, 0)
+        # writing SSSOM needs all the mappings at once to condense them and to reduce
+        # the prefix map, so they're kept in memory instead of being spilled
+        semantic_mappings: list[sssom_pydantic.SemanticMapping] = []
+        # rows are spilled to temporary files while iterating, so only one artifact at a
+        # time is ever held in memory, when it's sorted before writing
+        with tempfile.TemporaryDirectory(
+            prefix=f"pyobo-{self.ontology}-", dir=typedefs_path.parent
+        ) as directory:
+            spill_paths = {
+                cache_artifact: Path(directory, f"{cache_artifact.name}.tsv")
+                for cache_artifact in paths
+            }
+            with ExitStack() as stack:
+                writers = {
+                    cache_artifact: csv.writer(
+                        stack.enter_context(spill_path.open("w", newline="")), delimiter="\t"
+                    )
+                    for cache_artifact, spill_path in spill_paths.items()
+                }
+                with span(self.ontology, "iterate_stanzas") as record:
+                    record.rows = 0
+                    for stanza in self._iter_stanzas(
+                        use_tqdm=use_tqdm, desc=f"[{self.ontology}] caching"
+                    ):
+                        record.rows += 1
+                        for cache_artifact, writer in writers.items():
+                            for row in config[cache_artifact][1](stanza):
+                                if any(cell is None for cell in row):
+                                    continue
+                                writer.writerow(row)
+                                counts[cache_artifact] += 1
+                        semantic_mappings.extend(
+                            self._iter_stanza_semantic_mappings(
+                                stanza, license_url=license_url, source=source
+                            )
+                        )
+
+            for cache_artifact, path in paths.items():
+                logger.info(
+                    f"[{self._prefix_version}] writing {cache_artifact.name} to {path}",
+                )
+                with span(self.ontology, f"write_{cache_artifact.name}") as record:
+                    record.rows = counts[cache_artifact]
+                    with spill_paths[cache_artifact].open(newline="") as file:
+                        rows = sorted(map(tuple, csv.reader(file, delimiter="\t")))
+                    if cache_format is CacheFormat.tsv:
+                        write_iterable_tsv(path=path, header=config[cache_artifact][0], it=rows)
+                    else:
+                        write_table(
+                            pd.DataFrame(rows, columns=list(config[cache_artifact][0])),
+                            path,
+                            cache_format=cache_format,
+                        )
+                    del rows
+
+        semantic_mapping_metadata = get_semantic_mapping_metadata(
+            self.ontology, version=self.data_version, lookup_missing_version=False
+        )
+        converter = bioregistry.get_default_converter()
+        semantic_mappings_path = self._get_cache_path(CacheArtifact.mappings)
+        with span(self.ontology, "write_sssom") as record:
+            record.rows = len(semantic_mappings)
+            sssom_pydantic.write(
+                semantic_mappings,
+                semantic_mappings_path,
+                metadata=semantic_mapping_metadata,
+                converter=converter,
+            )
+
+        # the relation-specific caches are derived from the full relations cache,
+        # which was either just written or already existed
+        relations_path = self._get_cache_path(CacheArtifact.relations)
+        for relation, relation_cache_path in relation_paths:
             logger.debug(
                 "[%s] caching relation %s ! %s",
                 self._prefix_version,
                 relation.curie,
                 relation.name,
             )
-            relation_df = self.get_filtered_relations_df(relation)
+            relation_df = read_table(
+                relations_path,
+                columns=[f"{self.ontology}_id", TARGET_PREFIX, TARGET_ID],
+                filters=[
+                    (RELATION_PREFIX, "==", relation.prefix),
+                    (RELATION_ID, "==", relation.identifier),
+                ],
+            )
             if not len(relation_df.index):
                 continue
             relation_df.sort_values(list(relation_df.columns), inplace=True)
-            relation_df.to_csv(relations_path, sep="\t", index=False)
+            write_table(relation_df, relation_cache_path, cache_format=cache_format)
 
     def write_default(
         self,
@@ -1415,15 +1539,18 @@ class Obo:
         self.write_metadata()
         self.write_prefix_map()
         if write_cache:
-            self.write_cache(force=force)
+            with span(self.ontology, "write_cache"):
+                self.write_cache(force=force, use_tqdm=use_tqdm)
         if write_obo and (not self._obo_path.is_file() or force):
             logger.info(f"[{self._prefix_version}] writing OBO to {self._obo_path}")
-            self.write_obo(self._obo_path, use_tqdm=use_tqdm)
+            with span(self.ontology, "write_obo"):
+                self.write_obo(self._obo_path, use_tqdm=use_tqdm)
         if (write_ofn or write_owl or (write_obograph and not obograph_use_internal)) and (
             not self._ofn_path.is_file() or force
         ):
             logger.info(f"[{self._prefix_version}] writing OFN to {self._ofn_path}")
-            self.write_ofn(self._ofn_path)
+            with span(self.ontology, "write_ofn"):
+                self.write_ofn(self._ofn_path)
         if write_obograph and (not self._obograph_path.is_file() or force):
             if obograph_use_internal:
                 logger.info(f"[{self._prefix_version}] writing OBO Graph to {self._obograph_path}")
@@ -1446,13 +1573,16 @@ class Obo:
             )
         if write_ttl and (not self._ttl_path.is_file() or force):
             logger.info(f"[{self._prefix_version}] writing OFN Turtle to {self._ttl_path}")
-            self.write_rdf(self._ttl_path)
+            with span(self.ontology, "write_ttl"):
+                self.write_rdf(self._ttl_path)
         if write_skos_ttl and (not self._skos_ttl_path.is_file() or force):
             logger.info(f"[{self._prefix_version}] writing SKOS Turtle to {self._skos_ttl_path}")
-            self.write_skos(self._skos_ttl_path)
+            with span(self.ontology, "write_skos_ttl"):
+                self.write_skos(self._skos_ttl_path)
         if write_obonet and (not self._obonet_gz_path.is_file() or force):
             logger.info(f"[{self._prefix_version}] writing obonet to {self._obonet_gz_path}")
-            self.write_obonet_gz(self._obonet_gz_path)
+            with span(self.ontology, "write_obonet"):
+                self.write_obonet_gz(self._obonet_gz_path)
         if write_nodes:
             nodes_path = self._get_cache_path(CacheArtifact.nodes)
             logger.info(f"[{self._prefix_version}] writing nodes TSV to {nodes_path}")
@@ -1617,8 +1747,11 @@ class Obo:
         for stanza in self._iter_stanzas(
             use_tqdm=use_tqdm, desc=f"[{self.ontology}] getting names"
         ):
-            if self._in_ontology(stanza.reference) and stanza.name:
-                yield stanza.identifier, stanza.name
+            yield from self._iter_stanza_id_name(stanza)
+
+    def _iter_stanza_id_name(self, stanza: Stanza) -> Iterable[tuple[str, str]]:
+        if self._in_ontology(stanza.reference) and stanza.name:
+            yield stanza.identifier, stanza.name
 
     def get_id_name_mapping(self, *, use_tqdm: bool = False) -> Mapping[str, str]:
         """Get a mapping from identifiers to names."""
@@ -1629,14 +1762,18 @@ class Obo:
         for stanza in self._iter_stanzas(
             use_tqdm=use_tqdm, desc=f"[{self.ontology}] getting names"
         ):
-            if stanza.identifier and stanza.definition:
-                yield (
-                    stanza.identifier,
-                    stanza.definition.strip('"')
-                    .replace("\n", " ")
-                    .replace("\t", " ")
-                    .replace("  ", " "),
-                )
+            yield from self._iter_stanza_id_definition(stanza)
+
+    @staticmethod
+    def _iter_stanza_id_definition(stanza: Stanza) -> Iterable[tuple[str, str]]:
+        if stanza.identifier and stanza.definition:
+            yield (
+                stanza.identifier,
+                stanza.definition.strip('"')
+                .replace("\n", " ")
+                .replace("\t", " ")
+                .replace("  ", " "),
+            )
 
     def get_id_definition_mapping(self, *, use_tqdm: bool = False) -> Mapping[str, str]:
         """Get a mapping from identifiers to definitions."""
@@ -1665,8 +1802,14 @@ class Obo:
         for stanza in self._iter_stanzas(
             use_tqdm=use_tqdm, desc=f"[{self.ontology}] getting species"
         ):
-            if isinstance(stanza, Term) and (species := stanza.get_species(prefix=prefix)):
-                yield stanza.identifier, species.identifier
+            yield from self._iter_stanza_id_species(stanza, prefix=prefix)
+
+    @staticmethod
+    def _iter_stanza_id_species(
+        stanza: Stanza, *, prefix: str = NCBITAXON_PREFIX
+    ) -> Iterable[tuple[str, str]]:
+        if isinstance(stanza, Term) and (species := stanza.get_species(prefix=prefix)):
+            yield stanza.identifier, species.identifier
 
     def get_id_species_mapping(
         self, *, prefix: str | None = None, use_tqdm: bool = False
@@ -1755,8 +1898,12 @@ class Obo:
     def iter_object_properties(self, *, use_tqdm: bool = False) -> Iterable[tuple[str, str, str]]:
         """Iterate over object property triples."""
         for stanza in self._iter_stanzas(use_tqdm=use_tqdm):
-            for predicate, target in stanza.iterate_object_properties():
-                yield stanza.curie, predicate.curie, target.curie
+            yield from self._iter_stanza_object_properties(stanza)
+
+    @staticmethod
+    def _iter_stanza_object_properties(stanza: Stanza) -> Iterable[tuple[str, str, str]]:
+        for predicate, target in stanza.iterate_object_properties():
+            yield stanza.curie, predicate.curie, target.curie
 
     def get_object_properties_df(self, *, use_tqdm: bool = False) -> pd.DataFrame:
         """Get all properties as a dataframe."""
@@ -1769,14 +1916,20 @@ class Obo:
     ) -> Iterable[tuple[str, str, str, str, str]]:
         """Iterate over literal properties quads."""
         for stanza in self._iter_stanzas(use_tqdm=use_tqdm):
-            for predicate, target in stanza.iterate_literal_properties():
-                yield (
-                    stanza.curie,
-                    predicate.curie,
-                    target.value,
-                    target.datatype.curie,
-                    target.language or "",
-                )
+            yield from self._iter_stanza_literal_properties(stanza)
+
+    @staticmethod
+    def _iter_stanza_literal_properties(
+        stanza: Stanza,
+    ) -> Iterable[tuple[str, str, str, str, str]]:
+        for predicate, target in stanza.iterate_literal_properties():
+            yield (
+                stanza.curie,
+                predicate.curie,
+                target.value,
+                target.datatype.curie,
+                target.language or "",
+            )
 
     def get_literal_properties_df(self, *, use_tqdm: bool = False) -> pd.DataFrame:
         """Get all properties as a dataframe."""
@@ -1836,9 +1989,22 @@ class Obo:
         _warned: set[ReferenceTuple] = set()
         typedefs = self._index_typedefs()
         for stanza in self._iter_stanzas(use_tqdm=use_tqdm, desc=f"[{self.ontology}] edge"):
-            for predicate, reference in stanza._iter_edges(include_xrefs=include_xrefs):
-                if td := self._get_typedef(stanza, predicate, _warned, typedefs):
-                    yield stanza, td, reference
+            for td, reference in self._iter_stanza_edges(
+                stanza, _warned, typedefs, include_xrefs=include_xrefs
+            ):
+                yield stanza, td, reference
+
+    def _iter_stanza_edges(
+        self,
+        stanza: Stanza,
+        _warned: set[ReferenceTuple],
+        typedefs: Mapping[ReferenceTuple, TypeDef],
+        *,
+        include_xrefs: bool = True,
+    ) -> Iterable[tuple[TypeDef, Reference]]:
+        for predicate, reference in stanza._iter_edges(include_xrefs=include_xrefs):
+            if td := self._get_typedef(stanza, predicate, _warned, typedefs):
+                yield td, reference
 
     @property
     def edges_header(self) -> Sequence[str]:
@@ -1856,9 +2022,18 @@ class Obo:
         _warned: set[ReferenceTuple] = set()
         typedefs = self._index_typedefs()
         for stanza in self._iter_stanzas(use_tqdm=use_tqdm, desc=f"[{self.ontology}] relation"):
-            for predicate, reference in stanza.iterate_relations():
-                if td := self._get_typedef(stanza, predicate, _warned, typedefs):
-                    yield stanza, td, reference
+            for td, reference in self._iter_stanza_relations(stanza, _warned, typedefs):
+                yield stanza, td, reference
+
+    def _iter_stanza_relations(
+        self,
+        stanza: Stanza,
+        _warned: set[ReferenceTuple],
+        typedefs: Mapping[ReferenceTuple, TypeDef],
+    ) -> Iterable[tuple[TypeDef, Reference]]:
+        for predicate, reference in stanza.iterate_relations():
+            if td := self._get_typedef(stanza, predicate, _warned, typedefs):
+                yield td, reference
 
     def get_edges_df(self, *, use_tqdm: bool = False) -> pd.DataFrame:
         """Get an edges dataframe."""
@@ -1866,8 +2041,19 @@ class Obo:
 
     def iterate_edge_rows(self, use_tqdm: bool = False) -> Iterable[tuple[str, str, str]]:
         """Iterate the edge rows."""
-        for term, typedef, reference in self.iterate_edges(use_tqdm=use_tqdm):
-            yield term.curie, typedef.curie, reference.curie
+        _warned: set[ReferenceTuple] = set()
+        typedefs = self._index_typedefs()
+        for stanza in self._iter_stanzas(use_tqdm=use_tqdm, desc=f"[{self.ontology}] edge"):
+            yield from self._iter_stanza_edge_rows(stanza, _warned, typedefs)
+
+    def _iter_stanza_edge_rows(
+        self,
+        stanza: Stanza,
+        _warned: set[ReferenceTuple],
+        typedefs: Mapping[ReferenceTuple, TypeDef],
+    ) -> Iterable[tuple[str, str, str]]:
+        for typedef, reference in self._iter_stanza_edges(stanza, _warned, typedefs):
+            yield stanza.curie, typedef.curie, reference.curie
 
     def _get_typedef(
         self,
@@ -1891,9 +2077,20 @@ class Obo:
         self, use_tqdm: bool = False
     ) -> Iterable[tuple[str, str, str, str, str]]:
         """Iterate the relations' rows."""
-        for term, typedef, reference in self.iterate_relations(use_tqdm=use_tqdm):
+        _warned: set[ReferenceTuple] = set()
+        typedefs = self._index_typedefs()
+        for stanza in self._iter_stanzas(use_tqdm=use_tqdm, desc=f"[{self.ontology}] relation"):
+            yield from self._iter_stanza_relation_rows(stanza, _warned, typedefs)
+
+    def _iter_stanza_relation_rows(
+        self,
+        stanza: Stanza,
+        _warned: set[ReferenceTuple],
+        typedefs: Mapping[ReferenceTuple, TypeDef],
+    ) -> Iterable[tuple[str, str, str, str, str]]:
+        for typedef, reference in self._iter_stanza_relations(stanza, _warned, typedefs):
             yield (
-                term.identifier,
+                stanza.identifier,
                 typedef.prefix,
                 typedef.identifier,
                 reference.prefix,
@@ -2140,8 +2337,15 @@ class Obo:
 
     def iterate_literal_mapping_rows(self) -> Iterable[ssslm.LiteralMappingTuple]:
         """Iterate over literal mapping rows."""
-        for synonym in self.get_literal_mappings():
-            yield synonym._as_row()
+        for stanza in self._iter_stanzas():
+            yield from self._iter_stanza_literal_mapping_rows(stanza)
+
+    def _iter_stanza_literal_mapping_rows(
+        self, stanza: Stanza
+    ) -> Iterable[ssslm.LiteralMappingTuple]:
+        if self._in_ontology(stanza.reference):
+            for literal_mapping in stanza.get_literal_mappings():
+                yield literal_mapping._as_row()
 
     def get_literal_mappings_df(self) -> pd.DataFrame:
         """Get a literal mappings dataframe."""
@@ -2171,24 +2375,31 @@ class Obo:
         license_url = bioregistry.get_license_url(self.ontology)
         source = _get_download_source(self.ontology)
         for stanza in self._iter_stanzas(use_tqdm=progress):
-            subject_type = self._get_stanza_type(stanza)
-            for predicate, obj_ref, context in stanza.get_mappings(
-                include_xrefs=True, add_context=True
-            ):
-                # TODO update object reference with label?
-                yield sssom_pydantic.SemanticMapping(
-                    subject=stanza.reference,
-                    subject_type=subject_type,
-                    predicate=predicate,
-                    object=obj_ref,
-                    confidence=context.confidence,
-                    justification=context.justification,
-                    authors=[context.contributor] if context.contributor else None,
-                    source=source,
-                    subject_source=source,
-                    subject_source_version=self.data_version,
-                    license=license_url,
-                )
+            yield from self._iter_stanza_semantic_mappings(
+                stanza, license_url=license_url, source=source
+            )
+
+    def _iter_stanza_semantic_mappings(
+        self, stanza: Stanza, *, license_url: str | None, source: Reference
+    ) -> Iterable[sssom_pydantic.SemanticMapping]:
+        subject_type = self._get_stanza_type(stanza)
+        for predicate, obj_ref, context in stanza.get_mappings(
+            include_xrefs=True, add_context=True
+        ):
+            # TODO update object reference with label?
+            yield sssom_pydantic.SemanticMapping(
+                subject=stanza.reference,
+                subject_type=subject_type,
+                predicate=predicate,
+                object=obj_ref,
+                confidence=context.confidence,
+                justification=context.justification,
+                authors=[context.contributor] if context.contributor else None,
+                source=source,
+                subject_source=source,
+                subject_source_version=self.data_version,
+                license=license_url,
+            )
 
     def get_mappings_df(self, *, use_tqdm: bool = False) -> pd.DataFrame:
         """Get a dataframe with SSSOM extracted from the OBO document.
@@ -2231,8 +2442,13 @@ class Obo:
 
     def iterate_alt_rows(self) -> Iterable[tuple[str, str]]:
         """Iterate over pairs of terms' primary identifiers and alternate identifiers."""
-        for term, alt in self.iterate_alts():
-            yield term.identifier, alt.identifier
+        for stanza in self._iter_stanzas():
+            yield from self._iter_stanza_alt_rows(stanza)
+
+    def _iter_stanza_alt_rows(self, stanza: Stanza) -> Iterable[tuple[str, str]]:
+        if self._in_ontology(stanza):
+            for alt in stanza.alt_ids:
+                yield stanza.identifier, alt.identifier
 
     def get_id_alts_mapping(self) -> Mapping[str, list[str]]:
         """Get a mapping from identifiers to a list of alternative identifiers."""
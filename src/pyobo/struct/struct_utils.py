@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import itertools as itt
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
-from typing import TYPE_CHECKING, Literal, NamedTuple, Self, TypeAlias, overload
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import field, fields
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    Self,
+    TypeAlias,
+    TypeVar,
+    overload,
+)
 
 import curies
 from curies import ReferenceTuple
@@ -36,6 +47,7 @@ from ..identifier_utils import (
     Reference,
     _is_valid_identifier,
     _parse_str_or_curie_or_uri_helper,
+    get_reference_pool,
 )
 
 if TYPE_CHECKING:
@@ -47,10 +59,16 @@ __all__ = [
     "HasReferencesMixin",
     "ReferenceHint",
     "Stanza",
+    "lazy_containers",
+    "lazy_field",
 ]
 
 logger = logging.getLogger(__name__)
 
+X = TypeVar("X")
+
+_REFERENCE_POOL = get_reference_pool()
+
 
 class Annotation(NamedTuple):
     """A tuple representing a predicate-object pair."""
@@ -124,6 +142,8 @@ stanza_type_to_eq_prop: dict[StanzaType, Reference] = {
 class HasReferencesMixin(ABC):
     """A class that can report on the references it contains."""
 
+    __slots__ = ()
+
     def _get_prefixes(self) -> set[str]:
         return set(self._get_references())
 
@@ -132,9 +152,101 @@ class HasReferencesMixin(ABC):
         raise NotImplementedError
 
 
+class _LazyContainer:
+    """A descriptor for a slot that holds a container, which is allocated lazily.
+
+    Constructing an object leaves the slot empty. The container is only allocated and
+    stored in the slot the first time that the attribute is accessed, and the same
+    container is returned every time after that. This way, the many containers on each
+    term that are never used don't take any memory.
+    """
+
+    def __init__(self, slot: Any, factory: Callable[[], list[Any] | defaultdict[Any, Any]]):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, objtype)
+        except AttributeError:
+            rv = self.factory()
+            self.slot.__set__(obj, rv)
+            return rv
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if value is None:
+            self.__delete__(obj)
+        else:
+            self.slot.__set__(obj, value)
+
+    def __delete__(self, obj: Any) -> None:
+        with contextlib.suppress(AttributeError):
+            self.slot.__delete__(obj)
+
+    def peek(self, obj: Any) -> Any:
+        """Get the container stored for the object, without allocating one."""
+        try:
+            return self.slot.__get__(obj)
+        except AttributeError:
+            return None
+
+
+def _defaultdict_of_lists() -> defaultdict[Any, list[Any]]:
+    return defaultdict(list)
+
+
+def lazy_field() -> Any:
+    """Make a field for a container in a slotted dataclass, used with :func:`lazy_containers`.
+
+    Passing nothing (or None) for this field in the constructor leaves it unallocated.
+    """
+    return field(default=None)
+
+
+def lazy_containers(**factories: Literal["list", "defaultdict"]) -> Callable[[type[X]], type[X]]:
+    """Make the given fields of a slotted dataclass into lazily allocated containers.
+
+    :param factories: A mapping from field names to the kind of container to use. The
+        fields should be defined with :func:`lazy_field`.
+    :returns: A class decorator, which has to be applied after ``@dataclass(slots=True)``
+    """
+
+    def _decorator(cls: type[X]) -> type[X]:
+        descriptors = {}
+        for name, kind in factories.items():
+            descriptors[name] = _LazyContainer(
+                cls.__dict__[name], list if kind == "list" else _defaultdict_of_lists
+            )
+            setattr(cls, name, descriptors[name])
+
+        def __getstate__(self: X) -> dict[str, Any]:  # noqa:N807
+            # skip the containers that are empty, so they stay unallocated when loaded
+            rv = {}
+            for f in fields(cls):  # type:ignore[arg-type]
+                if f.name not in descriptors:
+                    rv[f.name] = getattr(self, f.name)
+                elif value := descriptors[f.name].peek(self):
+                    rv[f.name] = value
+            return rv
+
+        def __setstate__(self: X, state: dict[str, Any]) -> None:  # noqa:N807
+            for key, value in state.items():
+                setattr(self, key, value)
+
+        setattr(cls, "__getstate__", __getstate__)  # noqa:B010
+        setattr(cls, "__setstate__", __setstate__)  # noqa:B010
+        return cls
+
+    return _decorator
+
+
 class Stanza(Referenced, HasReferencesMixin):
     """A high-level class for stanzas."""
 
+    __slots__ = ()
+
     reference: Reference
     relationships: RelationsHint
     properties: PropertiesHint
@@ -155,7 +267,7 @@ class Stanza(Referenced, HasReferencesMixin):
     is_obsolete: bool | None
 
     #: A description of the entity
-    definition: str | None = None
+    definition: str | None
 
     @staticmethod
     def _reference(
@@ -916,23 +1028,23 @@ def _ensure_ref(
 ) -> Reference:
     if isinstance(reference, Referenced):
         return reference.reference
+    # references given to stanzas are shared through the pool, since
+    # the same ones appear as parents, xrefs, etc. on many stanzas
     if isinstance(reference, tuple):
-        return Reference(prefix=reference[0], identifier=reference[1])
+        return _REFERENCE_POOL.get(reference[0], reference[1])
     if isinstance(reference, Reference):
-        return reference
+        return _REFERENCE_POOL.intern(reference)
     if isinstance(reference, curies.NamedReference):
-        return Reference(
-            prefix=reference.prefix, identifier=reference.identifier, name=reference.name
-        )
+        return _REFERENCE_POOL.get(reference.prefix, reference.identifier, reference.name)
     if isinstance(reference, curies.Reference):
-        return Reference(prefix=reference.prefix, identifier=reference.identifier)
+        return _REFERENCE_POOL.get(reference.prefix, reference.identifier)
 
     match _parse_str_or_curie_or_uri_helper(reference, ontology_prefix=ontology_prefix):
         case Reference() as parsed_reference:
             return parsed_reference
         case NotCURIEError() as exc:
             if ontology_prefix and _is_valid_identifier(reference):
-                return default_reference(ontology_prefix, reference)
+                return _REFERENCE_POOL.intern(default_reference(ontology_prefix, reference))
             else:
                 raise exc
         case ParseError() as exc:
@@ -1,20 +1,29 @@
 """Utilities for caching files."""
 
+import functools
 import json
 import logging
-from abc import ABC
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, MutableMapping
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Any, TypeVar
 
 import networkx as nx
-from pystow.cache import Cached
+import pandas as pd
+from pystow.cache import Cached, Getter
 from pystow.cache import CachedCollection as cached_collection  # noqa:N813
-from pystow.cache import CachedDataFrame as cached_df  # noqa:N813
+from pystow.cache import CachedDataFrame as _CachedDataFrame
 from pystow.cache import CachedPickle as cached_pickle  # noqa:N813
 from pystow.utils import safe_open
 
-from .io import open_map_tsv, open_multimap_tsv, write_map_tsv, write_multimap_tsv
+from .columnar import (
+    CacheFormat,
+    get_cache_format,
+    get_format_path,
+    read_table,
+    write_table,
+)
+from .compact import CompactMapping, CompactMultimapping, use_compact_mappings
+from .io import multidict, open_map_tsv, open_multimap_tsv, write_map_tsv, write_multimap_tsv
 
 __all__ = [
     "cached_collection",
@@ -32,7 +41,95 @@ logger = logging.getLogger(__name__)
 X = TypeVar("X")
 
 
-class _CachedMapping(Cached[X], Generic[X], ABC):
+class _ColumnarMixin:
+    """A mixin for caches of tables that can be stored in a columnar format.
+
+    See :mod:`pyobo.utils.columnar`.
+    """
+
+    path: Path
+    force: bool
+    cache: bool
+
+    def _set_cache_format(self, cache_format: str | CacheFormat | None) -> None:
+        self.cache_format = get_cache_format(cache_format)
+        self.tsv_path = self.path
+        self.path = get_format_path(self.path, self.cache_format)
+
+    def __call__(self, func: Getter[X]) -> Getter[X]:
+        """Apply this instance as a decorator, converting an existing TSV cache first."""
+        wrapped: Getter[X] = super().__call__(func)  # type:ignore[misc]
+
+        @functools.wraps(func)
+        def _wrapped() -> X:
+            if (
+                self.cache
+                and not self.force
+                and self.path != self.tsv_path
+                and not self.path.is_file()
+                and self.tsv_path.is_file()
+            ):
+                logger.info("converting %s to %s", self.tsv_path, self.cache_format.value)
+                write_table(
+                    read_table(self.tsv_path), self.tsv_path, cache_format=self.cache_format
+                )
+            return wrapped()
+
+        return _wrapped
+
+    @property
+    def _is_columnar(self) -> bool:
+        return self.cache_format is not CacheFormat.tsv
+
+
+class CachedDataFrame(_ColumnarMixin, _CachedDataFrame):
+    """A cache for dataframes, which can be stored in a columnar format."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        cache: bool = True,
+        force: bool = False,
+        sep: str | None = None,
+        dtype: Any | None = None,
+        read_csv_kwargs: MutableMapping[str, Any] | None = None,
+        *,
+        cache_format: str | CacheFormat | None = None,
+    ) -> None:
+        """Initialize the dataframe cache.
+
+        :param cache_format: The format of the cache. Defaults to the value of the
+            ``PYOBO_CACHE_FORMAT`` environment variable, see
+            :func:`pyobo.utils.columnar.get_cache_format`.
+        """
+        super().__init__(
+            path=path,
+            cache=cache,
+            force=force,
+            sep=sep,
+            dtype=dtype,
+            read_csv_kwargs=read_csv_kwargs,
+        )
+        self._set_cache_format(cache_format)
+
+    def load(self) -> pd.DataFrame:
+        """Load a dataframe."""
+        if self._is_columnar:
+            return read_table(self.path)
+        return super().load()
+
+    def dump(self, rv: pd.DataFrame) -> None:
+        """Write a dataframe."""
+        if self._is_columnar:
+            write_table(rv, self.tsv_path, cache_format=self.cache_format)
+        else:
+            super().dump(rv)
+
+
+cached_df = CachedDataFrame
+
+
+class _CachedMapping(_ColumnarMixin, Cached[X]):
     """A cache for simple mappings."""
 
     def __init__(
@@ -43,11 +140,27 @@ class _CachedMapping(Cached[X], Generic[X], ABC):
         use_tqdm: bool = False,
         force: bool = False,
         cache: bool = True,
+        compact: bool | None = None,
+        cache_format: str | CacheFormat | None = None,
     ) -> None:
-        """Initialize the mapping cache."""
+        """Initialize the mapping cache.
+
+        :param compact: Should a compact mapping be loaded from the cache? See
+            :mod:`pyobo.utils.compact`. Defaults to the value of the
+            ``PYOBO_COMPACT_MAPPINGS`` environment variable.
+        :param cache_format: The format of the cache. Defaults to the value of the
+            ``PYOBO_CACHE_FORMAT`` environment variable, see
+            :func:`pyobo.utils.columnar.get_cache_format`.
+        """
         super().__init__(path=path, cache=cache, force=force)
-        self.header = header
+        self.header = list(header)
         self.use_tqdm = use_tqdm
+        self.compact = use_compact_mappings() if compact is None else compact
+        self._set_cache_format(cache_format)
+
+    def _read_columns(self) -> tuple[pd.Series, pd.Series]:
+        df = read_table(self.path)
+        return df.iloc[:, 0], df.iloc[:, 1]
 
 
 class CachedMapping(_CachedMapping[Mapping[str, str]]):
@@ -55,11 +168,22 @@ class CachedMapping(_CachedMapping[Mapping[str, str]]):
 
     def load(self) -> Mapping[str, str]:
         """Load a TSV file."""
+        if self._is_columnar:
+            keys, values = self._read_columns()
+            if self.compact:
+                return CompactMapping(keys.to_numpy(), values.to_numpy())
+            return dict(zip(keys, values, strict=True))
+        if self.compact:
+            return CompactMapping.from_tsv(self.path)
         return open_map_tsv(self.path, use_tqdm=self.use_tqdm)
 
     def dump(self, rv: Mapping[str, str]) -> None:
         """Write a TSV file."""
-        write_map_tsv(path=self.path, header=self.header, rv=rv)
+        if self._is_columnar:
+            df = pd.DataFrame(list(rv.items()), columns=self.header)
+            write_table(df, self.tsv_path, cache_format=self.cache_format)
+        else:
+            write_map_tsv(path=self.path, header=self.header, rv=rv)
 
 
 cached_mapping = CachedMapping
@@ -99,11 +223,25 @@ class CachedMultidict(_CachedMapping[Mapping[str, list[str]]]):
 
     def load(self) -> Mapping[str, list[str]]:
         """Load a TSV file representing a multimap."""
+        if self._is_columnar:
+            keys, values = self._read_columns()
+            if self.compact:
+                return CompactMultimapping(keys.to_numpy(), values.to_numpy())
+            return multidict(zip(keys, values, strict=True))
+        if self.compact:
+            return CompactMultimapping.from_tsv(self.path)
         return open_multimap_tsv(self.path, use_tqdm=self.use_tqdm)
 
     def dump(self, rv: Mapping[str, list[str]]) -> None:
         """Write a TSV file representing a multimap."""
-        write_multimap_tsv(path=self.path, header=self.header, rv=rv)
+        if self._is_columnar:
+            df = pd.DataFrame(
+                [(key, value) for key, values in rv.items() for value in values],
+                columns=self.header,
+            )
+            write_table(df, self.tsv_path, cache_format=self.cache_format)
+        else:
+            write_multimap_tsv(path=self.path, header=self.header, rv=rv)
 
 
 cached_multidict = CachedMultidict
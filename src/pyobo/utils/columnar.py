@@ -0,0 +1,303 @@
+"""Columnar storage for tabular cache artifacts.
+
+By default, tabular cache artifacts like names, definitions, edges, relations, and
+properties are written as gzipped TSV files, which have to be parsed from scratch every
+time they're loaded. Setting the ``PYOBO_CACHE_FORMAT`` environment variable to
+``parquet`` or ``arrow`` instead stores them as Parquet or Arrow IPC files, which are
+much faster to load and use less memory. This needs :mod:`pyarrow`, which can be
+installed with ``pip install pyobo[arrow]``.
+
+- Columns where values repeat a lot, like prefix and predicate columns, are
+  dictionary-encoded, so each distinct value is only stored once
+- Files are compressed with zstd
+- :func:`read_table` only reads the given columns and skips rows that don't match
+  filters while reading, e.g., to get all triples with a given predicate
+
+Columnar artifacts are written next to where the TSV files would be, e.g.,
+``names.parquet`` instead of ``names.tsv.gz``. TSV files that were cached before the
+format was changed are converted the first time they're loaded, and columnar artifacts
+can be exported back to TSV with :func:`export_tsv`.
+
+.. code-block:: python
+
+    from pyobo.utils.columnar import read_table
+    from pyobo.utils.path import CacheArtifact, get_cache_path
+
+    path = get_cache_path("go", CacheArtifact.relations, version="2025-01-01")
+    df = read_table(
+        path,
+        columns=["go_id", "target_prefix", "target_identifier"],
+        filters=[("relation_prefix", "==", "bfo"), ("relation_identifier", "==", "0000050")],
+    )
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import os
+from collections.abc import Collection, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+__all__ = [
+    "CACHE_FORMAT_ENVIRONMENT_VARIABLE",
+    "CacheFormat",
+    "Filter",
+    "export_tsv",
+    "get_cache_format",
+    "get_format_path",
+    "read_table",
+    "write_table",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The environment variable for the format of tabular cache artifacts
+CACHE_FORMAT_ENVIRONMENT_VARIABLE = "PYOBO_CACHE_FORMAT"
+
+#: Columns are dictionary-encoded if there are at most this fraction of unique values
+DICTIONARY_THRESHOLD = 0.5
+
+#: A filter on a column, like ``("predicate", "==", "rdfs:seeAlso")``
+Filter: TypeAlias = tuple[str, Literal["==", "!=", "in", "not in"], Any]
+
+
+class CacheFormat(enum.Enum):
+    """The formats for tabular cache artifacts."""
+
+    tsv = "tsv"
+    parquet = "parquet"
+    arrow = "arrow"
+
+    @property
+    def suffix(self) -> str:
+        """Get the file suffix for the format."""
+        if self is CacheFormat.tsv:
+            return ".tsv.gz"
+        return f".{self.value}"
+
+
+def get_cache_format(cache_format: str | CacheFormat | None = None) -> CacheFormat:
+    """Get the format for tabular cache artifacts.
+
+    :param cache_format: An explicit format. If not given, it's read from the
+        ``PYOBO_CACHE_FORMAT`` environment variable, defaulting to TSV.
+    :returns: A cache format
+
+    :raises ValueError: If the format isn't one of ``tsv``, ``parquet``, or ``arrow``
+    """
+    if isinstance(cache_format, CacheFormat):
+        return cache_format
+    if cache_format is None:
+        cache_format = os.getenv(CACHE_FORMAT_ENVIRONMENT_VARIABLE) or CacheFormat.tsv.value
+    try:
+        return CacheFormat(cache_format.strip().lower())
+    except ValueError:
+        raise ValueError(
+            f"invalid cache format: {cache_format}. "
+            f"Use one of: {', '.join(f.value for f in CacheFormat)}"
+        ) from None
+
+
+def _get_stem(path: Path) -> str:
+    name = path.name
+    for suffix in (".parquet", ".arrow", ".gz", ".tsv"):
+        name = name.removesuffix(suffix)
+    return name
+
+
+def get_format_path(path: str | Path, cache_format: str | CacheFormat | None = None) -> Path:
+    """Get the path where a tabular cache artifact is stored in the given format.
+
+    :param path: The path to the TSV file for the artifact, e.g., from
+        :func:`pyobo.utils.path.get_cache_path`
+    :param cache_format: The cache format. Defaults to :func:`get_cache_format`.
+    :returns: The path to the artifact in the given format. For TSV, this is the same
+        as the given path.
+    """
+    path = Path(path)
+    cache_format = get_cache_format(cache_format)
+    if cache_format is CacheFormat.tsv:
+        return path
+    return path.with_name(_get_stem(path) + cache_format.suffix)
+
+
+def _get_cache_format_for_path(path: Path) -> CacheFormat:
+    for cache_format in (CacheFormat.parquet, CacheFormat.arrow):
+        if path.name.endswith(cache_format.suffix):
+            return cache_format
+    return CacheFormat.tsv
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arrays = []
+    for column in df.columns:
+        # like in the TSV files, all values are strings and missing values are empty
+        array = pa.array(df[column].fillna("").astype(str).to_numpy(dtype=object), pa.string())
+        if len(array) and pc.count_distinct(array).as_py() <= DICTIONARY_THRESHOLD * len(array):
+            array = array.dictionary_encode()
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def write_table(
+    df: pd.DataFrame, path: str | Path, *, cache_format: str | CacheFormat | None = None
+) -> Path:
+    """Write a tabular cache artifact in the given format.
+
+    :param df: A dataframe
+    :param path: The path to the TSV file for the artifact, e.g., from
+        :func:`pyobo.utils.path.get_cache_path`
+    :param cache_format: The cache format. Defaults to :func:`get_cache_format`.
+    :returns: The path that was written to, see :func:`get_format_path`
+    """
+    cache_format = get_cache_format(cache_format)
+    path = get_format_path(path, cache_format)
+    if cache_format is CacheFormat.tsv:
+        df.to_csv(path, sep="\t", index=False)
+        return path
+
+    table = _to_arrow(df)
+    # write to a temporary file first, so readers never see a partial file
+    tmp_path = path.with_name(path.name + ".tmp")
+    if cache_format is CacheFormat.parquet:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, tmp_path, compression="zstd")
+    else:
+        import pyarrow as pa
+
+        options = pa.ipc.IpcWriteOptions(compression="zstd")
+        with (
+            pa.OSFile(str(tmp_path), "wb") as sink,
+            pa.ipc.new_file(sink, table.schema, options=options) as writer,
+        ):
+            writer.write_table(table)
+    tmp_path.replace(path)
+    return path
+
+
+def _resolve_path(path: Path) -> Path:
+    """Get the path to an existing file for the artifact, preferring the configured format."""
+    format_path = get_format_path(path)
+    if format_path.is_file() or not path.is_file():
+        return format_path
+    return path
+
+
+def _get_expression(filters: Sequence[Filter]) -> pc.Expression | None:
+    import pyarrow.compute as pc
+
+    rv = None
+    for column, operator, value in filters:
+        field = pc.field(column)
+        if operator == "==":
+            expression = field == value
+        elif operator == "!=":
+            expression = field != value
+        elif operator == "in":
+            expression = field.isin(list(value))
+        elif operator == "not in":
+            expression = ~field.isin(list(value))
+        else:
+            raise ValueError(f"invalid filter operator: {operator}")
+        rv = expression if rv is None else rv & expression
+    return rv
+
+
+def _filter_df(df: pd.DataFrame, filters: Sequence[Filter]) -> pd.DataFrame:
+    for column, operator, value in filters:
+        if operator == "==":
+            df = df[df[column] == value]
+        elif operator == "!=":
+            df = df[df[column] != value]
+        elif operator == "in":
+            df = df[df[column].isin(list(value))]
+        elif operator == "not in":
+            df = df[~df[column].isin(list(value))]
+        else:
+            raise ValueError(f"invalid filter operator: {operator}")
+    return df
+
+
+def read_table(
+    path: str | Path,
+    *,
+    columns: Sequence[str] | None = None,
+    filters: Collection[Filter] | None = None,
+    categorical: bool = False,
+) -> pd.DataFrame:
+    """Read a tabular cache artifact.
+
+    :param path: The path to the TSV file for the artifact, e.g., from
+        :func:`pyobo.utils.path.get_cache_path`, or to the artifact in a columnar
+        format. If the artifact exists in the configured format, it's read from there.
+        Otherwise, it's read from the TSV file.
+    :param columns: The columns to read. Defaults to all columns. For columnar
+        formats, other columns aren't read at all.
+    :param filters: Filters that rows must all match. For columnar formats, the
+        filters are applied while reading, so rows that don't match are never loaded.
+    :param categorical: Should dictionary-encoded columns be returned as
+        :class:`pandas.Categorical`? Otherwise, all columns are strings.
+    :returns: A dataframe
+    """
+    path = _resolve_path(Path(path))
+    cache_format = _get_cache_format_for_path(path)
+    filters = list(filters or [])
+    if cache_format is CacheFormat.tsv:
+        df = pd.read_csv(path, sep="\t", dtype=str, keep_default_na=False)
+        df = _filter_df(df, filters)
+        if columns is not None:
+            df = df[list(columns)]
+        return df.reset_index(drop=True)
+
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path, format="parquet" if cache_format is CacheFormat.parquet else "ipc")
+    table = dataset.to_table(
+        columns=list(columns) if columns is not None else None,
+        filter=_get_expression(filters),
+    )
+    if not categorical:
+        table = table.cast(
+            pa.schema(
+                [
+                    pa.field(field.name, field.type.value_type)
+                    if pa.types.is_dictionary(field.type)
+                    else field
+                    for field in table.schema
+                ]
+            )
+        )
+    rv: pd.DataFrame = table.to_pandas()
+    return rv
+
+
+def export_tsv(path: str | Path, tsv_path: str | Path | None = None) -> Path:
+    """Export a tabular cache artifact to a TSV file, e.g., for tools that need TSV.
+
+    :param path: The path to the TSV file for the artifact, e.g., from
+        :func:`pyobo.utils.path.get_cache_path`, or to the artifact in a columnar
+        format
+    :param tsv_path: The path to export to. Defaults to the TSV path for the artifact.
+        It's gzipped if it ends with ``.gz``.
+    :returns: The path that was exported to
+    """
+    path = Path(path)
+    if tsv_path is None:
+        tsv_path = path.with_name(_get_stem(path) + CacheFormat.tsv.suffix)
+    tsv_path = Path(tsv_path)
+    df = read_table(path)
+    df.to_csv(tsv_path, sep="\t", index=False)
+    return tsv_path
@@ -0,0 +1,311 @@
+"""Compact, read-only mappings for large identifier mappings.
+
+Mappings from local unique identifiers to names, definitions, species, or alternate
+identifiers can have millions of entries for prefixes like NCBI Gene. As a dictionary,
+each entry takes two Python string objects and a hash table slot. The mappings here
+instead store identifiers in a sorted array and values in a contiguous string heap,
+which takes several times less memory and loads faster, since the rows are never
+turned into individual Python objects.
+
+- If all identifiers are integers written without leading zeros, they're stored as
+  64-bit integers. Otherwise, they're stored as fixed-width UTF-8 byte strings.
+- If values repeat a lot, like for species, they're dictionary-encoded as integer
+  codes into a vocabulary of unique values. Otherwise, they're stored as UTF-8 bytes in
+  a single buffer, with offsets for the start of each value.
+
+Lookup uses binary search through :func:`numpy.searchsorted`, and strings are only
+decoded when they're accessed.
+
+Compact mappings are used by the cached loaders, like
+:func:`pyobo.get_id_name_mapping`, when the ``PYOBO_COMPACT_MAPPINGS`` environment
+variable is set to ``true``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, TypeAlias
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "COMPACT_MAPPINGS_ENVIRONMENT_VARIABLE",
+    "CompactMapping",
+    "CompactMultimapping",
+    "use_compact_mappings",
+]
+
+#: The environment variable for turning on compact mappings in the cached loaders
+COMPACT_MAPPINGS_ENVIRONMENT_VARIABLE = "PYOBO_COMPACT_MAPPINGS"
+
+#: Values are dictionary-encoded if there are at most this fraction of unique values
+CATEGORICAL_THRESHOLD = 0.5
+
+#: Integer identifiers that can round-trip through a 64-bit integer
+_INTEGER_RE = re.compile(r"0|[1-9][0-9]{0,17}")
+
+StringsHint: TypeAlias = Sequence[str] | np.ndarray | pd.Series
+
+
+def use_compact_mappings() -> bool:
+    """Check if the cached loaders should return compact mappings."""
+    value = os.getenv(COMPACT_MAPPINGS_ENVIRONMENT_VARIABLE, "")
+    return value.strip().lower() in {"1", "true", "yes"}
+
+
+class _StringHeap:
+    """UTF-8 encoded strings in a single buffer, with the offsets where each starts."""
+
+    __slots__ = ("buffer", "offsets")
+
+    def __init__(self, values: Iterable[str]) -> None:
+        encoded = [value.encode("utf-8") for value in values]
+        self.buffer = b"".join(encoded)
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        np.cumsum(lengths, out=self.offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.buffer[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes
+
+
+class _Categories:
+    """Strings that are encoded as integer codes into a vocabulary of unique strings."""
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, codes: np.ndarray, categories: list[str]) -> None:
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.categories[self.codes[index]])
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(len(category) for category in self.categories)
+
+
+_Column: TypeAlias = _StringHeap | _Categories
+
+
+def _encode_values(values: np.ndarray) -> _Column:
+    codes, uniques = pd.factorize(values)
+    if len(uniques) <= CATEGORICAL_THRESHOLD * len(values):
+        dtype = np.min_scalar_type(max(len(uniques) - 1, 0))
+        return _Categories(codes.astype(dtype), [str(u) for u in uniques])
+    return _StringHeap(values)
+
+
+def _encode_keys(keys: StringsHint) -> tuple[np.ndarray, np.ndarray]:
+    """Encode the keys, then sort them.
+
+    :returns: A pair of the sorted, encoded keys, and the order that sorts the keys
+    """
+    keys = np.asarray(keys, dtype=object)
+    if len(keys) and all(_INTEGER_RE.fullmatch(key) for key in keys):
+        encoded = keys.astype(np.int64)
+    else:
+        encoded = np.array([key.encode("utf-8") for key in keys], dtype=np.bytes_)
+    order = np.argsort(encoded, kind="stable")
+    return encoded[order], order
+
+
+class _CompactKeys:
+    """Sorted, encoded keys that can be searched."""
+
+    __slots__ = ("_keys",)
+
+    _keys: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _is_integer(self) -> bool:
+        return self._keys.dtype.kind == "i"
+
+    def _encode_key(self, key: Any) -> int | bytes | None:
+        if not isinstance(key, str):
+            return None
+        if self._is_integer():
+            return int(key) if _INTEGER_RE.fullmatch(key) else None
+        rv = key.encode("utf-8")
+        if len(rv) > self._keys.dtype.itemsize or rv.endswith(b"\x00"):
+            return None
+        return rv
+
+    def _index(self, key: Any) -> int:
+        """Get the position of the key, or -1 if it's not there."""
+        needle = self._encode_key(key)
+        if needle is None:
+            return -1
+        index = int(np.searchsorted(self._keys, needle))
+        if index < len(self._keys) and self._keys[index] == needle:
+            return index
+        return -1
+
+    def __iter__(self) -> Iterator[str]:
+        if self._is_integer():
+            yield from map(str, self._keys.tolist())
+        else:
+            for key in self._keys.tolist():
+                yield key.decode("utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return self._index(key) >= 0
+
+
+class CompactMapping(_CompactKeys, Mapping[str, str]):
+    """A compact, read-only mapping from strings to strings."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, keys: StringsHint, values: StringsHint) -> None:
+        """Build a compact mapping.
+
+        :param keys: The keys. If a key appears several times, its last value is used,
+            like when building a dictionary.
+        :param values: The values, aligned with the keys
+        """
+        if len(keys) != len(values):
+            raise ValueError(f"got {len(keys):,} keys but {len(values):,} values")
+        self._keys, order = _encode_keys(keys)
+        if len(self._keys):
+            # keep the last of each run of duplicate keys
+            last = np.append(self._keys[1:] != self._keys[:-1], True)
+            self._keys, order = self._keys[last], order[last]
+        self._values = _encode_values(np.asarray(values, dtype=object)[order])
+
+    @classmethod
+    def from_items(cls, items: Mapping[str, str] | Iterable[tuple[str, str]]) -> CompactMapping:
+        """Build a compact mapping from a dictionary or from pairs."""
+        if isinstance(items, Mapping):
+            items = items.items()
+        pairs = list(items)
+        return cls([key for key, _ in pairs], [value for _, value in pairs])
+
+    @classmethod
+    def from_tsv(cls, path: str | Path, *, has_header: bool = True) -> CompactMapping:
+        """Load a compact mapping from a two column TSV file, like for a dictionary.
+
+        :param path: The path to a TSV file, which might be gzipped
+        :param has_header: Does the file have a header?
+        :returns: A compact mapping from the first column to the second
+        """
+        df = _read_pairs(path, has_header=has_header)
+        return cls(df[0].to_numpy(), df[1].to_numpy())
+
+    def __getitem__(self, key: str) -> str:
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._values[index]
+
+    def items(self) -> ItemsView[str, str]:
+        """Get a view of pairs of keys and values."""
+        return _CompactItemsView(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the number of bytes used by the underlying arrays."""
+        return self._keys.nbytes + self._values.nbytes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self):,} entries>)"
+
+
+class _CompactItemsView(ItemsView[str, str]):
+    """A view of the items in a compact mapping, which doesn't look up each key."""
+
+    _mapping: CompactMapping
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        for index, key in enumerate(self._mapping):
+            yield key, self._mapping._values[index]
+
+
+class CompactMultimapping(_CompactKeys, Mapping[str, list[str]]):
+    """A compact, read-only mapping from strings to lists of strings."""
+
+    __slots__ = ("_offsets", "_values")
+
+    def __init__(self, keys: StringsHint, values: StringsHint) -> None:
+        """Build a compact multimapping.
+
+        :param keys: The keys, which can appear several times
+        :param values: The values, aligned with the keys. The values for each key are
+            kept in the same order they're given.
+        """
+        if len(keys) != len(values):
+            raise ValueError(f"got {len(keys):,} keys but {len(values):,} values")
+        sorted_keys, order = _encode_keys(keys)
+        starts = np.flatnonzero(np.append(True, sorted_keys[1:] != sorted_keys[:-1]))
+        if not len(sorted_keys):
+            starts = starts[:0]
+        self._keys = sorted_keys[starts]
+        self._offsets = np.append(starts, len(sorted_keys)).astype(np.int64)
+        self._values = _encode_values(np.asarray(values, dtype=object)[order])
+
+    @classmethod
+    def from_items(
+        cls, items: Mapping[str, Iterable[str]] | Iterable[tuple[str, str]]
+    ) -> CompactMultimapping:
+        """Build a compact multimapping from a dictionary of lists or from pairs."""
+        if isinstance(items, Mapping):
+            pairs = [(key, value) for key, values in items.items() for value in values]
+        else:
+            pairs = list(items)
+        return cls([key for key, _ in pairs], [value for _, value in pairs])
+
+    @classmethod
+    def from_tsv(cls, path: str | Path, *, has_header: bool = True) -> CompactMultimapping:
+        """Load a compact multimapping from a two column TSV file with repeated keys.
+
+        :param path: The path to a TSV file, which might be gzipped
+        :param has_header: Does the file have a header?
+        :returns: A compact multimapping from the first column to the second
+        """
+        df = _read_pairs(path, has_header=has_header)
+        return cls(df[0].to_numpy(), df[1].to_numpy())
+
+    def __getitem__(self, key: str) -> list[str]:
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        return [self._values[i] for i in range(self._offsets[index], self._offsets[index + 1])]
+
+    @property
+    def nbytes(self) -> int:
+        """Get the number of bytes used by the underlying arrays."""
+        return self._keys.nbytes + self._offsets.nbytes + self._values.nbytes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self):,} keys>)"
+
+
+def _read_pairs(path: str | Path, *, has_header: bool) -> pd.DataFrame:
+    return pd.read_csv(
+        path,
+        sep="\t",
+        header=None,
+        names=[0, 1],
+        skiprows=1 if has_header else 0,
+        dtype=str,
+        keep_default_na=False,
+        na_filter=False,
+        on_bad_lines="warn",
+    )
@@ -0,0 +1,322 @@
+"""A binary store for text embeddings.
+
+The embeddings for a resource are stored as a two-dimensional NumPy array in a
+``.npy`` file alongside a plain text file listing the local unique identifier for
+each row, one per line. The array is memory-mapped when it's loaded, so looking up
+the vector for a single entity only reads that row from disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "EMBEDDING_DTYPE",
+    "EmbeddingStore",
+    "hash_texts",
+    "read_text_hashes",
+    "search_stores",
+    "write_text_hashes",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The default data type used for storing embeddings
+EMBEDDING_DTYPE = np.float32
+
+#: The default number of rows that are scored at once during search
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+@dataclass
+class EmbeddingStore:
+    """A matrix of embeddings whose rows are labeled by local unique identifiers."""
+
+    #: The local unique identifiers, aligned with the rows of :attr:`matrix`
+    identifiers: list[str]
+    #: A two-dimensional array of embeddings, which might be memory-mapped
+    matrix: np.ndarray
+    #: Are the rows of :attr:`matrix` already normalized to unit length?
+    normalized: bool = False
+    _positions: dict[str, int] = field(init=False, repr=False, compare=False)
+    _norms: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.identifiers) != self.matrix.shape[0]:
+            raise ValueError(
+                f"got {len(self.identifiers):,} identifiers for {self.matrix.shape[0]:,} embeddings"
+            )
+        self._positions = {identifier: i for i, identifier in enumerate(self.identifiers)}
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._positions
+
+    @property
+    def dimension(self) -> int:
+        """Get the dimensionality of the embeddings."""
+        return int(self.matrix.shape[1])
+
+    @classmethod
+    def from_rows(
+        cls,
+        identifiers: Iterable[str],
+        rows: np.ndarray | Iterable[np.ndarray],
+        *,
+        dimension: int,
+        dtype: type[np.floating] = EMBEDDING_DTYPE,
+    ) -> EmbeddingStore:
+        """Construct a store from identifiers and their aligned embeddings."""
+        matrix = np.asarray(list(rows) if not isinstance(rows, np.ndarray) else rows, dtype=dtype)
+        if matrix.size == 0:
+            matrix = matrix.reshape(0, dimension)
+        return cls(identifiers=list(identifiers), matrix=matrix)
+
+    @classmethod
+    def from_df(
+        cls, df: pd.DataFrame, *, dtype: type[np.floating] = EMBEDDING_DTYPE
+    ) -> EmbeddingStore:
+        """Construct a store from a dataframe whose index has local unique identifiers."""
+        return cls.from_rows(
+            df.index.astype(str), df.to_numpy(dtype=dtype), dimension=df.shape[1], dtype=dtype
+        )
+
+    def to_df(self, index_name: str | None = None) -> pd.DataFrame:
+        """Get a dataframe with local unique identifiers as the index."""
+        df = pd.DataFrame(self.matrix, index=pd.Index(self.identifiers, dtype=str))
+        df.index.name = index_name
+        return df
+
+    def get(self, identifier: str) -> np.ndarray | None:
+        """Get the embedding for the given local unique identifier, if available.
+
+        If the matrix is memory-mapped, only the corresponding row is read.
+        """
+        position = self._positions.get(identifier)
+        if position is None:
+            return None
+        return np.array(self.matrix[position])
+
+    def save(self, matrix_path: str | Path, identifiers_path: str | Path) -> None:
+        """Write the matrix as a ``.npy`` file and the identifiers as a text file."""
+        matrix_path = Path(matrix_path)
+        _check_identifiers(self.identifiers)
+        # write to temporary files first so a partially written
+        # store is never picked up by a concurrent reader
+        tmp_matrix_path = _get_tmp_path(matrix_path)
+        with tmp_matrix_path.open("wb") as file:
+            np.save(file, self.matrix)
+        _write_identifiers(identifiers_path, self.identifiers)
+        tmp_matrix_path.replace(matrix_path)
+
+    @classmethod
+    def write_chunks(
+        cls,
+        matrix_path: str | Path,
+        identifiers_path: str | Path,
+        identifiers: list[str],
+        chunks: Iterable[np.ndarray],
+        *,
+        dimension: int,
+        dtype: type[np.floating] = EMBEDDING_DTYPE,
+    ) -> EmbeddingStore:
+        """Write a store whose rows are generated in chunks, then load it.
+
+        :param matrix_path: The path to the ``.npy`` file
+        :param identifiers_path: The path to the text file with identifiers
+        :param identifiers: The local unique identifiers, aligned with the concatenated
+            chunks
+        :param chunks: An iterable of two-dimensional arrays, which are written directly
+            to the memory-mapped file so all rows never have to be in memory at once
+        :param dimension: The dimensionality of the embeddings
+        :param dtype: The data type used for storage
+
+        :returns: The store, memory-mapped from the written file
+        """
+        matrix_path = Path(matrix_path)
+        _check_identifiers(identifiers)
+        tmp_matrix_path = _get_tmp_path(matrix_path)
+        matrix = np.lib.format.open_memmap(
+            tmp_matrix_path, mode="w+", dtype=dtype, shape=(len(identifiers), dimension)
+        )
+        start = 0
+        for chunk in chunks:
+            matrix[start : start + len(chunk)] = chunk
+            start += len(chunk)
+        if start != len(identifiers):
+            raise ValueError(f"got {start:,} embeddings for {len(identifiers):,} identifiers")
+        matrix.flush()
+        del matrix
+        _write_identifiers(identifiers_path, identifiers)
+        tmp_matrix_path.replace(matrix_path)
+        return cls.load(matrix_path, identifiers_path)
+
+    def normalize(self) -> EmbeddingStore:
+        """Get a store whose rows are normalized to unit length, for faster search."""
+        if self.normalized:
+            return self
+        matrix = np.asarray(self.matrix, dtype=EMBEDDING_DTYPE) / self._get_norms()[:, None]
+        return EmbeddingStore(identifiers=self.identifiers, matrix=matrix, normalized=True)
+
+    def _get_norms(self) -> np.ndarray:
+        if self._norms is None:
+            norms = np.empty(len(self), dtype=EMBEDDING_DTYPE)
+            for start in range(0, len(self), DEFAULT_CHUNK_SIZE):
+                chunk = np.asarray(self.matrix[start : start + DEFAULT_CHUNK_SIZE], EMBEDDING_DTYPE)
+                norms[start : start + len(chunk)] = np.linalg.norm(chunk, axis=1)
+            # avoid dividing by zero for empty vectors, which get a score of zero
+            norms[norms == 0.0] = 1.0
+            self._norms = norms
+        return self._norms
+
+    def search(
+        self,
+        vector: np.ndarray,
+        k: int = 10,
+        *,
+        chunk_size: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Get the rows most similar to the vector by cosine similarity.
+
+        :param vector: A one-dimensional query vector
+        :param k: The number of results to return
+        :param chunk_size: The number of rows to score at once. This bounds the memory
+            used when the matrix is memory-mapped.
+
+        :returns: Pairs of local unique identifiers and cosine similarities, sorted in
+            descending order by similarity
+        """
+        return [
+            (identifier, score)
+            for score, identifier in self._top_k(vector, k, chunk_size=chunk_size)
+        ]
+
+    def _top_k(
+        self, vector: np.ndarray, k: int, *, chunk_size: int | None = None
+    ) -> list[tuple[float, str]]:
+        if k <= 0 or not len(self):
+            return []
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        query = np.asarray(vector, dtype=EMBEDDING_DTYPE).ravel()
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0.0:
+            return []
+        query = query / query_norm
+        norms = None if self.normalized else self._get_norms()
+
+        candidates: list[tuple[float, str]] = []
+        for start in range(0, len(self), chunk_size):
+            chunk = np.asarray(self.matrix[start : start + chunk_size], dtype=EMBEDDING_DTYPE)
+            scores = chunk @ query
+            if norms is not None:
+                scores /= norms[start : start + len(chunk)]
+            if len(scores) > k:
+                positions = np.argpartition(-scores, k - 1)[:k]
+            else:
+                positions = np.arange(len(scores))
+            candidates.extend(
+                (float(scores[position]), self.identifiers[start + position])
+                for position in positions.tolist()
+            )
+            # keep the candidate list bounded between chunks
+            if len(candidates) > 4 * k:
+                candidates = heapq.nlargest(k, candidates)
+        return heapq.nlargest(k, candidates)
+
+    @classmethod
+    def load(
+        cls, matrix_path: str | Path, identifiers_path: str | Path, *, mmap: bool = True
+    ) -> EmbeddingStore:
+        """Read a store written with :meth:`save`.
+
+        :param matrix_path: The path to the ``.npy`` file
+        :param identifiers_path: The path to the text file with identifiers
+        :param mmap: Should the matrix be memory-mapped (read-only) instead of being read
+            into memory?
+        """
+        matrix = np.load(matrix_path, mmap_mode="r" if mmap else None)
+        return cls(identifiers=_read_lines(identifiers_path), matrix=matrix)
+
+
+def _get_tmp_path(path: Path) -> Path:
+    return path.with_name(path.name + ".tmp")
+
+
+def _read_lines(path: str | Path) -> list[str]:
+    text = Path(path).read_text()
+    return text.split("\n")[:-1] if text else []
+
+
+def _check_identifiers(identifiers: list[str]) -> None:
+    for identifier in identifiers:
+        if "\n" in identifier:
+            raise ValueError(f"can't store identifier with a newline: {identifier!r}")
+
+
+def _write_identifiers(path: str | Path, identifiers: list[str]) -> None:
+    path = Path(path)
+    tmp_path = _get_tmp_path(path)
+    tmp_path.write_text("".join(f"{identifier}\n" for identifier in identifiers))
+    tmp_path.replace(path)
+
+
+def hash_texts(model_key: str, texts: Iterable[str]) -> list[str]:
+    """Get content hashes that identify the embeddings of texts with a given model.
+
+    :param model_key: A string that identifies the model and its configuration, such
+        as its name and dimensionality. Embeddings with the same hash can be reused.
+    :param texts: The texts that are embedded
+
+    :returns: A list of hexadecimal digests, aligned with the texts
+    """
+    prefix = model_key.encode() + b"\0"
+    return [hashlib.blake2b(prefix + text.encode(), digest_size=16).hexdigest() for text in texts]
+
+
+def write_text_hashes(path: str | Path, hashes: list[str]) -> None:
+    """Write content hashes, aligned with the rows of a store, one per line."""
+    _write_identifiers(path, hashes)
+
+
+def read_text_hashes(path: str | Path) -> list[str]:
+    """Read content hashes written with :func:`write_text_hashes`."""
+    return _read_lines(path)
+
+
+def search_stores(
+    stores: Mapping[str, EmbeddingStore],
+    vector: np.ndarray,
+    k: int = 10,
+    *,
+    chunk_size: int | None = None,
+) -> list[tuple[str, str, float]]:
+    """Get the rows most similar to the vector across several stores.
+
+    :param stores: A dictionary from prefixes to embedding stores. All stores must have
+        the same dimensionality as the vector.
+    :param vector: A one-dimensional query vector
+    :param k: The number of results to return
+    :param chunk_size: The number of rows to score at once
+
+    :returns: Triples of prefixes, local unique identifiers, and cosine similarities,
+        sorted in descending order by similarity
+    """
+    candidates = (
+        (score, prefix, identifier)
+        for prefix, store in stores.items()
+        for score, identifier in store._top_k(vector, k, chunk_size=chunk_size)
+    )
+    return [
+        (prefix, identifier, score) for score, prefix, identifier in heapq.nlargest(k, candidates)
+    ]
@@ -0,0 +1,443 @@
+"""A compact index over a hierarchy for fast reachability queries.
+
+The index assigns each node in a hierarchy an integer and stores the edges from
+children to parents as compressed sparse row (CSR) arrays in both directions. The
+transitive closure (i.e., the ancestors of each node) is computed lazily the first
+time it's needed and stored as sorted CSR rows, so checking if one node is the
+ancestor of another is a binary search. The closure can be turned off for very
+large or deep hierarchies, in which case queries fall back to breadth-first search.
+
+The nodes and edges of an ontology can be stored on disk with :class:`HierarchyArrays`
+as a vocabulary of CURIEs and aligned integer arrays, which is much faster to load
+than parsing the CURIEs in the edges table.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..identifier_utils import Reference
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+__all__ = [
+    "HierarchyArrays",
+    "HierarchyIndex",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The data type used for node identifiers
+NODE_DTYPE = np.int32
+
+_EMPTY = np.empty(0, dtype=NODE_DTYPE)
+
+
+def _build_csr(sources: np.ndarray, targets: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Build CSR arrays where each row contains the (sorted) targets of a source."""
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order].astype(NODE_DTYPE, copy=False)
+
+
+class HierarchyIndex:
+    """A compact, integer-based index over a hierarchy.
+
+    Edges point from a child to its parent, like in the graph returned by
+    :func:`pyobo.get_hierarchy`.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Reference],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        *,
+        closure: bool = True,
+    ) -> None:
+        """Initialize the index.
+
+        :param nodes: A sequence of nodes, whose positions are used as their identifiers
+        :param sources: An array of the identifiers of children
+        :param targets: An array of the identifiers of parents, aligned with ``sources``
+        :param closure: Should the transitive closure be precomputed (lazily, on the
+            first query)? If false, each query runs a breadth-first search.
+        """
+        self.closure = closure
+        self.nodes = list(nodes)
+        self.node_to_id = {node: i for i, node in enumerate(self.nodes)}
+        sources = np.asarray(sources, dtype=NODE_DTYPE)
+        targets = np.asarray(targets, dtype=NODE_DTYPE)
+        n = len(self.nodes)
+        self._parent_indptr, self._parent_indices = _build_csr(sources, targets, n)
+        self._child_indptr, self._child_indices = _build_csr(targets, sources, n)
+        self._ancestor_indptr: np.ndarray | None = None
+        self._ancestor_indices: np.ndarray | None = None
+        self._descendant_indptr: np.ndarray | None = None
+        self._descendant_indices: np.ndarray | None = None
+        self._ancestor_keys: np.ndarray | None = None
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph[Reference], *, closure: bool = True) -> HierarchyIndex:
+        """Construct an index from a directed graph with edges from children to parents."""
+        nodes = list(graph)
+        node_to_id = {node: i for i, node in enumerate(nodes)}
+        sources = np.fromiter(
+            (node_to_id[u] for u, _ in graph.edges()),
+            dtype=NODE_DTYPE,
+            count=graph.number_of_edges(),
+        )
+        targets = np.fromiter(
+            (node_to_id[v] for _, v in graph.edges()),
+            dtype=NODE_DTYPE,
+            count=graph.number_of_edges(),
+        )
+        return cls(nodes, sources, targets, closure=closure)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.node_to_id
+
+    @property
+    def number_of_edges(self) -> int:
+        """Get the number of edges in the hierarchy."""
+        return len(self._parent_indices)
+
+    def encode(self, nodes: Iterable[Reference]) -> np.ndarray:
+        """Get an array of identifiers for the nodes, using -1 for missing nodes."""
+        return np.fromiter((self.node_to_id.get(node, -1) for node in nodes), dtype=NODE_DTYPE)
+
+    def decode(self, ids: Iterable[int]) -> list[Reference]:
+        """Get the nodes for an array of identifiers."""
+        return [self.nodes[i] for i in ids]
+
+    def parent_ids(self, i: int) -> np.ndarray:
+        """Get the identifiers of the parents of a node."""
+        return self._parent_indices[self._parent_indptr[i] : self._parent_indptr[i + 1]]
+
+    def child_ids(self, i: int) -> np.ndarray:
+        """Get the identifiers of the children of a node."""
+        return self._child_indices[self._child_indptr[i] : self._child_indptr[i + 1]]
+
+    def ancestor_ids(self, i: int) -> np.ndarray:
+        """Get a sorted array of the identifiers of all ancestors of a node."""
+        if not self.closure:
+            return self._search(i, self.parent_ids)
+        indptr, indices = self._get_ancestor_closure()
+        return indices[indptr[i] : indptr[i + 1]]
+
+    def descendant_ids(self, i: int) -> np.ndarray:
+        """Get a sorted array of the identifiers of all descendants of a node."""
+        if not self.closure:
+            return self._search(i, self.child_ids)
+        indptr, indices = self._get_descendant_closure()
+        return indices[indptr[i] : indptr[i + 1]]
+
+    def has_ancestor_id(self, i: int, ancestor: int) -> bool:
+        """Check if the second node is an ancestor of the first, by identifier."""
+        row = self.ancestor_ids(i)
+        k = np.searchsorted(row, ancestor)
+        return bool(k < len(row) and row[k] == ancestor)
+
+    def has_ancestor_ids(self, ids: np.ndarray, ancestor_ids: np.ndarray) -> np.ndarray:
+        """Check if each node has the aligned node as an ancestor.
+
+        :param ids: An array of node identifiers
+        :param ancestor_ids: An array of node identifiers, aligned with ``ids``
+        :returns: A boolean array. Pairs where either identifier is negative (i.e.,
+            from :meth:`encode` on a missing node) are false.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        ancestor_ids = np.asarray(ancestor_ids, dtype=np.int64)
+        if not self.closure:
+            return np.fromiter(
+                (
+                    i >= 0 and j >= 0 and self.has_ancestor_id(i, j)
+                    for i, j in zip(ids.tolist(), ancestor_ids.tolist(), strict=True)
+                ),
+                dtype=bool,
+                count=len(ids),
+            )
+        keys = self._get_ancestor_keys()
+        queries = ids * len(self) + ancestor_ids
+        positions = np.searchsorted(keys, queries)
+        found = np.zeros(len(queries), dtype=bool)
+        in_bounds = positions < len(keys)
+        found[in_bounds] = keys[positions[in_bounds]] == queries[in_bounds]
+        found[(ids < 0) | (ancestor_ids < 0)] = False
+        return found
+
+    def get_parents(self, node: Reference) -> set[Reference] | None:
+        """Get the parents of a node, or None if it's not in the hierarchy."""
+        if (i := self.node_to_id.get(node)) is None:
+            return None
+        return set(self.decode(self.parent_ids(i)))
+
+    def get_children(self, node: Reference) -> set[Reference] | None:
+        """Get the children of a node, or None if it's not in the hierarchy."""
+        if (i := self.node_to_id.get(node)) is None:
+            return None
+        return set(self.decode(self.child_ids(i)))
+
+    def get_ancestors(self, node: Reference) -> set[Reference] | None:
+        """Get the ancestors of a node, or None if it's not in the hierarchy."""
+        if (i := self.node_to_id.get(node)) is None:
+            return None
+        return set(self.decode(self.ancestor_ids(i)))
+
+    def get_descendants(self, node: Reference) -> set[Reference] | None:
+        """Get the descendants of a node, or None if it's not in the hierarchy."""
+        if (i := self.node_to_id.get(node)) is None:
+            return None
+        return set(self.decode(self.descendant_ids(i)))
+
+    def has_ancestor(self, node: Reference, ancestor: Reference) -> bool:
+        """Check if the second node is an ancestor of the first."""
+        i = self.node_to_id.get(node)
+        j = self.node_to_id.get(ancestor)
+        if i is None or j is None:
+            return False
+        return self.has_ancestor_id(i, j)
+
+    def _get_ancestor_closure(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._ancestor_indptr is None or self._ancestor_indices is None:
+            self._ancestor_indptr, self._ancestor_indices = self._build_ancestor_closure()
+        return self._ancestor_indptr, self._ancestor_indices
+
+    def _get_descendant_closure(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._descendant_indptr is None or self._descendant_indices is None:
+            indptr, indices = self._get_ancestor_closure()
+            rows = np.repeat(np.arange(len(self), dtype=NODE_DTYPE), np.diff(indptr))
+            self._descendant_indptr, self._descendant_indices = _build_csr(indices, rows, len(self))
+        return self._descendant_indptr, self._descendant_indices
+
+    def _get_ancestor_keys(self) -> np.ndarray:
+        """Get a sorted array encoding each (node, ancestor) pair as a single integer."""
+        if self._ancestor_keys is None:
+            indptr, indices = self._get_ancestor_closure()
+            rows = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(indptr))
+            self._ancestor_keys = rows * len(self) + indices
+        return self._ancestor_keys
+
+    def _build_ancestor_closure(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the ancestors of each node.
+
+        Nodes are visited in topological order starting from the roots, so the
+        ancestors of each node are the union of its parents and their ancestors.
+        Nodes that are in or below a cycle are never reached this way, so they fall
+        back to a breadth-first search.
+        """
+        n = len(self)
+        rows: list[np.ndarray | None] = [None] * n
+        remaining = np.diff(self._parent_indptr)
+        queue = deque(np.flatnonzero(remaining == 0).tolist())
+        while queue:
+            i = queue.popleft()
+            parents = self.parent_ids(i)
+            if len(parents) == 0:
+                rows[i] = _EMPTY
+            else:
+                rows[i] = np.unique(np.concatenate([parents, *(rows[p] for p in parents)]))
+            for child in self.child_ids(i).tolist():
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    queue.append(child)
+
+        n_cyclic = 0
+        for i in range(n):
+            if rows[i] is None:
+                rows[i] = self._search(i, self.parent_ids)
+                n_cyclic += 1
+        if n_cyclic:
+            logger.debug("%d nodes are in or below a cycle in the hierarchy", n_cyclic)
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])  # type:ignore[arg-type]
+        indices = np.concatenate(rows) if rows else _EMPTY  # type:ignore[arg-type]
+        return indptr, indices.astype(NODE_DTYPE, copy=False)
+
+    def _search(self, i: int, neighbors: Callable[[int], np.ndarray]) -> np.ndarray:
+        """Get the nodes reachable from a node with a breadth-first search."""
+        seen = np.zeros(len(self), dtype=bool)
+        seen[i] = True
+        rv = []
+        queue = deque([i])
+        while queue:
+            for j in neighbors(queue.popleft()).tolist():
+                if not seen[j]:
+                    seen[j] = True
+                    rv.append(j)
+                    queue.append(j)
+        return np.array(sorted(rv), dtype=NODE_DTYPE)
+
+
+def _encode_strings(strings: Iterable[str]) -> np.ndarray:
+    return np.frombuffer("\n".join(strings).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_strings(array: np.ndarray) -> list[str]:
+    text = array.tobytes().decode("utf-8")
+    return text.split("\n") if text else []
+
+
+def _reference_from_standard_curie(curie: str) -> Reference:
+    prefix, _, identifier = curie.partition(":")
+    return Reference.model_construct(prefix=prefix, identifier=identifier, name=None)  # type:ignore[arg-type]
+
+
+@dataclass
+class HierarchyArrays:
+    """A compact representation of the nodes and edges in an ontology.
+
+    This is stored on disk as :data:`pyobo.utils.path.CacheArtifact.hierarchy`.
+    """
+
+    #: The CURIEs for all nodes. The first :attr:`n_references` are the ontology's own
+    #: references and the rest are other nodes that appear in edges.
+    nodes: list[str]
+    #: The number of the ontology's own references at the start of :attr:`nodes`
+    n_references: int
+    #: The CURIEs for all predicates
+    predicates: list[str]
+    #: The positions of the subjects in :attr:`nodes`
+    sources: np.ndarray
+    #: The positions of the objects in :attr:`nodes`, aligned with :attr:`sources`
+    targets: np.ndarray
+    #: The positions of the predicates in :attr:`predicates`, aligned with :attr:`sources`
+    predicate_ids: np.ndarray
+
+    @classmethod
+    def from_edges(
+        cls, references: Iterable[str], edges: Iterable[tuple[str, str, str]]
+    ) -> HierarchyArrays:
+        """Construct arrays from the CURIEs of an ontology's references and its edge triples.
+
+        :param references: The CURIEs of the ontology's own references
+        :param edges: Triples of CURIEs for the subject, predicate, and object of each
+            edge, e.g., the rows of :func:`pyobo.get_edges_df`
+        """
+        node_to_id = {curie: i for i, curie in enumerate(references)}
+        n_references = len(node_to_id)
+        predicate_to_id: dict[str, int] = {}
+        sources, predicate_ids, targets = [], [], []
+        for s, p, o in edges:
+            sources.append(node_to_id.setdefault(s, len(node_to_id)))
+            predicate_ids.append(predicate_to_id.setdefault(p, len(predicate_to_id)))
+            targets.append(node_to_id.setdefault(o, len(node_to_id)))
+        return cls(
+            nodes=list(node_to_id),
+            n_references=n_references,
+            predicates=list(predicate_to_id),
+            sources=np.array(sources, dtype=NODE_DTYPE),
+            targets=np.array(targets, dtype=NODE_DTYPE),
+            predicate_ids=np.array(predicate_ids, dtype=NODE_DTYPE),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the arrays to a NumPy archive."""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            np.savez(
+                file,
+                nodes=_encode_strings(self.nodes),
+                n_references=np.array(self.n_references),
+                predicates=_encode_strings(self.predicates),
+                sources=self.sources,
+                targets=self.targets,
+                predicate_ids=self.predicate_ids,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> HierarchyArrays:
+        """Read the arrays from a NumPy archive written with :meth:`save`."""
+        with np.load(path) as data:
+            return cls(
+                nodes=_decode_strings(data["nodes"]),
+                n_references=int(data["n_references"]),
+                predicates=_decode_strings(data["predicates"]),
+                sources=data["sources"],
+                targets=data["targets"],
+                predicate_ids=data["predicate_ids"],
+            )
+
+    def get_references(self) -> list[Reference]:
+        """Get references for all nodes.
+
+        The CURIEs were already standardized when the arrays were built, so this skips
+        validation.
+        """
+        return [_reference_from_standard_curie(curie) for curie in self.nodes]
+
+    def select(
+        self, predicates: Collection[str], reverse_predicates: Collection[str] = ()
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the edges with the given predicates, in their original order.
+
+        :param predicates: CURIEs for predicates whose edges are kept as-is
+        :param reverse_predicates: CURIEs for predicates whose edges are reversed
+        :returns: Aligned arrays of the sources, targets, and predicate identifiers of
+            the selected edges
+        """
+        forward = np.isin(self.predicate_ids, self._get_predicate_ids(predicates))
+        reverse = np.isin(self.predicate_ids, self._get_predicate_ids(reverse_predicates))
+        reverse &= ~forward
+        mask = forward | reverse
+        reverse = reverse[mask]
+        sources, targets = self.sources[mask], self.targets[mask]
+        return (
+            np.where(reverse, targets, sources),
+            np.where(reverse, sources, targets),
+            self.predicate_ids[mask],
+        )
+
+    def _get_predicate_ids(self, predicates: Collection[str]) -> np.ndarray:
+        predicates = set(predicates)
+        return np.array(
+            [i for i, predicate in enumerate(self.predicates) if predicate in predicates],
+            dtype=NODE_DTYPE,
+        )
+
+    def get_index(
+        self,
+        predicates: Collection[str],
+        reverse_predicates: Collection[str] = (),
+        *,
+        closure: bool = True,
+    ) -> HierarchyIndex:
+        """Get an index over the ontology's references and the selected edges.
+
+        :param predicates: CURIEs for predicates from children to parents
+        :param reverse_predicates: CURIEs for predicates from parents to children
+        :param closure: Passed to :class:`HierarchyIndex`
+        :returns: An index that contains the ontology's own references and any nodes
+            that appear in the selected edges
+        """
+        sources, targets, _ = self.select(predicates, reverse_predicates)
+        keep = np.zeros(len(self.nodes), dtype=bool)
+        keep[: self.n_references] = True
+        keep[sources] = True
+        keep[targets] = True
+        positions = np.flatnonzero(keep)
+        new_ids = np.full(len(self.nodes), -1, dtype=NODE_DTYPE)
+        new_ids[positions] = np.arange(len(positions), dtype=NODE_DTYPE)
+        # like in a directed graph, parallel edges are collapsed
+        edges = np.unique(np.stack([new_ids[sources], new_ids[targets]], axis=1), axis=0)
+        return HierarchyIndex(
+            [_reference_from_standard_curie(self.nodes[i]) for i in positions.tolist()],
+            edges[:, 0],
+            edges[:, 1],
+            closure=closure,
+        )
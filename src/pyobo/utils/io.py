@@ -126,10 +126,10 @@ def write_iterable_tsv(
     *,
     path: str | Path,
     header: Iterable[str] | None = None,
-    it: Iterable[tuple[str, ...]],
+    it: Iterable[tuple[str | None, ...]],
     sep: str = "\t",
 ) -> None:
-    """Write a mapping dictionary to a TSV file."""
+    """Write a mapping dictionary to a TSV file, skipping rows with missing cells."""
     it = (row for row in it if all(cell is not None for cell in row))
     it = sorted(it)
     with safe_open_writer(path, delimiter=sep) as writer:
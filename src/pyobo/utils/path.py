@@ -7,6 +7,7 @@ import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 import curies
 import pandas as pd
@@ -14,7 +15,12 @@ from pystow import VersionHint
 from pystow.utils.download import DownloadKwargs
 from typing_extensions import Unpack
 
-from ..constants import CACHE_SUBDIRECTORY_NAME, RAW_MODULE, RELATION_SUBDIRECTORY_NAME
+from ..constants import (
+    CACHE_SUBDIRECTORY_NAME,
+    PROPERTY_SUBDIRECTORY_NAME,
+    RAW_MODULE,
+    RELATION_SUBDIRECTORY_NAME,
+)
 
 if TYPE_CHECKING:
     from pandas._typing import DtypeArg
@@ -25,6 +31,7 @@ __all__ = [
     "ensure_json",
     "ensure_path",
     "get_cache_path",
+    "get_property_cache_path",
     "get_relation_cache_path",
     "join_path",
     "prefix_directory_join",
@@ -137,6 +144,7 @@ class CacheArtifact(enum.Enum):
     alts = "alt_ids.tsv.gz"
     typedefs = "typedefs.tsv.gz"
     literal_mappings = "literal_mappings.tsv.gz"
+    grounding_index = "grounding_index.pkl"
     references = "references.tsv.gz"
     obsoletes = "obsolete.tsv.gz"
 
@@ -145,11 +153,15 @@ class CacheArtifact(enum.Enum):
 
     nodes = "nodes.tsv.gz"
     edges = "edges.tsv.gz"
+    hierarchy = "hierarchy.npz"
 
     prefixes = "prefixes.json"
     metadata = "metadata.json"
 
     embeddings = "embeddings.tsv.gz"
+    embeddings_matrix = "embeddings.npy"
+    embedding_identifiers = "embedding_identifiers.txt"
+    embedding_hashes = "embedding_hashes.txt"
 
 
 def get_cache_path(
@@ -174,3 +186,18 @@ def get_relation_cache_path(
     return prefix_directory_join(
         ontology, RELATION_SUBDIRECTORY_NAME, name=f"{reference.curie}.tsv", version=version
     )
+
+
+def get_property_cache_path(
+    ontology: str,
+    reference: curies.Reference,
+    *,
+    version: str | None = None,
+) -> Path:
+    """Get a property cache path."""
+    # properties are sometimes IRIs that didn't get compressed nicely,
+    # so make sure there aren't any slashes in the file name
+    name = quote(reference.curie, safe=":")
+    return prefix_directory_join(
+        ontology, PROPERTY_SUBDIRECTORY_NAME, name=f"{name}.tsv.gz", version=version
+    )
@@ -0,0 +1,220 @@
+"""Timing and memory telemetry for builds.
+
+Telemetry is turned off by default. It's turned on by setting the
+``PYOBO_TELEMETRY`` environment variable to the path of a JSON lines file, e.g.,
+with ``pyobo database build --telemetry report.jsonl``. Then, each phase of building
+an ontology or a database writes one record with its prefix, duration, peak resident
+memory, and number of rows to the file.
+
+Since the environment variable is inherited by subprocesses, records from parallel
+builds go into the same file. Records can be aggregated with
+:func:`summarize_telemetry` to find the slowest prefixes and phases.
+
+.. code-block:: python
+
+    from pyobo.utils.telemetry import span
+
+    with span("go", "parse") as record:
+        ontology = ...
+        record.rows = len(ontology)
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "TELEMETRY_ENVIRONMENT_VARIABLE",
+    "Span",
+    "get_telemetry_path",
+    "read_telemetry",
+    "span",
+    "summarize_telemetry",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The environment variable that has the path to the telemetry report
+TELEMETRY_ENVIRONMENT_VARIABLE = "PYOBO_TELEMETRY"
+
+#: How often the memory is sampled, in seconds
+SAMPLE_INTERVAL = 0.1
+
+_WRITE_LOCK = threading.Lock()
+
+
+def get_telemetry_path() -> Path | None:
+    """Get the path to the telemetry report, if telemetry is turned on."""
+    value = os.getenv(TELEMETRY_ENVIRONMENT_VARIABLE)
+    if not value:
+        return None
+    return Path(value).expanduser()
+
+
+@dataclass
+class Span:
+    """A record of a phase of a build."""
+
+    #: The prefix of the resource being built, if applicable
+    prefix: str | None
+    #: The name of the phase, e.g., ``download`` or ``parse``
+    phase: str
+    #: When the phase started, as an ISO 8601 timestamp
+    start: str
+    #: The number of rows produced by the phase, if applicable
+    rows: int | None = None
+    #: The duration of the phase, in seconds
+    duration: float = 0.0
+    #: The resident memory at the start of the phase, in bytes
+    rss_start: int | None = None
+    #: The highest sampled resident memory during the phase, in bytes
+    rss_peak: int | None = None
+    #: The name of the exception that was raised during the phase, if any
+    error: str | None = None
+    #: The ID of the process that ran the phase
+    pid: int = field(default_factory=os.getpid)
+    #: Additional information about the phase, e.g., the version
+    extras: dict[str, Any] = field(default_factory=dict)
+
+    def _sample(self, rss: int | None) -> None:
+        if rss is not None and (self.rss_peak is None or rss > self.rss_peak):
+            self.rss_peak = rss
+
+
+class _MemorySampler:
+    """Periodically samples the resident memory for all active spans in a thread."""
+
+    def __init__(self) -> None:
+        self._active: dict[int, Span] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def add(self, record: Span) -> None:
+        with self._lock:
+            self._active[id(record)] = record
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def remove(self, record: Span) -> None:
+        with self._lock:
+            self._active.pop(id(record), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                records = list(self._active.values())
+            rss = _get_rss()
+            for record in records:
+                record._sample(rss)
+            time.sleep(SAMPLE_INTERVAL)
+
+
+_SAMPLER = _MemorySampler()
+
+
+def _get_rss() -> int | None:
+    """Get the current resident memory of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:  # i.e., on windows
+        return None
+    # this is the peak over the lifetime of the process, which is
+    # in kilobytes on linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+@contextmanager
+def span(prefix: str | None, phase: str, **extras: Any) -> Iterator[Span]:
+    """Time a phase of a build and write it to the telemetry report, if turned on.
+
+    :param prefix: The prefix of the resource being built, if applicable
+    :param phase: The name of the phase
+    :param extras: Additional information to add to the record
+
+    :yields: A record, whose ``rows`` and ``extras`` can be updated inside the block
+    """
+    record = Span(
+        prefix=prefix,
+        phase=phase,
+        start=datetime.datetime.now().isoformat(),
+        extras=extras,
+    )
+    path = get_telemetry_path()
+    if path is None:
+        yield record
+        return
+
+    record.rss_start = _get_rss()
+    record._sample(record.rss_start)
+    _SAMPLER.add(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record.error = e.__class__.__name__
+        raise
+    finally:
+        record.duration = time.perf_counter() - start
+        _SAMPLER.remove(record)
+        record._sample(_get_rss())
+        _write_record(path, record)
+
+
+def _write_record(path: Path, record: Span) -> None:
+    line = json.dumps(asdict(record), default=str) + "\n"
+    try:
+        with _WRITE_LOCK, path.open("a") as file:
+            file.write(line)
+    except OSError:
+        logger.warning("could not write telemetry to %s", path)
+
+
+def read_telemetry(path: str | Path) -> pd.DataFrame:
+    """Read a telemetry report into a dataframe with one row per record."""
+    import pandas as pd
+
+    return pd.read_json(path, lines=True)
+
+
+def summarize_telemetry(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate a telemetry report by prefix and phase.
+
+    :param df: A dataframe from :func:`read_telemetry`
+    :returns: A dataframe with the number of records, total duration, largest peak
+        resident memory, and total number of rows for each prefix and phase, sorted by
+        descending duration
+    """
+    return (
+        df.groupby(["prefix", "phase"], dropna=False)
+        .agg(
+            count=("duration", "size"),
+            duration=("duration", "sum"),
+            rss_peak=("rss_peak", "max"),
+            rows=("rows", "sum"),
+        )
+        .sort_values("duration", ascending=False)
+        .reset_index()
+    )
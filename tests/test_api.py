@@ -8,6 +8,7 @@ from unittest import mock
 
 import bioregistry
 import curies
+import pandas as pd
 from curies import ReferenceTuple
 from curies import vocabulary as _v
 from pydantic import ValidationError
@@ -21,9 +22,12 @@ from pyobo import (
     default_reference,
     get_name,
     get_name_by_curie,
+    get_names,
     get_primary_curie,
     get_primary_identifier,
     get_primary_reference,
+    get_primary_references,
+    get_species_batch,
 )
 from pyobo.mocks import get_mock_id_alts_mapping, get_mock_id_name_mapping
 from pyobo.ner import get_grounder
@@ -174,6 +178,70 @@ class TestAltIds(unittest.TestCase):
         self.assertEqual("52818", primary_id)
         self.assertEqual("Allamanda cathartica", get_name(ReferenceTuple("ncbitaxon", "52818")))
 
+    @mock_id_alts_mapping
+    @mock_id_names_mapping
+    def test_batch(self, _: Any, __: Any) -> None:
+        """Test looking up names and primary references for many entities at once."""
+        name = "DNA-binding transcription factor activity"
+        references: list[str | ReferenceTuple] = [
+            "go:0003700",
+            "GO:0001071",
+            ReferenceTuple("go", "0001071"),
+            "ncbitaxon:52818",
+            "go:1234567",
+            "nope:1",
+            "nope",
+            "go:GO:0003700",
+        ]
+        self.assertEqual(
+            [name, name, name, "Allamanda cathartica", None, None, None, name],
+            get_names(references),
+        )
+        self.assertEqual(
+            [name, None, None, "Allamanda cathartica", None, None, None, name],
+            get_names(references, upgrade_identifier=False),
+        )
+        self.assertEqual(
+            [name, name, name, "Allamanda cathartica", None, None, None, name],
+            get_names(iter(references), upgrade_identifier=True),
+        )
+
+        primary = Reference(prefix="go", identifier="0003700")
+        self.assertEqual(
+            [
+                primary,
+                primary,
+                primary,
+                Reference(prefix="ncbitaxon", identifier="52818"),
+                Reference(prefix="go", identifier="1234567"),
+                None,
+                None,
+                primary,
+            ],
+            get_primary_references(references),
+        )
+
+        series = pd.Series(["go:0001071", "nope:1", "ncbitaxon:52818"], index=[5, 3, 1])
+        names = get_names(series)
+        if not isinstance(names, pd.Series):
+            self.fail("names should be aligned with the input series")
+        pd.testing.assert_series_equal(
+            pd.Series([name, None, "Allamanda cathartica"], index=[5, 3, 1], dtype=object),
+            names,
+        )
+
+    @mock_id_alts_mapping
+    def test_species_batch(self, _: Any) -> None:
+        """Test looking up species for many entities at once, using primary identifiers."""
+        with mock.patch(
+            "pyobo.api.species.get_id_species_mapping",
+            side_effect=lambda prefix, **_: {"0003700": "9606"} if prefix == "go" else {},
+        ):
+            self.assertEqual(
+                ["9606", "9606", None, None],
+                get_species_batch(["go:0003700", "go:0001071", "go:1234567", "ncbitaxon:1"]),
+            )
+
 
 class TestEverything(unittest.TestCase):
     """Big test for everything."""
@@ -325,6 +393,15 @@ class TestEverything(unittest.TestCase):
             value = pyobo.get_property(r1, prop=v.comment, cache=False, use_tqdm=False)
             self.assertEqual("test comment", value)
 
+            with mock.patch("pyobo.api.properties.get_properties_df") as mock_properties_df:
+                value = pyobo.get_property(r1, prop=v.comment, cache=False, use_tqdm=False)
+                # the mapping for the property is cached in memory
+                mock_properties_df.assert_not_called()
+            self.assertEqual("test comment", value)
+            self.assertIsNone(
+                pyobo.get_property(r3, prop=v.comment.curie, cache=False, use_tqdm=False)
+            )
+
             edges = pyobo.get_edges(TEST_P1, cache=False, use_tqdm=False)
             self.assertEqual(
                 {
@@ -336,7 +413,10 @@ class TestEverything(unittest.TestCase):
                 set(edges),
             )
 
-            graph = pyobo.get_hierarchy(TEST_P1, cache=False, use_tqdm=False)
+            with mock.patch("pyobo.api.hierarchy.get_literal_properties") as mock_properties:
+                graph = pyobo.get_hierarchy(TEST_P1, cache=False, use_tqdm=False)
+                # properties are only loaded when requested
+                mock_properties.assert_not_called()
             self.assertEqual(4, graph.number_of_nodes())
             self.assertIn(r1, graph)
             self.assertIn(r2, graph)
@@ -372,3 +452,39 @@ class TestEverything(unittest.TestCase):
                     r1.curie, r3.curie, cache=False, use_tqdm=False, direction="down"
                 )
             )
+
+            index = pyobo.get_hierarchy_index(TEST_P1, cache=False, use_tqdm=False)
+            self.assertEqual(graph.number_of_nodes(), len(index))
+            self.assertEqual(
+                [True, False],
+                index.has_ancestor_ids(index.encode([r3, r1]), index.encode([r1, r3])).tolist(),
+            )
+
+
+class TestProperties(unittest.TestCase):
+    """Test the in-memory cache for property mappings."""
+
+    def test_memo(self) -> None:
+        """Test that the memo is keyed on prefix, version, and property and cleared by force."""
+        df = pd.DataFrame([("0000001", "a")], columns=[f"{TEST_P1}_id", "value"])
+        with mock.patch(
+            "pyobo.api.properties.get_filtered_properties_df", return_value=df
+        ) as mock_df:
+            prop = v.comment.curie
+            expected = {"0000001": "a"}
+            self.assertEqual(
+                expected, pyobo.get_filtered_properties_mapping(TEST_P1, prop, version="memo")
+            )
+            # other arguments don't change the key
+            self.assertEqual(
+                expected,
+                pyobo.get_filtered_properties_mapping(
+                    TEST_P1, prop, version="memo", cache=False, use_tqdm=False
+                ),
+            )
+            self.assertEqual(1, mock_df.call_count)
+
+            pyobo.get_filtered_properties_mapping(TEST_P1, prop, version="memo", force=True)
+            self.assertEqual(2, mock_df.call_count)
+            pyobo.get_filtered_properties_mapping(TEST_P1, prop, version="memo")
+            self.assertEqual(2, mock_df.call_count)
@@ -0,0 +1,121 @@
+"""Tests for building the database."""
+
+import dataclasses
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from pyobo.cli.database_utils import DatabaseTable, TableShards, _build_table
+from pyobo.getters import NoBuildError
+
+
+def _iter_extra_rows() -> list[tuple[str, str, str]]:
+    return [("ncbigene", "1", "A1BG")]
+
+
+def _fail(prefix: str, **kwargs: Any) -> dict[str, str]:
+    raise NoBuildError(prefix)
+
+
+TABLE = DatabaseTable(
+    "names",
+    ("prefix", "identifier", "name"),
+    getter=lambda prefix: {},
+    rows=lambda prefix, mapping: [(prefix, key, value) for key, value in mapping.items()],
+    extras=(("ncbigene", _iter_extra_rows),),
+)
+
+
+class TestShards(unittest.TestCase):
+    """Test resumable, sharded database builds."""
+
+    def test_resume_and_merge(self) -> None:
+        """Test that complete shards are skipped and that merging keeps prefix order."""
+        with tempfile.TemporaryDirectory() as directory:
+            shards = TableShards(TABLE, directory)
+            shards.write("go", [("go", "0000001", "mitochondrion inheritance")], version="1")
+            shards.write("chebi", [("chebi", "1", "a"), ("chebi", "2", "b")], version="5")
+
+            # simulate a crash, then resume
+            shards = TableShards(TABLE, directory)
+            self.assertTrue(shards.is_complete("go", "1"))
+            self.assertFalse(shards.is_complete("go", "2"))
+            self.assertFalse(shards.is_complete("doid", None))
+            self.assertEqual(2, shards.manifest.prefixes["chebi"].count)
+
+            for key, extra in TABLE.extras:
+                shards.write(key, extra(), extra=True)
+            paths = shards.merge(["go", "chebi", "doid"])
+            data_path = Path(directory).joinpath("names.tsv.gz")
+            self.assertIn(data_path, paths)
+            self.assertEqual(
+                [
+                    ("chebi", "1", "a"),
+                    ("chebi", "2", "b"),
+                    ("go", "0000001", "mitochondrion inheritance"),
+                    ("ncbigene", "1", "A1BG"),
+                ],
+                list(shards._iter_rows(["go", "chebi", "doid"])),
+            )
+
+            # after merging, the next build starts over
+            shards = TableShards(TABLE, directory)
+            self.assertFalse(shards.is_complete("go", "1"))
+
+    def test_force(self) -> None:
+        """Test that forcing discards existing shards."""
+        with tempfile.TemporaryDirectory() as directory:
+            TableShards(TABLE, directory).write("go", [], version="1")
+            self.assertTrue(TableShards(TABLE, directory).is_complete("go", "1"))
+            self.assertFalse(TableShards(TABLE, directory, force=True).is_complete("go", "1"))
+
+    def test_incremental(self) -> None:
+        """Test that incremental builds reuse shards from a finished build."""
+        with tempfile.TemporaryDirectory() as directory:
+            shards = TableShards(TABLE, directory)
+            shards.write("go", [("go", "0000001", "mitochondrion inheritance")], version="1")
+            shards.write("chebi", [("chebi", "1", "a")], version=None)
+            shards.merge(["go", "chebi"])
+
+            shards = TableShards(TABLE, directory, incremental=True)
+            self.assertFalse(shards.manifest.merged)
+            self.assertTrue(shards.is_complete("go", "1"))
+            self.assertFalse(shards.is_complete("go", "2"))
+            # without a version, there's no way to tell if it changed
+            self.assertFalse(shards.is_complete("chebi", None))
+
+    def test_incremental_failed_rebuild(self) -> None:
+        """Test that shards for prefixes whose new versions couldn't be built are dropped."""
+        with tempfile.TemporaryDirectory() as directory:
+            shards = TableShards(TABLE, directory)
+            shards.write("go", [("go", "0000001", "mitochondrion inheritance")], version="1")
+            shards.write("chebi", [("chebi", "1", "a")], version="5")
+            shards.merge(["go", "chebi"])
+
+            # GO has a new version, but it can't be built
+            table = dataclasses.replace(TABLE, getter=_fail)
+            versions = {"go": "2", "chebi": "5", "ncbigene": None}
+            with (
+                mock.patch("pyobo.cli.database_utils.get_version", side_effect=versions.get),
+                mock.patch(
+                    "pyobo.cli.database_utils._get_table_prefixes", return_value=["go", "chebi"]
+                ),
+            ):
+                _build_table(
+                    table,
+                    directory,
+                    incremental=True,
+                    use_tqdm=False,
+                    skip_below=None,
+                    skip_pyobo=False,
+                    skip_set=None,
+                )
+
+            shards = TableShards(table, directory, incremental=True)
+            self.assertNotIn("go", shards.manifest.prefixes)
+            self.assertEqual(
+                [("chebi", "1", "a"), ("ncbigene", "1", "A1BG")],
+                list(shards._iter_rows(["go", "chebi"])),
+            )
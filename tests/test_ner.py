@@ -1,9 +1,16 @@
 """Tests for NER wrapper."""
 
 import importlib.util
+import tempfile
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
 
 import pyobo
+from pyobo import Reference
+from pyobo.ner.api import GROUNDER_REGISTRY, GrounderRegistry, get_grounding_index
 
 
 class TestGround(unittest.TestCase):
@@ -27,3 +34,132 @@ class TestGround(unittest.TestCase):
         kb = pyobo.get_scispacy_knowledgebase("taxrank", cache=False, use_tqdm=False)
         # this might grow over time
         self.assertLessEqual(73, len(kb.cui_to_entity))
+
+
+class TestGrounderRegistry(unittest.TestCase):
+    """Test reusing grounders."""
+
+    def setUp(self) -> None:
+        """Set up the test case with an empty registry."""
+        pyobo.clear_grounder_cache()
+
+    def tearDown(self) -> None:
+        """Clear the registry after the test case."""
+        pyobo.clear_grounder_cache()
+
+    def test_get_grounder(self) -> None:
+        """Test that grounders are only built once."""
+        with (
+            mock.patch(
+                "pyobo.ner.api._get_grounder", side_effect=lambda *_, **__: (mock.Mock(), 2)
+            ) as make,
+        ):
+            grounder = pyobo.get_grounder("taxrank", versions="1")
+            self.assertIs(grounder, pyobo.get_grounder("taxrank", versions="1"))
+            self.assertEqual(1, make.call_count)
+            info = GROUNDER_REGISTRY.cache_info()
+            self.assertEqual(
+                (1, 1, 1, 2), (info.hits, info.misses, info.currsize, info.literal_mappings)
+            )
+
+            # different versions and options get their own grounders
+            self.assertIsNot(grounder, pyobo.get_grounder("taxrank", versions="2"))
+            self.assertIsNot(
+                grounder, pyobo.get_grounder("taxrank", versions="1", skip_obsolete=True)
+            )
+            self.assertEqual(3, make.call_count)
+
+            # forcing or turning off the registry skips it
+            self.assertIsNot(grounder, pyobo.get_grounder("taxrank", versions="1", force=True))
+            self.assertIsNot(
+                grounder, pyobo.get_grounder("taxrank", versions="1", use_registry=False)
+            )
+            self.assertEqual(5, make.call_count)
+            self.assertIs(grounder, pyobo.get_grounder("taxrank", versions="1"))
+
+    def test_eviction(self) -> None:
+        """Test evicting the least recently used grounders."""
+        registry = GrounderRegistry(maxsize=2, max_literal_mappings=10)
+        keys = [((("taxrank", str(i)),), False, None) for i in range(4)]
+        registry.put(keys[0], mock.Mock(), 2)
+        registry.put(keys[1], mock.Mock(), 2)
+        self.assertIsNotNone(registry.get(keys[0]))
+        registry.put(keys[2], mock.Mock(), 2)
+        # the second key was the least recently used
+        self.assertNotIn(keys[1], registry)
+        self.assertIn(keys[0], registry)
+        self.assertIn(keys[2], registry)
+
+        # the literal mapping budget is also respected
+        registry.put(keys[3], mock.Mock(), 9)
+        self.assertEqual([keys[3]], list(registry._data))
+        self.assertEqual(9, registry.cache_info().literal_mappings)
+
+        # grounders that are too big on their own aren't kept
+        registry.put(keys[0], mock.Mock(), 11)
+        self.assertNotIn(keys[0], registry)
+
+    def test_ground_many(self) -> None:
+        """Test grounding several queries with the same grounder."""
+        reference = Reference(prefix="taxrank", identifier="0000032")
+        grounder = mock.Mock()
+        grounder.get_best_match.side_effect = lambda query: (
+            mock.Mock(reference=reference) if query == "biovariety" else None
+        )
+        with mock.patch("pyobo.ner.normalizer.get_grounder", return_value=grounder):
+            results = pyobo.ground_many("taxrank", ["biovariety", "nope", "biovariety"])
+        self.assertEqual([reference, None, reference], results)
+        self.assertEqual(2, grounder.get_best_match.call_count)
+
+
+class TestGroundingIndex(unittest.TestCase):
+    """Test persisting the grounding index."""
+
+    def test_cache(self) -> None:
+        """Test that the index is only built once per version."""
+        t1 = SimpleNamespace(norm_text="a", db="taxrank", id="0000001")
+        t2 = SimpleNamespace(norm_text="a", db="taxrank", id="0000002")
+        t3 = SimpleNamespace(norm_text="b", db="taxrank", id="0000002")
+        index = {"a": [t1, t2], "b": [t3]}
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+
+            def _get_cache_path(prefix: str, artifact: Any, *, version: str) -> Path:
+                directory = root.joinpath(version)
+                directory.mkdir(exist_ok=True)
+                return directory.joinpath(artifact.value)
+
+            with (
+                mock.patch("pyobo.ner.api.get_cache_path", new=_get_cache_path),
+                mock.patch("pyobo.ner.api.get_literal_mappings"),
+                mock.patch("pyobo.ner.api._index_literal_mappings", return_value=index) as build,
+                mock.patch(
+                    "pyobo.ner.api.get_obsolete_references",
+                    return_value={Reference(prefix="taxrank", identifier="0000002")},
+                ),
+            ):
+                self.assertEqual(index, get_grounding_index("taxrank", version="1"))
+                self.assertTrue(root.joinpath("1", "grounding_index.pkl").is_file())
+                self.assertEqual(index, get_grounding_index("taxrank", version="1"))
+                self.assertEqual(1, build.call_count)
+
+                # a new version gets a new index
+                get_grounding_index("taxrank", version="2")
+                self.assertEqual(2, build.call_count)
+
+                # obsolete terms are removed after loading
+                self.assertEqual(
+                    {"a": [t1]}, get_grounding_index("taxrank", version="1", skip_obsolete=True)
+                )
+                self.assertEqual(2, build.call_count)
+
+                # unreadable indexes are rebuilt
+                root.joinpath("1", "grounding_index.pkl").write_bytes(b"garbage")
+                self.assertEqual(index, get_grounding_index("taxrank", version="1"))
+                self.assertEqual(3, build.call_count)
+                self.assertNotEqual(
+                    b"garbage", root.joinpath("1", "grounding_index.pkl").read_bytes()
+                )
+
+                get_grounding_index("taxrank", version="1", force=True)
+                self.assertEqual(4, build.call_count)
@@ -0,0 +1,85 @@
+"""Tests for the native OBO tokenizer and parser."""
+
+import unittest
+
+import obonet
+
+from pyobo import from_obo_path
+from pyobo.struct.obo.reader import from_str
+from pyobo.struct.obo.tokenizer import HEADER, iterate_obo_stanzas, parse_tag_line
+from tests.constants import TEST_CHEBI_OBO_PATH
+
+
+class TestTokenizer(unittest.TestCase):
+    """Test the native OBO tokenizer."""
+
+    def test_parse_tag_line(self) -> None:
+        """Test parsing tag-value lines."""
+        self.assertEqual(("id", "CHEBI:1234"), parse_tag_line("id: CHEBI:1234\n"))
+        self.assertEqual(("name", "a: b"), parse_tag_line("name:   a: b  \n"))
+        self.assertEqual(
+            ("xref", "EC:1.4.1.15"),
+            parse_tag_line("xref: EC:1.4.1.15 {sssom:confidence=0.99} ! lysine dehydrogenase"),
+        )
+        self.assertEqual(
+            ("name", "hello \\! world"),
+            parse_tag_line("name: hello \\! world"),
+        )
+        with self.assertRaises(ValueError):
+            parse_tag_line("no separator")
+
+    def test_sections(self) -> None:
+        """Test the tokenizer produces the same data as obonet."""
+        with TEST_CHEBI_OBO_PATH.open() as file:
+            typedefs, terms, instances, header = obonet.read.get_sections(file)
+        with TEST_CHEBI_OBO_PATH.open() as file:
+            stanzas = list(iterate_obo_stanzas(file))
+
+        self.assertEqual((HEADER, header), stanzas[0])
+        self.assertEqual(terms, [data for stanza_type, data in stanzas if stanza_type == "Term"])
+        self.assertEqual(
+            typedefs, [data for stanza_type, data in stanzas if stanza_type == "Typedef"]
+        )
+        self.assertEqual(
+            instances, [data for stanza_type, data in stanzas if stanza_type == "Instance"]
+        )
+
+
+class TestNativeParser(unittest.TestCase):
+    """Test the native OBO parser."""
+
+    def test_equivalent(self) -> None:
+        """Test the native parser produces the same ontology as the obonet-based one."""
+        expected = from_obo_path(TEST_CHEBI_OBO_PATH, prefix="chebi", version="1")
+        actual = from_obo_path(TEST_CHEBI_OBO_PATH, prefix="chebi", version="1", parser="native")
+        self.assertEqual(expected.ontology, actual.ontology)
+        self.assertEqual(expected.name, actual.name)
+        self.assertEqual(expected.data_version, actual.data_version)
+        self.assertEqual(
+            list(expected.iterate_obo_lines()),
+            list(actual.iterate_obo_lines()),
+        )
+
+    def test_blank_line(self) -> None:
+        """Test that blank lines inside a stanza don't end it."""
+        ontology = from_str(
+            """\
+            ontology: chebi
+
+            [Term]
+            id: CHEBI:1234
+            name: Test Name
+
+            def: "Test definition"
+            """,
+            parser="native",
+        )
+        terms = list(ontology.iter_terms())
+        self.assertEqual(1, len(terms))
+        self.assertEqual("Test Name", terms[0].name)
+        self.assertEqual("Test definition", terms[0].definition)
+
+    def test_unknown_parser(self) -> None:
+        """Test an error is raised for an unknown parser."""
+        with self.assertRaises(ValueError):
+            from_obo_path(TEST_CHEBI_OBO_PATH, prefix="chebi", version="1", parser="nope")  # type:ignore
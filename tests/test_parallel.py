@@ -0,0 +1,51 @@
+"""Tests for building resources in a process pool."""
+
+import pickle
+import unittest
+
+from pyobo.getters import NoBuildError, iter_helper_helper
+from pyobo.identifier_utils import Reference, UnregisteredPrefixError
+
+
+def _build(prefix: str, **kwargs: object) -> str:
+    """Succeed, fail in a way that's handled, or fail in a way that's strict."""
+    if prefix == "go":
+        return "built"
+    if prefix == "chebi":
+        raise NoBuildError(prefix)
+    raise UnregisteredPrefixError(
+        "nope:0000001",
+        context="testing",
+        ontology_prefix=prefix,
+        node=Reference(prefix=prefix, identifier="0000001"),
+    )
+
+
+class TestParallel(unittest.TestCase):
+    """Test that building in a process pool keeps the error handling."""
+
+    def test_pickle_parse_error(self) -> None:
+        """Test that parse errors survive pickling with their attributes."""
+        error = UnregisteredPrefixError("nope:1", context="testing", ontology_prefix="doid")
+        rv = pickle.loads(pickle.dumps(error))  # noqa:S301
+        self.assertIsInstance(rv, UnregisteredPrefixError)
+        self.assertEqual("nope:1", rv.curie)
+        self.assertEqual("testing", rv.context)
+        self.assertEqual(str(error), str(rv))
+
+    def test_handled(self) -> None:
+        """Test that handled errors are skipped and that non-strict errors are logged."""
+        rv = iter_helper_helper(
+            _build, prefixes=["go", "chebi", "doid"], workers=2, use_tqdm=False, strict=False
+        )
+        self.assertEqual([("go", "built")], list(rv))
+
+    def test_strict(self) -> None:
+        """Test that strict errors raised in a worker get re-raised in the parent."""
+        rv = iter_helper_helper(
+            _build, prefixes=["go", "chebi", "doid"], workers=2, use_tqdm=False, strict=True
+        )
+        with self.assertRaises(UnregisteredPrefixError) as context:
+            list(rv)
+        self.assertEqual("nope:0000001", context.exception.curie)
+        self.assertEqual("doid", context.exception.ontology_prefix)
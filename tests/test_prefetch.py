@@ -0,0 +1,72 @@
+"""Tests for prefetching ontology downloads."""
+
+import functools
+import tempfile
+import threading
+import unittest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from pyobo.getters import OntologyPrefetcher
+
+HERE = Path(__file__).parent.resolve()
+RESOURCES = HERE.joinpath("resources")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestPrefetch(unittest.TestCase):
+    """Test prefetching ontology downloads from a local server."""
+
+    def setUp(self) -> None:
+        """Serve the test resources and use a temporary directory for downloads."""
+        handler = functools.partial(_QuietHandler, directory=str(RESOURCES))
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _join(
+        self, prefix: str, *parts: str, name: str, ensure_exists: bool = True, **_kwargs: object
+    ) -> Path:
+        rv = self.directory.joinpath(prefix, *parts)
+        if ensure_exists:
+            rv.mkdir(parents=True, exist_ok=True)
+        return rv.joinpath(name)
+
+    def test_prefetch(self) -> None:
+        """Test that a failing URL falls back to the next one in the shared session."""
+        getters = [
+            ("obo", lambda prefix: f"{self.base}/missing_{prefix}.obo"),
+            ("obo", lambda prefix: f"{self.base}/test_{prefix}.obo"),
+        ]
+        with (
+            mock.patch("pyobo.getters.ONTOLOGY_GETTERS", getters),
+            mock.patch("pyobo.getters.prefix_directory_join", self._join),
+            mock.patch("pyobo.getters.has_nomenclature_plugin", return_value=False),
+            OntologyPrefetcher(workers=2, version="1") as prefetcher,
+        ):
+            prefetcher.submit("chebi")
+            prefetcher.submit("chebi")
+            prefetcher.submit("nope")
+            pack = prefetcher.wait("chebi")
+            if pack is None:
+                self.fail("chebi wasn't downloaded")
+            self.assertEqual("obo", pack.format)
+            self.assertEqual(self.directory.joinpath("chebi", "test_chebi.obo"), pack.path)
+            self.assertEqual(
+                RESOURCES.joinpath("test_chebi.obo").read_bytes(), pack.path.read_bytes()
+            )
+            self.assertIsNone(prefetcher.wait("nope"))
+            self.assertEqual([], list(self.directory.joinpath("nope").iterdir()))
+            # waiting on a prefix that wasn't submitted doesn't block
+            self.assertIsNone(prefetcher.wait("doid"))
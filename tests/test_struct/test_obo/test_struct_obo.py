@@ -1,18 +1,22 @@
 """Test for OBO header."""
 
+import gzip
 import tempfile
 import unittest
 from collections.abc import Iterable
 from pathlib import Path
 from textwrap import dedent
+from unittest import mock
 
 import robot_obo_tool
 
-from pyobo import default_reference
+from pyobo import Reference, Term, default_reference
 from pyobo.struct.reference import OBOLiteral
 from pyobo.struct.struct import Obo, build_ontology
 from pyobo.struct.struct_utils import Annotation
-from pyobo.struct.typedef import has_license
+from pyobo.struct.typedef import has_license, part_of
+from pyobo.utils.io import write_iterable_tsv
+from pyobo.utils.path import CacheArtifact
 
 
 class TestOBOHeader(unittest.TestCase):
@@ -503,3 +507,89 @@ class TestOBOHeader(unittest.TestCase):
             """,
             ontology,
         )
+
+
+class TestWriteCache(unittest.TestCase):
+    """Test writing the cache artifacts."""
+
+    def setUp(self) -> None:
+        """Set up a small ontology with several kinds of content."""
+        parent = Term(
+            reference=Reference(prefix="GO", identifier="0016491", name="oxidoreductase activity"),
+            definition="Catalysis of an oxidation-reduction reaction.",
+        )
+        child = Term(
+            reference=Reference(
+                prefix="GO", identifier="0050069", name="lysine dehydrogenase activity"
+            ),
+            definition='"Catalysis of the reaction:\tlysine + NAD+"',
+        )
+        child.append_parent(parent)
+        child.append_alt(Reference(prefix="GO", identifier="0000001"))
+        child.append_relationship(part_of, parent)
+        child.append_xref(Reference(prefix="eccode", identifier="1.4.1.15"))
+        child.set_species("9606", "Homo sapiens")
+        child.annotate_string(has_license, "CC-BY-4.0")
+        self.ontology = build_ontology(
+            prefix="go", terms=[parent, child], typedefs=[part_of], version="1"
+        )
+
+    def test_single_pass(self) -> None:
+        """Test all cache artifacts are written with a single pass over the stanzas."""
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+
+            def _get_cache_path(prefix: str, name: CacheArtifact, version: str) -> Path:
+                return root.joinpath(name.value)
+
+            def _get_relation_cache_path(prefix: str, reference: Reference, version: str) -> Path:
+                return root.joinpath("relations", f"{reference.curie}.tsv")
+
+            root.joinpath("relations").mkdir()
+            with (
+                mock.patch("pyobo.struct.struct.get_cache_path", new=_get_cache_path),
+                mock.patch(
+                    "pyobo.struct.struct.get_relation_cache_path", new=_get_relation_cache_path
+                ),
+                mock.patch.object(
+                    self.ontology, "_iter_stanzas", wraps=self.ontology._iter_stanzas
+                ) as mock_iter_stanzas,
+            ):
+                self.ontology.write_cache(force=True)
+                self.assertEqual(1, mock_iter_stanzas.call_count)
+
+            expected = {
+                CacheArtifact.names: self.ontology.iterate_id_name(),
+                CacheArtifact.definitions: self.ontology.iterate_id_definition(),
+                CacheArtifact.species: self.ontology.iterate_id_species(),
+                CacheArtifact.alts: self.ontology.iterate_alt_rows(),
+                CacheArtifact.relations: self.ontology.iter_relation_rows(),
+                CacheArtifact.edges: self.ontology.iterate_edge_rows(),
+                CacheArtifact.object_properties: self.ontology.iter_object_properties(),
+                CacheArtifact.literal_properties: self.ontology.iter_literal_properties(),
+                CacheArtifact.literal_mappings: self.ontology.iterate_literal_mapping_rows(),
+            }
+            for cache_artifact, header, _ in self.ontology._get_cache_config():
+                with self.subTest(artifact=cache_artifact.name):
+                    expected_path = root.joinpath(f"expected-{cache_artifact.value}")
+                    write_iterable_tsv(
+                        path=expected_path, header=header, it=expected[cache_artifact]
+                    )
+                    self.assertEqual(
+                        _read_gzip_lines(expected_path),
+                        _read_gzip_lines(root.joinpath(cache_artifact.value)),
+                    )
+
+            self.assertEqual(
+                [
+                    "go_id\ttarget_ns\ttarget_id",
+                    "0050069\tgo\t0016491",
+                ],
+                root.joinpath("relations", "bfo:0000050.tsv").read_text().splitlines(),
+            )
+            self.assertTrue(root.joinpath(CacheArtifact.mappings.value).is_file())
+
+
+def _read_gzip_lines(path: Path) -> list[str]:
+    with gzip.open(path, "rt") as file:
+        return file.read().splitlines()
@@ -1299,3 +1299,46 @@ sssom:mapping_justification=semapv:UnspecifiedMatching} ! exact match lysine deh
                 AnnotationAssertion(IAO:0100001 GO:0050069 GO:1234569)
             """,
         )
+
+
+class TestCompactTerm(unittest.TestCase):
+    """Test that terms only allocate containers when something is added to them."""
+
+    def test_lazy_containers(self) -> None:
+        """Test reading, appending, and pickling lazily allocated containers."""
+        import pickle
+
+        term = Term(LYSINE_DEHYDROGENASE_ACT)
+        self.assertFalse(hasattr(term, "__dict__"))
+        self.assertEqual([], term.parents)
+        self.assertEqual({}, term.relationships)
+        self.assertEqual({"reference", "type"}, set(_stored(term)))
+
+        parent = Reference(prefix="GO", identifier="0016491", name="oxidoreductase activity")
+        parents = term.parents
+        parents.append(parent)
+        self.assertEqual([parent], term.parents)
+        term.append_relationship(part_of, parent)
+        self.assertEqual({part_of.reference: [parent]}, term.relationships)
+        self.assertEqual({"reference", "type", "parents", "relationships"}, set(_stored(term)))
+
+        # the same container is given every time, so holding onto it is safe
+        self.assertIs(term.xrefs, term.xrefs)
+        xrefs_1, xrefs_2 = term.xrefs, term.xrefs
+        xrefs_1.append(parent)
+        xrefs_2.append(part_of.reference)
+        self.assertEqual([parent, part_of.reference], xrefs_1)
+        self.assertEqual([parent, part_of.reference], xrefs_2)
+        term.xrefs = []
+
+        loaded = pickle.loads(pickle.dumps(term))  # noqa:S301
+        self.assertEqual(term, loaded)
+        self.assertEqual([parent], loaded.parents)
+        self.assertEqual(set(_stored(term)), set(_stored(loaded)))
+        loaded.relationships[see_also].append(parent)
+        self.assertEqual([parent], loaded.relationships[see_also])
+
+
+def _stored(term: Term) -> dict[str, object]:
+    # the containers that aren't allocated are left out of the state
+    return {key: value for key, value in term.__getstate__().items() if value}  # type:ignore
@@ -24,3 +24,79 @@ class TestReference(unittest.TestCase):
         """Test that the from_curie function that's inherited returns the child class."""
         x = Reference.from_curie("go:1234567")
         self.assertIsInstance(x, Reference)
+
+
+class TestReferencePool(unittest.TestCase):
+    """Test sharing references through a pool."""
+
+    def test_pool(self) -> None:
+        """Test that equal references are shared, including ones from curies."""
+        import gc
+
+        import curies
+
+        from pyobo.identifier_utils import ReferencePool
+
+        pool = ReferencePool()
+        a = pool.intern(Reference(prefix="go", identifier="0000001"))
+        self.assertIs(a, pool.intern(Reference(prefix="go", identifier="0000001")))
+        self.assertIs(a, pool.get("go", "0000001"))
+        self.assertIs(a, pool.from_curie("go:0000001"))
+        self.assertIs(a, pool.from_reference(curies.Reference(prefix="go", identifier="0000001")))
+        # the prefix gets normalized
+        self.assertIs(a, pool.get("GO", "0000001"))
+
+        named = pool.get("go", "0000001", "mitochondrion inheritance")
+        self.assertIsNot(a, named)
+        self.assertEqual("mitochondrion inheritance", named.name)
+
+        # references are dropped once nothing else uses them
+        del a, named
+        gc.collect()
+        self.assertEqual(0, len(pool))
+
+    def test_stanza(self) -> None:
+        """Test that references added to stanzas are shared."""
+        from pyobo import Term
+
+        parent = Reference(prefix="go", identifier="0016491")
+        x = Term(reference=Reference(prefix="go", identifier="0050069"))
+        y = Term(reference=Reference(prefix="go", identifier="0050070"))
+        x.append_parent(parent)
+        y.append_parent(Reference(prefix="go", identifier="0016491"))
+        y.append_xref("go:0016491")
+        self.assertIs(x.parents[0], y.parents[0])
+        self.assertIs(x.parents[0], y.xrefs[0])
+
+
+class TestTrustedReference(unittest.TestCase):
+    """Test constructing references without validation."""
+
+    def test_factory(self) -> None:
+        """Test that trusted references equal validated ones."""
+        from pyobo.identifier_utils import ReferenceFactory, trusted_reference
+
+        factory = ReferenceFactory("GO")
+        self.assertEqual("go", factory.prefix)
+        reference = factory("0000001", name="mitochondrion inheritance")
+        expected = Reference(prefix="go", identifier="0000001", name="mitochondrion inheritance")
+        self.assertEqual(expected, reference)
+        self.assertEqual(hash(expected), hash(reference))
+        self.assertEqual("go:0000001", reference.curie)
+        self.assertEqual(
+            Reference(prefix="go", identifier="0000002"), trusted_reference("go", "0000002")
+        )
+
+        with self.assertRaises(ValueError):
+            ReferenceFactory("nope")
+
+    def test_sampled_validation(self) -> None:
+        """Test that sampled validation catches invalid identifiers."""
+        from pyobo.identifier_utils import ReferenceFactory
+
+        factory = ReferenceFactory("go", validate_every=2)
+        factory("nope")  # the first one isn't validated
+        with self.assertRaises(ValueError):
+            factory("nope")
+        with self.assertRaises(ValueError):
+            ReferenceFactory("go", validate_every=1)("GO:0000001")
@@ -0,0 +1,101 @@
+"""Tests for binary ontology snapshots."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pyobo import Obo, from_obo_path, get_ontology
+from pyobo.struct import snapshot
+from pyobo.struct.snapshot import read_snapshot, write_snapshot
+from tests.constants import TEST_CHEBI_OBO_PATH, chebi_patch, chebi_version_patch
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test binary ontology snapshots."""
+
+    def setUp(self) -> None:
+        """Set up the test case with the mock ChEBI OBO file."""
+        self.ontology = from_obo_path(TEST_CHEBI_OBO_PATH, prefix="chebi", version="1")
+
+    def test_roundtrip(self) -> None:
+        """Test writing then reading a snapshot."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("chebi.obo.pickle")
+            write_snapshot(self.ontology, path)
+            ontology = read_snapshot(path)
+
+        if ontology is None:
+            self.fail("snapshot was not loaded")
+        self.assertEqual(self.ontology.ontology, ontology.ontology)
+        self.assertEqual(self.ontology.name, ontology.name)
+        self.assertEqual(self.ontology.data_version, ontology.data_version)
+        self.assertEqual(self.ontology.date, ontology.date)
+        self.assertEqual(
+            list(self.ontology.iterate_obo_lines()),
+            list(ontology.iterate_obo_lines()),
+        )
+
+    def test_invalid(self) -> None:
+        """Test that outdated or missing snapshots aren't loaded."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("chebi.obo.pickle")
+            self.assertIsNone(read_snapshot(path))
+
+            write_snapshot(self.ontology, path)
+            with mock.patch.object(
+                snapshot, "SNAPSHOT_SCHEMA_VERSION", snapshot.SNAPSHOT_SCHEMA_VERSION + 1
+            ):
+                self.assertIsNone(read_snapshot(path))
+
+            # snapshots built with different settings aren't used
+            write_snapshot(self.ontology, path, settings={"strict": False})
+            self.assertIsNotNone(read_snapshot(path, settings={"strict": False}))
+            self.assertIsNone(read_snapshot(path, settings={"strict": True}))
+            self.assertIsNone(read_snapshot(path))
+
+            # settings that weren't stored in the snapshot don't apply to it
+            self.assertIsNotNone(
+                read_snapshot(path, settings={"strict": False, "parser": "native"})
+            )
+
+            path.write_bytes(b"garbage")
+            self.assertIsNone(read_snapshot(path))
+
+    def test_get_ontology(self) -> None:
+        """Test that :func:`get_ontology` uses the snapshot on subsequent calls."""
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+
+            def _prefix_directory_join(prefix: str, *parts: str, name: str, version: str) -> Path:
+                return root.joinpath(name)
+
+            with (
+                chebi_patch,
+                chebi_version_patch,
+                mock.patch("pyobo.getters.prefix_directory_join", new=_prefix_directory_join),
+                mock.patch("pyobo.getters.has_nomenclature_plugin", return_value=False),
+                mock.patch.object(Obo, "write_default"),
+            ):
+                expected = get_ontology("chebi")
+                self.assertTrue(root.joinpath("chebi.obo.pickle").is_file())
+
+                with mock.patch("pyobo.getters.from_obo_path") as mock_from_obo_path:
+                    actual = get_ontology("chebi")
+                    mock_from_obo_path.assert_not_called()
+
+                # a call with different settings doesn't get the first call's ontology
+                with mock.patch(
+                    "pyobo.getters.from_obo_path", return_value=expected
+                ) as mock_from_obo_path:
+                    get_ontology("chebi", strict=True)
+                    mock_from_obo_path.assert_called_once()
+                    self.assertEqual(
+                        root.joinpath("chebi.strict.obonet.json.gz"),
+                        mock_from_obo_path.call_args.kwargs["_cache_path"],
+                    )
+
+        self.assertEqual(
+            list(expected.iterate_obo_lines()),
+            list(actual.iterate_obo_lines()),
+        )
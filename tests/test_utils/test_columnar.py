@@ -0,0 +1,152 @@
+"""Tests for columnar cache artifacts."""
+
+import importlib.util
+import os
+import unittest
+from collections.abc import Mapping
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pandas as pd
+
+from pyobo.api.xrefs import get_mappings_df
+from pyobo.utils.cache import cached_df, cached_mapping
+from pyobo.utils.columnar import (
+    CACHE_FORMAT_ENVIRONMENT_VARIABLE,
+    CacheFormat,
+    export_tsv,
+    get_cache_format,
+    get_format_path,
+    read_table,
+    write_table,
+)
+
+COLUMNS = ["go_id", "relation_prefix", "relation_identifier", "target_prefix", "target_id"]
+ROWS = [
+    ("0000001", "bfo", "0000050", "go", "0000002"),
+    ("0000002", "bfo", "0000050", "go", "0000003"),
+    ("0000003", "ro", "0002211", "go", None),
+    ("0000004", "bfo", "0000051", "go", "0000001"),
+]
+
+
+class TestFormat(unittest.TestCase):
+    """Test choosing the cache format."""
+
+    def test_get_cache_format(self) -> None:
+        """Test getting the cache format from the environment."""
+        with mock.patch.dict(os.environ, {CACHE_FORMAT_ENVIRONMENT_VARIABLE: ""}):
+            self.assertEqual(CacheFormat.tsv, get_cache_format())
+        with mock.patch.dict(os.environ, {CACHE_FORMAT_ENVIRONMENT_VARIABLE: "Parquet"}):
+            self.assertEqual(CacheFormat.parquet, get_cache_format())
+            self.assertEqual(CacheFormat.arrow, get_cache_format("arrow"))
+        with self.assertRaises(ValueError):
+            get_cache_format("csv")
+
+    def test_get_format_path(self) -> None:
+        """Test getting paths for each format."""
+        path = Path("cache", "names.tsv.gz")
+        self.assertEqual(path, get_format_path(path, CacheFormat.tsv))
+        self.assertEqual(Path("cache", "names.parquet"), get_format_path(path, "parquet"))
+        self.assertEqual(
+            Path("relations", "bfo:0000050.arrow"),
+            get_format_path(Path("relations", "bfo:0000050.tsv"), "arrow"),
+        )
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+class TestColumnar(unittest.TestCase):
+    """Test writing and reading columnar cache artifacts."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory."""
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("relations.tsv.gz")
+        self.df = pd.DataFrame(ROWS, columns=COLUMNS)
+
+    def tearDown(self) -> None:
+        """Clean up the temporary directory."""
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Test that all formats read the same as TSV, with projection and filters."""
+        expected = [("0000001", "0000002"), ("0000002", "0000003")]
+        for cache_format in CacheFormat:
+            with self.subTest(cache_format=cache_format.name):
+                path = write_table(self.df, self.path, cache_format=cache_format)
+                self.assertEqual(get_format_path(self.path, cache_format), path)
+                df = read_table(path)
+                self.assertEqual(COLUMNS, list(df.columns))
+                # missing values are empty, like in TSV
+                self.assertEqual(
+                    [tuple("" if v is None else v for v in row) for row in ROWS],
+                    [tuple(row) for row in df.values],
+                )
+                df = read_table(
+                    path,
+                    columns=["go_id", "target_id"],
+                    filters=[
+                        ("relation_prefix", "==", "bfo"),
+                        ("relation_identifier", "in", {"0000050"}),
+                    ],
+                )
+                self.assertEqual(expected, [tuple(row) for row in df.values])
+
+    def test_categorical(self) -> None:
+        """Test that columns with repeated values are dictionary-encoded."""
+        path = write_table(self.df, self.path, cache_format=CacheFormat.parquet)
+        df = read_table(path, categorical=True)
+        self.assertIsInstance(df["target_prefix"].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df["go_id"].dtype, pd.CategoricalDtype)
+
+    def test_export(self) -> None:
+        """Test exporting a columnar artifact to TSV."""
+        path = write_table(self.df, self.path, cache_format=CacheFormat.arrow)
+        self.assertFalse(self.path.is_file())
+        self.assertEqual(self.path, export_tsv(path))
+        self.assertTrue(
+            pd.read_csv(self.path, sep="\t", dtype=str, keep_default_na=False).equals(
+                read_table(path)
+            )
+        )
+
+    def test_cached_df(self) -> None:
+        """Test that an existing TSV cache is converted, then loaded."""
+        self.df.to_csv(self.path, sep="\t", index=False)
+
+        @cached_df(path=self.path, dtype=str, cache_format="parquet")
+        def _get_df() -> pd.DataFrame:
+            raise AssertionError("the TSV cache should have been used")
+
+        self.assertEqual(len(ROWS), len(_get_df()))
+        self.assertTrue(get_format_path(self.path, "parquet").is_file())
+
+    def test_cached_mapping(self) -> None:
+        """Test caching a mapping in a columnar format."""
+        data = {"0000001": "mitochondrion inheritance", "0000002": "mitochondrial genome"}
+
+        @cached_mapping(path=self.path, header=["go_id", "name"], cache_format="arrow")
+        def _get_mapping() -> Mapping[str, str]:
+            return data
+
+        self.assertEqual(data, _get_mapping())
+        self.assertTrue(get_format_path(self.path, "arrow").is_file())
+        self.assertFalse(self.path.is_file())
+        self.assertEqual(data, _get_mapping())
+
+    def test_sssom_stays_tsv(self) -> None:
+        """Test that the SSSOM cache stays TSV, since its metadata is in the header."""
+        path = Path(self.directory.name).joinpath("mappings.sssom.tsv.gz")
+        pd.DataFrame(
+            [("go:0000001", "skos:exactMatch", "wikidata:Q1", "semapv:UnspecifiedMatching")],
+            columns=["subject_id", "predicate_id", "object_id", "mapping_justification"],
+        ).to_csv(path, sep="\t", index=False)
+        with (
+            mock.patch.dict(os.environ, {CACHE_FORMAT_ENVIRONMENT_VARIABLE: "parquet"}),
+            mock.patch("pyobo.api.xrefs.get_cache_path", return_value=path),
+            mock.patch("pyobo.api.xrefs.get_ontology", side_effect=AssertionError),
+        ):
+            df = get_mappings_df("go", version="1")
+        self.assertEqual(["wikidata:Q1"], list(df["object_id"]))
+        self.assertFalse(get_format_path(path, "parquet").is_file())
@@ -0,0 +1,82 @@
+"""Tests for compact mappings."""
+
+import os
+import unittest
+from collections.abc import Mapping
+from tempfile import TemporaryDirectory
+
+from pyobo.utils.cache import cached_mapping, cached_multidict
+from pyobo.utils.compact import CompactMapping, CompactMultimapping
+
+
+class TestCompactMapping(unittest.TestCase):
+    """Test compact mappings."""
+
+    def test_integer_keys(self) -> None:
+        """Test a mapping whose keys are all integers."""
+        mapping = CompactMapping.from_items([("10", "a"), ("2", "b"), ("1", "a"), ("2", "c")])
+        self.assertEqual({"1": "a", "2": "c", "10": "a"}, mapping)
+        self.assertEqual(["1", "2", "10"], list(mapping))
+        self.assertEqual(3, len(mapping))
+        self.assertIn("10", mapping)
+        # keys with leading zeros aren't the same as their integer value
+        self.assertNotIn("01", mapping)
+        self.assertNotIn(1, mapping)
+        self.assertIsNone(mapping.get("3"))
+        with self.assertRaises(KeyError):
+            _ = mapping["3"]
+
+    def test_string_keys(self) -> None:
+        """Test a mapping whose keys aren't integers."""
+        data = {"0000001": "x", "a": "y", "ab": "y", "ābc": "z"}
+        mapping = CompactMapping.from_items(data)
+        self.assertEqual(data, mapping)
+        self.assertEqual(data, dict(mapping.items()))
+        # items are a view, so they can be iterated over several times
+        items = mapping.items()
+        self.assertEqual(len(data), len(items))
+        self.assertEqual(list(data.items()), list(items))
+        self.assertEqual(list(data.items()), list(items))
+        self.assertIn(("a", "y"), items)
+        self.assertNotIn(("a", "z"), items)
+        self.assertNotIn("abcd", mapping)
+        self.assertNotIn("", mapping)
+        self.assertNotIn("1", mapping)
+
+    def test_empty(self) -> None:
+        """Test empty mappings."""
+        self.assertEqual({}, CompactMapping([], []))
+        self.assertEqual({}, CompactMultimapping([], []))
+        with self.assertRaises(ValueError):
+            CompactMapping(["1"], [])
+
+    def test_multimapping(self) -> None:
+        """Test a compact multimapping keeps the order of values."""
+        mapping = CompactMultimapping.from_items([("b", "2"), ("a", "3"), ("b", "1"), ("c", "3")])
+        self.assertEqual({"a": ["3"], "b": ["2", "1"], "c": ["3"]}, mapping)
+
+    def test_cache(self) -> None:
+        """Test loading compact mappings from a cache."""
+        data = {str(i): f"name {i % 3}" for i in range(100)}
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.tsv")
+
+            @cached_mapping(path=path, header=["key", "value"], compact=True)
+            def _get_mapping() -> Mapping[str, str]:
+                return data
+
+            self.assertIs(data, _get_mapping())
+            rv = _get_mapping()
+            self.assertIsInstance(rv, CompactMapping)
+            self.assertEqual(data, rv)
+
+            path = os.path.join(directory, "test_multi.tsv")
+
+            @cached_multidict(path=path, header=["key", "value"], compact=True)
+            def _get_multidict() -> Mapping[str, list[str]]:
+                return {"a": ["x", "y"], "b": ["z"]}
+
+            _get_multidict()
+            rv_multi = _get_multidict()
+            self.assertIsInstance(rv_multi, CompactMultimapping)
+            self.assertEqual({"a": ["x", "y"], "b": ["z"]}, rv_multi)
@@ -0,0 +1,120 @@
+"""Tests for the embedding store."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pyobo.utils.embedding_store import (
+    EmbeddingStore,
+    hash_texts,
+    read_text_hashes,
+    search_stores,
+    write_text_hashes,
+)
+
+
+class TestEmbeddingStore(unittest.TestCase):
+    """Test the embedding store."""
+
+    def test_round_trip(self) -> None:
+        """Test saving and loading a memory-mapped store."""
+        identifiers = ["0000001", "0000002", "10"]
+        rows = np.arange(12, dtype=np.float64).reshape(3, 4)
+        store = EmbeddingStore.from_rows(identifiers, rows, dimension=4)
+        self.assertEqual(np.float32, store.matrix.dtype)
+        self.assertEqual(4, store.dimension)
+
+        with tempfile.TemporaryDirectory() as directory:
+            matrix_path = Path(directory).joinpath("embeddings.npy")
+            identifiers_path = Path(directory).joinpath("embedding_identifiers.txt")
+            store.save(matrix_path, identifiers_path)
+            loaded = EmbeddingStore.load(matrix_path, identifiers_path)
+            self.assertIsInstance(loaded.matrix, np.memmap)
+            self.assertEqual(identifiers, loaded.identifiers)
+            self.assertIn("10", loaded)
+            self.assertNotIn("11", loaded)
+            self.assertIsNone(loaded.get("11"))
+            np.testing.assert_array_equal(rows[1], loaded.get("0000002"))
+
+            df = loaded.to_df("identifier")
+            self.assertEqual("identifier", df.index.name)
+            self.assertEqual(identifiers, list(df.index))
+            del loaded, df
+
+    def test_write_chunks(self) -> None:
+        """Test writing a store in chunks."""
+        rows = np.arange(20, dtype=np.float32).reshape(5, 4)
+        identifiers = list("abcde")
+        with tempfile.TemporaryDirectory() as directory:
+            matrix_path = Path(directory).joinpath("embeddings.npy")
+            identifiers_path = Path(directory).joinpath("embedding_identifiers.txt")
+            chunks = (rows[:2], rows[2:4], rows[4:])
+            store = EmbeddingStore.write_chunks(
+                matrix_path, identifiers_path, identifiers, chunks, dimension=4
+            )
+            self.assertEqual(identifiers, store.identifiers)
+            np.testing.assert_array_equal(rows, store.matrix)
+            del store
+
+            with self.assertRaises(ValueError):
+                EmbeddingStore.write_chunks(
+                    matrix_path, identifiers_path, identifiers, [rows[:2]], dimension=4
+                )
+
+    def test_from_df(self) -> None:
+        """Test constructing a store from a dataframe and an empty store."""
+        df = pd.DataFrame([[0.5, 1.5], [2.5, 3.5]], index=["a", "b"])
+        store = EmbeddingStore.from_df(df, dtype=np.float16)
+        self.assertEqual(np.float16, store.matrix.dtype)
+        np.testing.assert_array_equal([2.5, 3.5], store.get("b"))
+
+        empty = EmbeddingStore.from_rows([], [], dimension=384)
+        self.assertEqual(0, len(empty))
+        self.assertEqual(384, empty.dimension)
+
+    def test_mismatch(self) -> None:
+        """Test an error is raised when identifiers and rows aren't aligned."""
+        with self.assertRaises(ValueError):
+            EmbeddingStore(identifiers=["a"], matrix=np.zeros((2, 3)))
+
+    def test_search(self) -> None:
+        """Test chunked top-k search agrees with a brute force search."""
+        rng = np.random.default_rng(0)
+        identifiers = [str(i) for i in range(50)]
+        store = EmbeddingStore.from_rows(identifiers, rng.normal(size=(50, 8)), dimension=8)
+        query = rng.normal(size=8)
+
+        matrix = store.matrix.astype(np.float64)
+        scores = matrix @ query / np.linalg.norm(matrix, axis=1) / np.linalg.norm(query)
+        expected = [str(i) for i in np.argsort(-scores)[:5]]
+
+        for chunk_size in [3, 7, 100]:
+            with self.subTest(chunk_size=chunk_size):
+                results = store.search(query, k=5, chunk_size=chunk_size)
+                self.assertEqual(expected, [identifier for identifier, _ in results])
+                self.assertAlmostEqual(scores.max(), results[0][1], places=5)
+
+        normalized = store.normalize()
+        self.assertTrue(normalized.normalized)
+        self.assertEqual(expected, [i for i, _ in normalized.search(query, k=5, chunk_size=4)])
+
+        other = EmbeddingStore.from_rows(["x"], [query], dimension=8)
+        stores_results = search_stores({"a": store, "b": other}, query, k=3, chunk_size=10)
+        self.assertEqual(("b", "x"), stores_results[0][:2])
+        self.assertEqual([("a", i) for i in expected[:2]], [r[:2] for r in stores_results[1:]])
+
+    def test_hashes(self) -> None:
+        """Test hashing texts depends on both the model and the text."""
+        a, b, c = hash_texts("model-1:384", ["apoptosis", "apoptosis", "necrosis"])
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        (d,) = hash_texts("model-2:384", ["apoptosis"])
+        self.assertNotEqual(a, d)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("embedding_hashes.txt")
+            write_text_hashes(path, [a, c])
+            self.assertEqual([a, c], read_text_hashes(path))
@@ -0,0 +1,146 @@
+"""Tests for the hierarchy index."""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+from pyobo import Reference
+from pyobo.utils.hierarchy_index import HierarchyArrays, HierarchyIndex
+
+
+def _ref(i: int) -> Reference:
+    return Reference(prefix="go", identifier=f"{i:07}")
+
+
+class TestHierarchyIndex(unittest.TestCase):
+    """Test the hierarchy index."""
+
+    def assert_consistent(self, graph: nx.DiGraph) -> None:
+        """Test the index gives the same results as networkx."""
+        for closure in [True, False]:
+            with self.subTest(closure=closure):
+                self._assert_consistent(HierarchyIndex.from_graph(graph, closure=closure), graph)
+
+    def _assert_consistent(self, index: HierarchyIndex, graph: nx.DiGraph) -> None:
+        self.assertEqual(graph.number_of_nodes(), len(index))
+        self.assertEqual(graph.number_of_edges(), index.number_of_edges)
+        for node in graph:
+            self.assertEqual(set(graph.successors(node)), index.get_parents(node))
+            self.assertEqual(set(graph.predecessors(node)), index.get_children(node))
+            # note that the graph's edges go from child to parent
+            self.assertEqual(nx.descendants(graph, node), index.get_ancestors(node))
+            self.assertEqual(nx.ancestors(graph, node), index.get_descendants(node))
+
+        nodes = list(graph)
+        pairs = [(u, v) for u in nodes for v in nodes]
+        expected = [nx.has_path(graph, u, v) and u != v for u, v in pairs]
+        # a node is only its own ancestor in networkx if there's a cycle, but
+        # since nx.descendants never includes the source, neither does the index
+        self.assertEqual(expected, [index.has_ancestor(u, v) for u, v in pairs])
+        mask = index.has_ancestor_ids(
+            index.encode(u for u, _ in pairs), index.encode(v for _, v in pairs)
+        )
+        self.assertEqual(expected, mask.tolist())
+
+    def test_diamond(self) -> None:
+        """Test a small hierarchy with multiple inheritance."""
+        graph = nx.DiGraph()
+        graph.add_edges_from([(_ref(4), _ref(2)), (_ref(4), _ref(3))])
+        graph.add_edges_from([(_ref(2), _ref(1)), (_ref(3), _ref(1))])
+        graph.add_node(_ref(5))
+        self.assert_consistent(graph)
+
+        index = HierarchyIndex.from_graph(graph)
+        self.assertEqual({_ref(1), _ref(2), _ref(3)}, index.get_ancestors(_ref(4)))
+        self.assertEqual(set(), index.get_ancestors(_ref(5)))
+        self.assertIsNone(index.get_ancestors(_ref(6)))
+        self.assertFalse(index.has_ancestor(_ref(6), _ref(1)))
+        self.assertEqual(
+            [False],
+            index.has_ancestor_ids(index.encode([_ref(6)]), index.encode([_ref(1)])).tolist(),
+        )
+
+    def test_cycle(self) -> None:
+        """Test a hierarchy with a cycle and nodes below it."""
+        graph = nx.DiGraph()
+        graph.add_edges_from([(_ref(2), _ref(1)), (_ref(3), _ref(2)), (_ref(2), _ref(3))])
+        graph.add_edges_from([(_ref(4), _ref(3)), (_ref(5), _ref(5))])
+        self.assert_consistent(graph)
+
+    def test_random(self) -> None:
+        """Test a random directed acyclic graph."""
+        rng = random.Random(0)  # noqa:S311
+        graph = nx.DiGraph()
+        graph.add_nodes_from(_ref(i) for i in range(40))
+        for i in range(1, 40):
+            for parent in rng.sample(range(i), k=min(i, rng.randint(1, 3))):
+                graph.add_edge(_ref(i), _ref(parent))
+        self.assert_consistent(graph)
+
+    def test_empty(self) -> None:
+        """Test an empty hierarchy."""
+        index = HierarchyIndex([], np.array([]), np.array([]))
+        self.assertEqual(0, len(index))
+        self.assertEqual([], index.has_ancestor_ids(np.array([]), np.array([])).tolist())
+
+
+class TestHierarchyArrays(unittest.TestCase):
+    """Test the compact on-disk representation of the hierarchy."""
+
+    def test_roundtrip(self) -> None:
+        """Test building, saving, loading, and indexing arrays."""
+        references = ["go:0000001", "go:0000002", "go:0000003", "go:0000004"]
+        edges = [
+            ("go:0000002", "rdfs:subClassOf", "go:0000001"),
+            ("go:0000003", "rdfs:subClassOf", "go:0000002"),
+            ("go:0000001", "bfo:0000051", "go:0000004"),
+            ("go:0000003", "oboinowl:hasDbXref", "kegg.pathway:map00001"),
+        ]
+        arrays = HierarchyArrays.from_edges(references, edges)
+        self.assertEqual(4, arrays.n_references)
+        self.assertEqual([*references, "kegg.pathway:map00001"], arrays.nodes)
+        self.assertEqual(
+            ["rdfs:subClassOf", "bfo:0000051", "oboinowl:hasDbXref"], arrays.predicates
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("hierarchy.npz")
+            arrays.save(path)
+            loaded = HierarchyArrays.load(path)
+
+        self.assertEqual(arrays.nodes, loaded.nodes)
+        self.assertEqual(arrays.n_references, loaded.n_references)
+        self.assertEqual(arrays.predicates, loaded.predicates)
+        for key in ["sources", "targets", "predicate_ids"]:
+            np.testing.assert_array_equal(getattr(arrays, key), getattr(loaded, key))
+        self.assertEqual(
+            [Reference.from_curie(curie) for curie in arrays.nodes], loaded.get_references()
+        )
+
+        sources, targets, _ = loaded.select({"rdfs:subClassOf"}, {"bfo:0000051"})
+        self.assertEqual([1, 2, 3], sources.tolist())
+        self.assertEqual([0, 1, 0], targets.tolist())
+
+        index = loaded.get_index({"rdfs:subClassOf"})
+        # the xref target isn't included since it isn't part of a selected edge
+        self.assertEqual(4, len(index))
+        self.assertEqual({_ref(1), _ref(2)}, index.get_ancestors(_ref(3)))
+        self.assertEqual(set(), index.get_descendants(_ref(4)))
+
+        index = loaded.get_index({"rdfs:subClassOf"}, {"bfo:0000051"})
+        self.assertEqual({_ref(1), _ref(2)}, index.get_ancestors(_ref(3)))
+        self.assertEqual({_ref(1)}, index.get_ancestors(_ref(4)))
+
+    def test_empty(self) -> None:
+        """Test arrays for an ontology without edges."""
+        arrays = HierarchyArrays.from_edges([], [])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("hierarchy.npz")
+            arrays.save(path)
+            loaded = HierarchyArrays.load(path)
+        self.assertEqual([], loaded.nodes)
+        self.assertEqual(0, len(loaded.get_index({"rdfs:subClassOf"})))
@@ -0,0 +1,49 @@
+"""Tests for build telemetry."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pyobo.utils.telemetry import (
+    TELEMETRY_ENVIRONMENT_VARIABLE,
+    read_telemetry,
+    span,
+    summarize_telemetry,
+)
+
+
+class TestTelemetry(unittest.TestCase):
+    """Test build telemetry."""
+
+    def test_disabled(self) -> None:
+        """Test that nothing is measured when telemetry is turned off."""
+        with (
+            mock.patch.dict(os.environ, {TELEMETRY_ENVIRONMENT_VARIABLE: ""}),
+            span("go", "parse") as record,
+        ):
+            record.rows = 5
+        self.assertIsNone(record.rss_start)
+        self.assertEqual(0.0, record.duration)
+
+    def test_report(self) -> None:
+        """Test writing and summarizing a telemetry report."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("report.jsonl")
+            with mock.patch.dict(os.environ, {TELEMETRY_ENVIRONMENT_VARIABLE: str(path)}):
+                for rows in [2, 3]:
+                    with span("go", "parse", version="1") as record:
+                        record.rows = rows
+                with self.assertRaises(ValueError), span("chebi", "download"):
+                    raise ValueError
+
+            df = read_telemetry(path)
+            self.assertEqual(3, len(df.index))
+            self.assertEqual(["go", "go", "chebi"], list(df["prefix"]))
+            self.assertEqual("ValueError", df["error"].iloc[2])
+            self.assertTrue((df["rss_peak"] >= df["rss_start"]).all())
+
+            summary = summarize_telemetry(df).set_index(["prefix", "phase"])
+            self.assertEqual(2, summary.loc[("go", "parse"), "count"])
+            self.assertEqual(5, summary.loc[("go", "parse"), "rows"])
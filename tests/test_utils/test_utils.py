@@ -12,7 +12,10 @@ from pyobo.identifier_utils import (
     NotCURIEError,
     UnregisteredPrefixError,
     _parse_str_or_curie_or_uri_helper,
+    clear_parse_cache,
+    get_parse_cache_info,
 )
+from pyobo.identifier_utils.api import Reference
 from pyobo.sources.expasy import _parse_transfer
 from pyobo.utils.iter import iterate_together
 from pyobo.utils.ver import VersionMetadata
@@ -59,6 +62,39 @@ class TestStringUtils(unittest.TestCase):
             "http://purl.obolibrary.org/obo/CHEBI_1234",
         )
 
+    def test_parse_cache(self) -> None:
+        """Test that parsing is memoized, but errors keep their own context."""
+        clear_parse_cache()
+        first = _parse_str_or_curie_or_uri_helper("GO:1234567", ontology_prefix="chebi")
+        second = _parse_str_or_curie_or_uri_helper("GO:1234567", ontology_prefix="chebi")
+        self.assertIs(first, second)
+        info = get_parse_cache_info()
+        self.assertEqual(1, info.hits)
+        self.assertEqual(1, info.misses)
+        self.assertEqual(0.5, info.hit_rate)
+
+        # the name is part of the key
+        named = _parse_str_or_curie_or_uri_helper(
+            "GO:1234567", ontology_prefix="chebi", name="test"
+        )
+        self.assertIsInstance(named, Reference)
+        self.assertEqual("test", named.name)  # type:ignore[union-attr]
+
+        node = Reference(prefix="chebi", identifier="1234")
+        e1 = _parse_str_or_curie_or_uri_helper("nope", context="c1")
+        e2 = _parse_str_or_curie_or_uri_helper("nope", context="c2", node=node, line="x: nope")
+        self.assertIsInstance(e1, NotCURIEError)
+        self.assertIsInstance(e2, NotCURIEError)
+        self.assertIsNot(e1, e2)
+        self.assertEqual("c1", e1.context)  # type:ignore[union-attr]
+        self.assertIsNone(e1.node)  # type:ignore[union-attr]
+        self.assertEqual("c2", e2.context)  # type:ignore[union-attr]
+        self.assertEqual(node, e2.node)  # type:ignore[union-attr]
+        self.assertEqual("x: nope", e2.line)  # type:ignore[union-attr]
+
+        clear_parse_cache()
+        self.assertEqual(0, get_parse_cache_info().currsize)
+
     def test_parse_eccode_transfer(self) -> None:
         """Test parse_eccode_transfer."""
         self.assertEqual(